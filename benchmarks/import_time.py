@@ -0,0 +1,131 @@
+"""
+Import-time report of the entry points, in the style of `python -X importtime`.
+
+Each measure imports the module in a new interpreter started with `-X importtime`, so it is a
+cold import as seen by a fresh work item (the bytecode caches are kept, as on a robot). The
+per-module lines printed by the interpreter are parsed and the median over `--repeat` runs is
+reported, together with the modules taking the longest, by cumulative and by self time.
+
+The heavy libraries (Selenium, webdriver_manager, openpyxl, requests, lxml, dateutil) are
+imported only by the paths that use them; the report also lists the ones loaded by the import,
+which should be empty for `main`.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --module main --repeat 7 --top 30 --report import_time.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(REPO_DIR, "src")
+
+# Libraries only the paths scraping or writing Excel files should import.
+HEAVY_MODULES = ("selenium", "webdriver_manager", "openpyxl", "requests", "lxml", "dateutil")
+
+# Prints the heavy modules loaded once the module is imported.
+LOADED_HEAVY_MODULES = (
+    "import json, sys, {module}; "
+    "print(json.dumps([name for name in {heavy!r} if name in sys.modules]))")
+
+
+def run_importtime(module: str) -> tuple[list[dict], list[str]]:
+    """
+    Imports a module in a new interpreter with `-X importtime`.
+
+    Args:
+        module (str): The module to import, found in `src` or the repository root.
+
+    Returns:
+        tuple[list[dict], list[str]]: One row per module imported, with its `module` name,
+        `depth` in the import tree and `self_us` and `cumulative_us` times in microseconds,
+        and the heavy modules loaded by the import.
+    """
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join([SRC_DIR, REPO_DIR]))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         LOADED_HEAVY_MODULES.format(module=module, heavy=HEAVY_MODULES)],
+        cwd=REPO_DIR, env=environment, capture_output=True, text=True, check=True)
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append({
+            "module": name.strip(),
+            "depth": (len(name) - len(name.lstrip())) // 2,
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us)})
+    return rows, json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def measure(module: str, repeat: int = 5, top: int = 20) -> dict:
+    """
+    Measures the cold import of a module.
+
+    Args:
+        module (str): The module to import.
+        repeat (int): Number of new interpreters to import it in.
+        top (int): Number of modules listed by cumulative and by self time.
+
+    Returns:
+        dict: The median import time of the module in milliseconds (`milliseconds`), the time
+        of every run, the heavy modules loaded and the modules taking the longest.
+    """
+    totals = []
+    by_module = {}
+    heavy_loaded = []
+    for _ in range(repeat):
+        rows, heavy_loaded = run_importtime(module)
+        totals.append(next(row["cumulative_us"] for row in rows
+                           if row["module"] == module and row["depth"] == 0))
+        for row in rows:
+            times = by_module.setdefault(row["module"], {"self_us": [], "cumulative_us": []})
+            times["self_us"].append(row["self_us"])
+            times["cumulative_us"].append(row["cumulative_us"])
+
+    medians = [{
+        "module": name,
+        "self_ms": round(statistics.median(times["self_us"]) / 1000, 2),
+        "cumulative_ms": round(statistics.median(times["cumulative_us"]) / 1000, 2)}
+        for name, times in by_module.items()]
+    return {
+        "module": module,
+        "milliseconds": round(statistics.median(totals) / 1000, 2),
+        "runs_ms": [round(total / 1000, 2) for total in totals],
+        "heavy_modules_loaded": heavy_loaded,
+        "top_cumulative": sorted(
+            medians, key=lambda row: row["cumulative_ms"], reverse=True)[:top],
+        "top_self": sorted(medians, key=lambda row: row["self_ms"], reverse=True)[:top]}
+
+
+def main() -> int:
+    """Measures the import and prints or writes the report; returns the exit code"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="main", help="module to import")
+    parser.add_argument("--repeat", type=int, default=5, help="interpreters to import it in")
+    parser.add_argument("--top", type=int, default=20, help="modules listed in the report")
+    parser.add_argument("--report", default=None, help="JSON file the report is written to")
+    args = parser.parse_args()
+
+    report = measure(args.module, args.repeat, args.top)
+    if args.report:
+        os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+        with open(args.report, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(f"Report written to {args.report}")
+    print(f"import {report['module']}: {report['milliseconds']} ms "
+          f"(runs: {report['runs_ms']})")
+    print(f"Heavy modules loaded: {report['heavy_modules_loaded'] or 'none'}")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for row in report["top_cumulative"]:
+        print(f"{row['cumulative_ms']:>14} {row['self_ms']:>9}  {row['module']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
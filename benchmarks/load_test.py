@@ -0,0 +1,338 @@
+"""
+Load and soak test of the extraction against a local stand-in site.
+
+The test starts `StandInSite` and launches runs of `main.main` (through `run_once.py`) as
+separate processes, `--concurrency` at a time, each in its own temporary directory with a
+`values.json` pointing at the stand-in site. It stops after `--runs` runs, or keeps launching
+runs for `--duration` seconds for a soak test.
+
+While the runs go on, the resident memory of every run is sampled from /proc: the Python
+process on one side and its descendants (chromedriver and the browser processes) on the other,
+together with the total over all concurrent runs. On systems without /proc, the peaks reported
+by getrusage in each run are used instead.
+
+The report written to `--report` holds the settings, one entry per run and a summary with:
+    - throughput: articles extracted per second of wall time,
+    - page_latency: p50, p95 and p99 of the seconds per results page (see `RunReportRepository`),
+    - peak RSS of Python, of the browser and of all runs together (in MB),
+    - failure rate: share of runs that exited with an error or reported a failed run.
+
+Usage:
+    python benchmarks/load_test.py --concurrency 4 --runs 8 --pages 5 --latency 0.2
+    python benchmarks/load_test.py --engine http --concurrency 8 --duration 600
+"""
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from stand_in_site import StandInSite
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUN_ONCE = os.path.join(REPO_DIR, "benchmarks", "run_once.py")
+sys.path.insert(0, os.path.join(REPO_DIR, "src"))
+
+from utils.process_utils import list_descendants, read_rss  # pylint: disable=wrong-import-position
+
+
+def percentile(values: list[float], share: float) -> float:
+    """
+    Returns the nearest-rank percentile of the values.
+
+    Args:
+        values (list[float]): The values.
+        share (float): The percentile, between 0 and 1.
+
+    Returns:
+        float: The percentile, None when there are no values.
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(share * len(ordered)) - 1)]
+
+
+class MemorySampler:
+    """
+    Samples the resident memory of the running runs in a background thread.
+
+    Attributes:
+        interval (float): Seconds between two samples.
+        peaks (dict): Peak Python and browser memory (in bytes) of each run, by run number.
+        peak_total (int): Peak memory (in bytes) of all the runs together.
+    """
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.available = os.path.isdir("/proc/self/task")
+        self.processes = {}
+        self.peaks = {}
+        self.peak_total = 0
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._sample, name="memory-sampler", daemon=True)
+
+    def start(self) -> "MemorySampler":
+        """Starts sampling, when /proc is available"""
+        if self.available:
+            self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops sampling"""
+        self.stopped.set()
+        if self.thread.is_alive():
+            self.thread.join()
+
+    def watch(self, run: int, pid: int) -> None:
+        """Adds the process of a run to the samples"""
+        with self.lock:
+            self.processes[run] = pid
+            self.peaks[run] = {"python": 0, "browser": 0}
+
+    def forget(self, run: int) -> None:
+        """Removes the process of a finished run from the samples"""
+        with self.lock:
+            self.processes.pop(run, None)
+
+    def _sample(self) -> None:
+        while not self.stopped.wait(self.interval):
+            with self.lock:
+                processes = dict(self.processes)
+            total = 0
+            for run, pid in processes.items():
+                python = read_rss(pid)
+                browser = sum(read_rss(child) for child in list_descendants(pid))
+                total += python + browser
+                with self.lock:
+                    peaks = self.peaks[run]
+                    peaks["python"] = max(peaks["python"], python)
+                    peaks["browser"] = max(peaks["browser"], browser)
+            self.peak_total = max(self.peak_total, total)
+
+
+def to_mb(size: int) -> float:
+    """Converts bytes to megabytes, keeping None and 0 as None"""
+    return round(size / (1024 * 1024), 1) if size else None
+
+
+def prepare_run_dir(run: int, site_url: str, args: argparse.Namespace) -> str:
+    """
+    Creates the directory of a run with a `values.json` pointing at the stand-in site.
+
+    Args:
+        run (int): Number of the run.
+        site_url (str): Base URL of the stand-in site.
+        args (argparse.Namespace): Settings of the test.
+
+    Returns:
+        str: The directory of the run.
+    """
+    run_dir = tempfile.mkdtemp(prefix=f"load-test-{run:04d}-")
+    with open(os.path.join(REPO_DIR, "values.json"), "r", encoding="utf-8") as file:
+        values = json.load(file)
+    values["url_site"] = site_url
+    values["chrome_drive"] = os.path.join(REPO_DIR, values["chrome_drive"])
+    values["output_dir"] = "output"
+    values["news_images_dir"] = "output/news_images/"
+    values.setdefault("thumbnails", {})["dir"] = "output/news_thumbnails/"
+    values.setdefault("rate_limiter", {})["enabled"] = args.rate_limiter
+    values["category_cache_ttl"] = 0
+    with open(os.path.join(run_dir, "values.json"), "w", encoding="utf-8") as file:
+        json.dump(values, file, indent=4)
+    return run_dir
+
+
+def read_json(path: str) -> dict:
+    """Reads a JSON file, an empty dictionary when it is missing or broken"""
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def execute_run(
+        run: int,
+        site_url: str,
+        args: argparse.Namespace,
+        sampler: MemorySampler) -> dict:
+    """
+    Executes one run in its own directory and collects its results.
+
+    Args:
+        run (int): Number of the run.
+        site_url (str): Base URL of the stand-in site.
+        args (argparse.Namespace): Settings of the test.
+        sampler (MemorySampler): Sampler of the memory of the runs.
+
+    Returns:
+        dict: The results of the run.
+    """
+    run_dir = prepare_run_dir(run, site_url, args)
+    command = [sys.executable, RUN_ONCE, "--phrase", args.phrase, "--months", "1"]
+    if args.engine != "browser":
+        command += ["--engine", args.engine]
+    if args.orchestrator:
+        command += ["--orchestrator", args.orchestrator]
+    environment = dict(os.environ, PYTHONPATH=os.path.join(REPO_DIR, "src"))
+
+    started_at = time.monotonic()
+    with open(os.path.join(run_dir, "run.log"), "wb") as log_file:
+        process = subprocess.Popen(
+            command, cwd=run_dir, env=environment, stdout=log_file, stderr=subprocess.STDOUT)
+        sampler.watch(run, process.pid)
+        try:
+            exit_code = process.wait(timeout=args.run_timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            exit_code = process.wait()
+        sampler.forget(run)
+    seconds = time.monotonic() - started_at
+
+    run_report = read_json(os.path.join(run_dir, "output", "run_report.json"))
+    usage = read_json(os.path.join(run_dir, "output", "run_usage.json"))
+    peaks = sampler.peaks.get(run, {})
+    result = {
+        "run": run,
+        "exit_code": exit_code,
+        "failed": exit_code != 0 or not run_report or run_report.get("failed", True),
+        "seconds": round(seconds, 3),
+        "articles": run_report.get("articles", 0),
+        "page_seconds": [page["seconds"] for page in run_report.get("pages", [])],
+        "peak_rss_python_mb": to_mb(peaks.get("python")) or usage.get("peak_rss_python_mb"),
+        "peak_rss_browser_mb": to_mb(peaks.get("browser")) or usage.get("peak_rss_children_mb"),
+        "dir": run_dir}
+    if args.keep_runs or result["failed"]:
+        return result
+    shutil.rmtree(run_dir, ignore_errors=True)
+    result["dir"] = None
+    return result
+
+
+def summarize(runs: list[dict], seconds: float, sampler: MemorySampler) -> dict:
+    """
+    Summarizes the results of the runs.
+
+    Args:
+        runs (list[dict]): The results of each run.
+        seconds (float): Wall time of the whole test.
+        sampler (MemorySampler): Sampler of the memory of the runs.
+
+    Returns:
+        dict: The summary of the test.
+    """
+    page_seconds = [value for run in runs for value in run["page_seconds"]]
+    articles = sum(run["articles"] for run in runs)
+    failures = sum(1 for run in runs if run["failed"])
+    python_peaks = [run["peak_rss_python_mb"] for run in runs if run["peak_rss_python_mb"]]
+    browser_peaks = [run["peak_rss_browser_mb"] for run in runs if run["peak_rss_browser_mb"]]
+    return {
+        "runs": len(runs),
+        "failures": failures,
+        "failure_rate": round(failures / len(runs), 4) if runs else None,
+        "articles": articles,
+        "pages": len(page_seconds),
+        "wall_seconds": round(seconds, 3),
+        "throughput_articles_per_second": round(articles / seconds, 3) if seconds else None,
+        "page_latency": {
+            "p50": percentile(page_seconds, 0.50),
+            "p95": percentile(page_seconds, 0.95),
+            "p99": percentile(page_seconds, 0.99)},
+        "peak_rss_python_mb": max(python_peaks, default=None),
+        "peak_rss_browser_mb": max(browser_peaks, default=None),
+        "peak_rss_total_mb": to_mb(sampler.peak_total)}
+
+
+def parse_args() -> argparse.Namespace:
+    """Parses the settings of the test"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=2,
+                        help="runs executed at the same time")
+    parser.add_argument("--runs", type=int, default=None,
+                        help="runs to execute, the concurrency by default")
+    parser.add_argument("--duration", type=float, default=None,
+                        help="keep launching runs for this many seconds (soak test)")
+    parser.add_argument("--pages", type=int, default=3,
+                        help="results pages within the month searched")
+    parser.add_argument("--articles-per-page", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="seconds the site waits before each response")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="maximum random seconds added to the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="share of results pages answered with a 503 error")
+    parser.add_argument("--engine", choices=("browser", "http"), default="browser")
+    parser.add_argument("--orchestrator", choices=("async",), default=None)
+    parser.add_argument("--phrase", default="economy")
+    parser.add_argument("--rate-limiter", action="store_true",
+                        help="keep the shared rate limiter enabled in the runs")
+    parser.add_argument("--run-timeout", type=float, default=900,
+                        help="seconds after which a run is killed and counted as failed")
+    parser.add_argument("--keep-runs", action="store_true",
+                        help="keep the directories of successful runs")
+    parser.add_argument("--report", default=os.path.join("output", "load_test_report.json"))
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Runs the load test and writes its report; returns a non-zero code when a run failed"""
+    args = parse_args()
+    total_runs = args.runs or (None if args.duration else args.concurrency)
+    site = StandInSite(
+        pages=args.pages,
+        articles_per_page=args.articles_per_page,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate).start()
+    sampler = MemorySampler().start()
+
+    started_at = time.monotonic()
+    deadline = started_at + args.duration if args.duration else None
+    runs = []
+    with ThreadPoolExecutor(args.concurrency) as executor:
+        pending = set()
+        run = 0
+        while True:
+            can_launch = (run < total_runs if total_runs else time.monotonic() < deadline)
+            if can_launch and len(pending) < args.concurrency:
+                run += 1
+                pending.add(executor.submit(execute_run, run, site.url, args, sampler))
+                continue
+            if not pending:
+                break
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                result = future.result()
+                runs.append(result)
+                print(f"Run {result['run']}: {result['articles']} articles in "
+                      f"{result['seconds']}s{' (failed)' if result['failed'] else ''}")
+    seconds = time.monotonic() - started_at
+    sampler.stop()
+    site.stop()
+
+    runs.sort(key=lambda result: result["run"])
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "settings": {key: value for key, value in vars(args).items() if key != "report"},
+        "site_requests": site.requests,
+        "summary": summarize(runs, seconds, sampler),
+        "runs": runs}
+    os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+    with open(args.report, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(json.dumps(report["summary"], indent=2))
+    print(f"Report written to {args.report}")
+    return 1 if report["summary"]["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Benchmark of the handoff of results pages to parser processes.
+
+Builds large results pages with the stand-in site markup and parses them three ways: in this
+process, in a process pool receiving each page as a pickled argument, and in a
+`SpooledPageParser` receiving only the offset of each page in the spool. The time of each way
+and the bytes sent to the workers are reported, so the cost of the pickling can be compared with
+the gain of the pool on the host.
+
+Usage:
+    python benchmarks/page_handoff.py
+    python benchmarks/page_handoff.py --pages 24 --articles-per-page 2000 --workers 4
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+import multiprocessing
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+from stand_in_site import build_results_page
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "src"))
+
+# pylint: disable=wrong-import-position
+from frameworks_drivers.drivers import html_page_parser
+from frameworks_drivers.drivers.page_spool import SpooledPageParser
+
+
+def parse_pickled_page(content: bytes, phrase: str) -> int:
+    """Parses a page received as an argument and returns its number of articles"""
+    return len(html_page_parser.parse_search_results_page(content, phrase)["articles"])
+
+
+def run_in_process(pages: list[bytes], phrase: str) -> float:
+    """Parses the pages one after the other and returns the seconds taken"""
+    started_at = time.perf_counter()
+    for content in pages:
+        html_page_parser.parse_search_results_page(content, phrase)
+    return time.perf_counter() - started_at
+
+
+def run_pickled(pages: list[bytes], phrase: str, workers: int) -> float:
+    """Parses the pages in a process pool receiving them as arguments"""
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        pool.submit(int).result()
+        started_at = time.perf_counter()
+        list(pool.map(parse_pickled_page, pages, [phrase] * len(pages)))
+        return time.perf_counter() - started_at
+
+
+def run_spooled(pages: list[bytes], phrase: str, workers: int) -> float:
+    """Parses the pages in a `SpooledPageParser` and returns the seconds taken"""
+    with tempfile.TemporaryDirectory() as spool_dir, \
+            SpooledPageParser(spool_dir, workers) as parser:
+        parser.executor.submit(int).result()
+        started_at = time.perf_counter()
+        futures = [parser.submit(content, phrase) for content in pages]
+        for future in futures:
+            future.result()
+        return time.perf_counter() - started_at
+
+
+def main() -> int:
+    """Runs the three ways and prints the report; returns the exit code"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=16)
+    parser.add_argument("--articles-per-page", type=int, default=1500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--phrase", default="economy")
+    args = parser.parse_args()
+    if not html_page_parser.is_available():
+        print("lxml is required")
+        return 1
+
+    now = time.time()
+    pages = [build_results_page(args.phrase, page, args.pages, args.articles_per_page, now)
+             .encode("utf-8") for page in range(1, args.pages + 1)]
+    report = {
+        "pages": args.pages,
+        "page_mb": round(sum(map(len, pages)) / len(pages) / 1024 / 1024, 2),
+        "workers": args.workers,
+        "pickled_mb": round(sum(len(pickle.dumps((content, args.phrase)))
+                                for content in pages) / 1024 / 1024, 2),
+        "in_process_seconds": round(run_in_process(pages, args.phrase), 3),
+        "pickled_pool_seconds": round(run_pickled(pages, args.phrase, args.workers), 3),
+        "spooled_pool_seconds": round(run_spooled(pages, args.phrase, args.workers), 3)}
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+Runs `main.main` once and writes the resource usage of the run, used by `load_test.py`.
+
+The run happens in the current directory, so the `values.json` and the `output` directory of
+the run are the ones in it. Once `main.main` returns, the peak resident memory of this process
+and of its waited-for children (chromedriver and the browser) is written to
+`output/run_usage.json`.
+
+Usage:
+    python benchmarks/run_once.py --phrase economy --months 1 [--engine http]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "src"))
+
+from main import main  # pylint: disable=wrong-import-position
+
+
+def peak_rss_mb(who) -> float:
+    """Returns the peak resident memory (in MB) reported by getrusage, None when unknown"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run() -> int:
+    """Runs the extraction and writes its resource usage; returns the exit code"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--phrase", default="")
+    parser.add_argument("--categories", default="")
+    parser.add_argument("--months", type=int, default=1)
+    parser.add_argument("--engine", default=None)
+    parser.add_argument("--orchestrator", default=None)
+    args = parser.parse_args()
+
+    started_at = time.monotonic()
+    exit_code = 0
+    try:
+        main(args.phrase, args.categories, args.months, args.orchestrator, args.engine)
+    except Exception as exception:  # pylint: disable=broad-except
+        print(f"Run failed: {exception!r}", file=sys.stderr)
+        exit_code = 1
+
+    usage = {
+        "exit_code": exit_code,
+        "seconds": round(time.monotonic() - started_at, 3),
+        "peak_rss_python_mb": peak_rss_mb(resource.RUSAGE_SELF) if resource else None,
+        "peak_rss_children_mb": peak_rss_mb(resource.RUSAGE_CHILDREN) if resource else None}
+    os.makedirs("output", exist_ok=True)
+    with open(os.path.join("output", "run_usage.json"), "w", encoding="utf-8") as file:
+        json.dump(usage, file, indent=2)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -0,0 +1,290 @@
+"""
+Local stand-in for the news site, used by the load and soak tests.
+
+The site serves search results pages with the same markup the scrapers read (see `Locator`), a
+configurable number of pages within the current month followed by a page of older articles that
+ends the search, a small picture and an article page per article. Every response waits for the
+configured latency first, so the tests can reproduce a slow site.
+
+Classes:
+    StandInSite: Threaded HTTP server running the stand-in site in the background.
+
+Usage:
+    python benchmarks/stand_in_site.py --port 8765 --pages 5 --latency 0.2
+"""
+import argparse
+from datetime import datetime
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import random
+import struct
+import threading
+import time
+from urllib.parse import parse_qs, urlencode, urlparse
+import zlib
+
+# Seconds between the timestamps of two consecutive articles.
+ARTICLE_INTERVAL = 60
+# Age (in days) of the articles of the page that ends the search.
+OLD_ARTICLE_AGE = 400
+
+
+def build_picture(seed: int) -> bytes:
+    """
+    Builds a small PNG picture of a single color.
+
+    Args:
+        seed (int): Number defining the color of the picture.
+
+    Returns:
+        bytes: The PNG file.
+    """
+    width, height = 64, 36
+    color = bytes(((seed * 53) % 256, (seed * 97) % 256, (seed * 193) % 256))
+    raw = b"".join(b"\x00" + color * width for _ in range(height))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return (struct.pack(">I", len(data)) + kind + data +
+                struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+    return (b"\x89PNG\r\n\x1a\n" +
+            chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)) +
+            chunk(b"IDAT", zlib.compress(raw)) +
+            chunk(b"IEND", b""))
+
+
+def build_results_page(
+        phrase: str,
+        page: int,
+        pages: int,
+        articles_per_page: int,
+        now: float) -> str:
+    """
+    Builds the HTML of a search results page.
+
+    Pages up to `pages` hold articles of the last minutes and link to the next page; the page
+    after them holds articles older than any search and no next page link.
+
+    Args:
+        phrase (str): The search phrase, repeated in the titles and descriptions.
+        page (int): Number of the page.
+        pages (int): Number of pages within the current month.
+        articles_per_page (int): Number of articles of each page.
+        now (float): Timestamp of the newest article.
+
+    Returns:
+        str: The HTML of the page.
+    """
+    items = []
+    for index in range(articles_per_page):
+        number = (page - 1) * articles_per_page + index
+        if page <= pages:
+            timestamp = now - number * ARTICLE_INTERVAL
+        else:
+            timestamp = now - OLD_ARTICLE_AGE * 86400 - number * ARTICLE_INTERVAL
+        title = escape(f"{phrase} story {number}")
+        items.append(f"""
+        <div class="PageList-items-item">
+          <div class="PagePromo">
+            <div class="PagePromo-media">
+              <a href="/article/{number}" aria-label="{title}">
+                <picture><img class="Image" src="/images/{number}.png" alt=""></picture>
+              </a>
+            </div>
+            <div class="PagePromo-title"><a href="/article/{number}">{title}</a></div>
+            <div class="PagePromo-description">
+              Report on {escape(phrase)} worth $1,{number:03d}.00 as of today.
+            </div>
+            <bsp-timestamp data-timestamp="{int(timestamp * 1000)}"></bsp-timestamp>
+          </div>
+        </div>""")
+
+    next_page = ""
+    if page <= pages:
+        query = urlencode({"q": phrase, "s": "3", "p": page + 1})
+        next_page = (f'<div class="Pagination-nextPage">'
+                     f'<a href="/search?{query}">Next</a></div>')
+
+    return f"""<!DOCTYPE html>
+<html>
+<head><title>Search results for {escape(phrase)}</title></head>
+<body>
+  <div class="SearchFilter-heading">Filter</div>
+  <select class="Select-input">
+    <option value="0">Relevance</option>
+    <option value="3" selected>Newest</option>
+  </select>
+  <div class="SearchResultsModule-results">
+    <div class="PageList-items">{"".join(items)}
+    </div>
+  </div>
+  {next_page}
+</body>
+</html>"""
+
+
+def build_article_page(number: int, timestamp: float) -> str:
+    """
+    Builds the HTML of an article page, with the markup read by the enrichment.
+
+    Args:
+        number (int): Number of the article, as linked from the results pages.
+        timestamp (float): Publication time of the article.
+
+    Returns:
+        str: The HTML of the page.
+    """
+    published = datetime.fromtimestamp(timestamp).astimezone().isoformat(timespec="seconds")
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+  <title>Story {number}</title>
+  <meta property="article:published_time" content="{published}">
+</head>
+<body>
+  <div class="Page-authors">By <a class="Link">Reporter {number % 7}</a></div>
+  <div class="Page-dateModified">
+    <bsp-timestamp data-timestamp="{int((timestamp + 600) * 1000)}"></bsp-timestamp>
+  </div>
+  <div class="RichTextStoryBody RichTextBody">
+    <p>Full report of story {number}.</p>
+    <p>The deal was valued at {number * 3} dollars by the analysts.</p>
+    <p>More details will follow.</p>
+  </div>
+</body>
+</html>"""
+
+
+class StandInSite:
+    """
+    Threaded HTTP server running the stand-in site in the background.
+
+    Attributes:
+        pages (int): Number of results pages within the current month.
+        articles_per_page (int): Number of articles of each page.
+        latency (float): Seconds each response waits before being sent.
+        jitter (float): Maximum random seconds added to the latency.
+        error_rate (float): Share of results pages answered with a 503 error.
+    """
+
+    def __init__(
+            self,
+            port: int = 0,
+            pages: int = 3,
+            articles_per_page: int = 10,
+            latency: float = 0.0,
+            jitter: float = 0.0,
+            error_rate: float = 0.0):
+        self.pages = pages
+        self.articles_per_page = articles_per_page
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.now = time.time()
+        self.requests = 0
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self._build_handler())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, name="stand-in-site", daemon=True)
+
+    @property
+    def url(self) -> str:
+        """Returns the base URL of the site, ending with a slash"""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "StandInSite":
+        """Starts serving in a background thread"""
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops serving and closes the socket"""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _build_handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Answers the search, article, picture and favicon requests of the stand-in site."""
+
+            def do_GET(self):
+                with site.lock:
+                    site.requests += 1
+                time.sleep(site.latency + random.uniform(0, site.jitter))
+                url = urlparse(self.path)
+                if url.path == "/search":
+                    self._send_results_page(parse_qs(url.query))
+                elif url.path.startswith("/article/"):
+                    number = url.path.rsplit("/", 1)[-1]
+                    if number.isdigit():
+                        html = build_article_page(
+                            int(number), site.now - int(number) * ARTICLE_INTERVAL)
+                        self._send(200, "text/html; charset=utf-8", html.encode("utf-8"))
+                    else:
+                        self._send(404, "text/plain", b"Not found")
+                elif url.path.startswith("/images/"):
+                    seed = url.path.rsplit("/", 1)[-1].split(".", 1)[0]
+                    self._send(200, "image/png",
+                               build_picture(int(seed) if seed.isdigit() else 0))
+                elif url.path == "/":
+                    self._send(200, "text/html; charset=utf-8",
+                               b"<html><body>Stand-in site</body></html>")
+                else:
+                    self._send(404, "text/plain", b"Not found")
+
+            def _send_results_page(self, query: dict):
+                if random.random() < site.error_rate:
+                    self._send(503, "text/plain", b"Service unavailable")
+                    return
+                try:
+                    page = max(1, int(query.get("p", ["1"])[0]))
+                except ValueError:
+                    page = 1
+                if page > site.pages + 1:
+                    self._send(404, "text/plain", b"Not found")
+                    return
+                html = build_results_page(
+                    query.get("q", [""])[0], page, site.pages,
+                    site.articles_per_page, site.now)
+                self._send(200, "text/html; charset=utf-8", html.encode("utf-8"))
+
+            def _send(self, status: int, content_type: str, body: bytes):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", "max-age=3600")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                pass
+
+        return Handler
+
+
+def main() -> None:
+    """Runs the stand-in site in the foreground until interrupted"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--articles-per-page", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    site = StandInSite(
+        args.port, args.pages, args.articles_per_page,
+        args.latency, args.jitter, args.error_rate).start()
+    print(f"Serving {site.url} since {datetime.now():%H:%M:%S}, Ctrl+C to stop")
+    try:
+        site.thread.join()
+    except KeyboardInterrupt:
+        site.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Startup budget check of the `extract_news_from_website` task.
+
+The task imports `main` when the robot starts, before the work item is read. The check
+measures the cold import of `main` with `import_time.measure` and fails (exit code 1) when its
+median goes over `--budget-ms`, or when the import loads any of the heavy libraries, which only
+the paths scraping or writing Excel files should import. Run it after changing imports, or in
+CI, to catch startup regressions.
+
+The import of `robocorp` by `tasks.py` is left out: it does not depend on this repository and
+is not installed outside the robot environment.
+
+Usage:
+    python benchmarks/startup_budget.py
+    python benchmarks/startup_budget.py --budget-ms 100 --repeat 9
+"""
+import argparse
+import sys
+
+from import_time import measure
+
+# Median cold import of `main`, in milliseconds, above which the check fails.
+DEFAULT_BUDGET_MS = 150
+
+
+def main() -> int:
+    """Checks the import time of `main` against the budget; returns the exit code"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="main", help="module imported by the task")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="maximum median cold import time")
+    parser.add_argument("--repeat", type=int, default=5, help="interpreters to import it in")
+    args = parser.parse_args()
+
+    report = measure(args.module, args.repeat, top=5)
+    failures = []
+    if report["milliseconds"] > args.budget_ms:
+        failures.append(f"import {args.module} took {report['milliseconds']} ms, over the "
+                        f"budget of {args.budget_ms} ms")
+    if report["heavy_modules_loaded"]:
+        failures.append(f"import {args.module} loaded "
+                        f"{', '.join(report['heavy_modules_loaded'])}")
+
+    print(f"import {args.module}: {report['milliseconds']} ms (budget {args.budget_ms} ms)")
+    for row in report["top_cumulative"]:
+        print(f"  {row['cumulative_ms']:>9} ms  {row['module']}")
+    for failure in failures:
+        print(f"FAILED: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""Represents a batch of articles stored column by column"""
+from array import array
+from datetime import datetime
+
+from entities.article_entity import Article
+
+
+class ArticleBatch:
+    """
+    Columnar container of articles.
+
+    Text columns are kept as lists, dates as an int64 array of epoch milliseconds, search counts
+    as an unsigned int array and money flags as a byte array, so a large search holds one object
+    per text value instead of one object per field. `Article` objects are only built when the
+    batch is iterated; sinks can read plain rows with `rows` instead.
+
+    The fields read from the article pages are kept in their own columns and read with
+    `details`; their times are epoch milliseconds, 0 when missing.
+    """
+    __slots__ = (
+        "titles",
+        "dates",
+        "descriptions",
+        "image_filenames",
+        "search_counts",
+        "contains_money",
+        "urls",
+        "bodies",
+        "authors",
+        "published_at",
+        "updated_at")
+
+    def __init__(self):
+        self.titles: list[str] = []
+        self.dates = array("q")
+        self.descriptions: list[str] = []
+        self.image_filenames: list[str] = []
+        self.search_counts = array("I")
+        self.contains_money = array("B")
+        self.urls: list[str] = []
+        self.bodies: list[str] = []
+        self.authors: list[str] = []
+        self.published_at = array("q")
+        self.updated_at = array("q")
+
+    @classmethod
+    def from_rows(cls, rows) -> "ArticleBatch":
+        """Builds a batch from the article dictionaries produced by the scraper"""
+        batch = cls()
+        for row in rows:
+            batch.append(
+                row["title"],
+                row["date"],
+                row["description"],
+                row["image_filename"],
+                row["search_count"],
+                row["contains_money"],
+                row.get("url"),
+                row.get("body"),
+                row.get("author"),
+                row.get("published_at"),
+                row.get("updated_at"))
+        return batch
+
+    @classmethod
+    def from_articles(cls, articles) -> "ArticleBatch":
+        """Builds a batch from `Article` objects"""
+        batch = cls()
+        for article in articles:
+            batch.append(
+                article.title,
+                article.date,
+                article.description,
+                article.image_filename,
+                article.search_count,
+                article.contains_money,
+                article.url,
+                article.body,
+                article.author,
+                article.published_at,
+                article.updated_at)
+        return batch
+
+    def append(self, title, date, description, image_filename, search_count, contains_money,
+               url=None, body=None, author=None, published_at=None, updated_at=None):
+        """Adds one article to the end of the batch"""
+        self.titles.append(title)
+        self.dates.append(int(date.timestamp() * 1000))
+        self.descriptions.append(description)
+        self.image_filenames.append(image_filename)
+        self.search_counts.append(search_count)
+        self.contains_money.append(bool(contains_money))
+        self.urls.append(url)
+        self.bodies.append(body)
+        self.authors.append(author)
+        self.published_at.append(int(published_at.timestamp() * 1000) if published_at else 0)
+        self.updated_at.append(int(updated_at.timestamp() * 1000) if updated_at else 0)
+
+    def extend(self, batch: "ArticleBatch") -> None:
+        """Adds every article of another batch to the end of this one"""
+        self.titles.extend(batch.titles)
+        self.dates.extend(batch.dates)
+        self.descriptions.extend(batch.descriptions)
+        self.image_filenames.extend(batch.image_filenames)
+        self.search_counts.extend(batch.search_counts)
+        self.contains_money.extend(batch.contains_money)
+        self.urls.extend(batch.urls)
+        self.bodies.extend(batch.bodies)
+        self.authors.extend(batch.authors)
+        self.published_at.extend(batch.published_at)
+        self.updated_at.extend(batch.updated_at)
+
+    def rows(self):
+        """Yields each article as a tuple in the `Article` field order"""
+        for index, title in enumerate(self.titles):
+            yield (title,
+                   datetime.fromtimestamp(self.dates[index] / 1000.0),
+                   self.descriptions[index],
+                   self.image_filenames[index],
+                   self.search_counts[index],
+                   bool(self.contains_money[index]))
+
+    def details(self):
+        """Yields the fields read from the article page of each article, None when missing"""
+        for index, url in enumerate(self.urls):
+            yield (url,
+                   self.bodies[index],
+                   self.authors[index],
+                   to_datetime(self.published_at[index]),
+                   to_datetime(self.updated_at[index]))
+
+    def has_details(self) -> bool:
+        """Returns True when any article was read from its article page"""
+        return any(body is not None for body in self.bodies)
+
+    def keys(self):
+        """Yields a key identifying each article, made of its date and title"""
+        for index, title in enumerate(self.titles):
+            yield f"{self.dates[index]}:{title}"
+
+    def __len__(self):
+        return len(self.titles)
+
+    def __iter__(self):
+        for row, details in zip(self.rows(), self.details()):
+            yield Article(*row, *details)
+
+    def __getitem__(self, index) -> Article:
+        return Article(
+            self.titles[index],
+            datetime.fromtimestamp(self.dates[index] / 1000.0),
+            self.descriptions[index],
+            self.image_filenames[index],
+            self.search_counts[index],
+            bool(self.contains_money[index]),
+            self.urls[index],
+            self.bodies[index],
+            self.authors[index],
+            to_datetime(self.published_at[index]),
+            to_datetime(self.updated_at[index]))
+
+
+def to_datetime(epoch_milliseconds: int) -> datetime:
+    """Converts a time column value to a datetime, None when it is missing"""
+    return datetime.fromtimestamp(epoch_milliseconds / 1000.0) if epoch_milliseconds else None
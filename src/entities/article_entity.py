@@ -1,12 +1,24 @@
 """Represents the Article concept"""
+from dataclasses import dataclass
+from datetime import datetime
 
 
+@dataclass(frozen=True, slots=True)
 class Article:
-    """Article Object"""
-    def __init__(self, title, date, description, image_filename, search_count, contains_money):
-        self.title = title
-        self.date = date
-        self.description = description
-        self.image_filename = image_filename
-        self.search_count = search_count
-        self.contains_money = contains_money
+    """
+    Article Object, immutable and without an instance `__dict__`.
+
+    The fields after `contains_money` are read from the article page and are None unless the
+    articles were enriched (see `ArticleDetailsEnricher`).
+    """
+    title: str
+    date: datetime
+    description: str
+    image_filename: str
+    search_count: int
+    contains_money: bool
+    url: str = None
+    body: str = None
+    author: str = None
+    published_at: datetime = None
+    updated_at: datetime = None
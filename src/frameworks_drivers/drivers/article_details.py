@@ -0,0 +1,148 @@
+"""
+This module completes the articles of a results page with the details of their article pages.
+
+The results page only shows the title, the description and the date of each article. When the
+enrichment is enabled, the article page linked from each card is read for its full body, its
+author and its exact publication and update times, and the search phrase count and money check
+of the article are extended to the body.
+
+The pages are fetched by the scraper running (several browser tabs at once with
+`CustomSelenium.read_article_pages`, or a pool of HTTP requests with
+`ArticleHttpScraper.fetch_article_pages`), so the enrichment of a results page takes about the
+time of its slowest article pages instead of the sum of them all. Every page read is kept in
+`ArticleDetailCacheRepository`, so a page is never fetched twice.
+
+Classes:
+    ArticleDetailsEnricher: Completes the article data dictionaries of each page.
+"""
+import logging
+import time
+from typing import Callable
+
+from frameworks_drivers.drivers import html_page_parser
+from frameworks_drivers.drivers.selector_health import SelectorStats
+from frameworks_drivers.repositories.article_detail_cache_repository import (
+    ArticleDetailCacheRepository,
+)
+from utils.text_utils import count_search_phrase, contains_money
+
+logger = logging.getLogger(__name__)
+
+
+class ArticleDetailsEnricher:
+    """
+    Completes the article data dictionaries with the details of their article pages.
+
+    Attributes:
+        fetch_pages (Callable[[list[str]], dict]): Fetches several article pages concurrently
+            and returns the HTML of each page read, by URL; None to only use the cache.
+        cache (ArticleDetailCacheRepository): The details read in earlier runs.
+        stats (dict): Number of articles enriched from the cache and from the site, of
+            articles whose page could not be read, and seconds spent fetching.
+    """
+    def __init__(
+            self,
+            fetch_pages: Callable[[list[str]], dict],
+            cache: ArticleDetailCacheRepository,
+            selector_stats: SelectorStats = None):
+        self.fetch_pages = fetch_pages
+        self.cache = cache
+        self.selector_stats = selector_stats
+        self.stats = {"cached": 0, "fetched": 0, "failed": 0, "seconds": 0.0}
+
+    @classmethod
+    def from_settings(
+            cls,
+            fetch_pages: Callable[[list[str]], dict],
+            settings: dict,
+            selector_stats: SelectorStats = None):
+        """
+        Creates the enricher from the `article_details` settings of values.json.
+
+        Args:
+            fetch_pages (Callable[[list[str]], dict]): Fetches the article pages, None to only
+                use the cache.
+            settings (dict): The `article_details` settings.
+            selector_stats (SelectorStats, optional): The statistics the selectors of the
+                article pages are counted in.
+
+        Returns:
+            ArticleDetailsEnricher: The enricher, or None when the enrichment is disabled or
+            lxml is not installed.
+        """
+        if not settings.get("enabled", False):
+            return None
+        if not html_page_parser.is_available():
+            logger.warning("lxml is not installed, the articles are not enriched")
+            return None
+        return cls(
+            fetch_pages, ArticleDetailCacheRepository(settings.get("max_age", 0)),
+            selector_stats)
+
+    def enrich(self, articles_data: list[dict], phrase: str) -> list[dict]:
+        """
+        Completes the article data dictionaries of a page, in place.
+
+        Articles already enriched, such as the ones resumed from a checkpoint, are left as
+        they are, so their counts are not extended twice.
+
+        Args:
+            articles_data (list[dict]): The article data dictionaries of the page.
+            phrase (str): The search phrase counted in the bodies.
+
+        Returns:
+            list[dict]: The same article data dictionaries.
+        """
+        pending = [article_data for article_data in articles_data
+                   if article_data.get("url") and "body" not in article_data]
+        details_by_url = {}
+        missing = []
+        for url in dict.fromkeys(article_data["url"] for article_data in pending):
+            details = self.cache.get(url)
+            if details is None:
+                missing.append(url)
+            else:
+                details_by_url[url] = details
+        cached = len(details_by_url)
+
+        if missing and self.fetch_pages:
+            started_at = time.monotonic()
+            for url, page_source in self.fetch_pages(missing).items():
+                details = html_page_parser.parse_article_page(page_source, self.selector_stats)
+                if details is None:
+                    logger.warning("Article page %s holds no story body", url)
+                    continue
+                details_by_url[url] = details
+                self.cache.save(url, details)
+            self.stats["seconds"] = round(
+                self.stats["seconds"] + time.monotonic() - started_at, 3)
+
+        for article_data in pending:
+            details = details_by_url.get(article_data["url"])
+            if details is None:
+                self.stats["failed"] += 1
+                continue
+            apply_details(article_data, details, phrase)
+        self.stats["cached"] += cached
+        self.stats["fetched"] += len(details_by_url) - cached
+        logger.info("Enriched %d of %d articles (%d from the cache)",
+                    len(details_by_url), len(pending), cached)
+        return articles_data
+
+
+def apply_details(article_data: dict, details: dict, phrase: str) -> None:
+    """
+    Adds the details of the article page to an article data dictionary.
+
+    The search phrase count is extended with the occurrences in the body and the article
+    contains money when its card or its body does.
+
+    Args:
+        article_data (dict): The article data dictionary, read from the card.
+        details (dict): The details of the article page.
+        phrase (str): The search phrase.
+    """
+    article_data.update(details)
+    body = details["body"] or ""
+    article_data["search_count"] += count_search_phrase(body, phrase)
+    article_data["contains_money"] = bool(article_data["contains_money"]) or contains_money(body)
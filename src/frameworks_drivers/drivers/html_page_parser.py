@@ -0,0 +1,337 @@
+"""
+This module parses the HTML of a search results page, and of the article pages it links to,
+without a browser.
+
+It applies the same `Locator` selectors and `SelectorChain` fallbacks used by `CustomSelenium`
+to the page source with lxml, so pages fetched over HTTP or archived from earlier runs produce
+the same article data as a live browser. Class name locators are matched as whole class tokens,
+like `By.CLASS_NAME`.
+
+lxml comes with the rpaframework environment; when it is missing, `is_available` returns False
+and callers fall back to the browser.
+
+Functions:
+    is_available: Tells whether the parser can be used.
+    parse_search_results_page: Extracts the article data, the next page link and the category
+        map of a results page.
+    parse_articles_in_range: Keeps the articles of a parsed page within the months searched.
+    parse_article_page: Extracts the body, author and times of an article page.
+    probe_page: Counts the matches of every selector of the chains, like the browser probe.
+"""
+from datetime import datetime
+import logging
+
+from frameworks_drivers.drivers.selector_health import SelectorStats, probe_arguments
+from utils.enums.selenium_enum import Locator, SelectorChain
+from utils.strings_utils import format_to_allowed_filename
+from utils.text_utils import count_search_phrase, contains_money
+
+try:
+    from lxml import html as lxml_html
+    from lxml.etree import ParserError, XPathError
+except ImportError:
+    lxml_html = None
+    ParserError = XPathError = ValueError
+
+logger = logging.getLogger(__name__)
+article_logger = logging.getLogger(f"{__name__}.articles")
+
+
+def is_available() -> bool:
+    """Returns True when lxml is installed and pages can be parsed without a browser"""
+    return lxml_html is not None
+
+
+def class_xpath(class_name: str) -> str:
+    """
+    Builds a relative XPath matching elements that have the given class token.
+
+    :param class_name: The class name to match.
+    :return: The XPath expression.
+    """
+    return f".//*[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+def parse_search_results_page(
+        page_source, phrase: str, selector_stats: SelectorStats = None) -> dict:
+    """
+    Extracts the article data, the next page link and the category map of a results page.
+
+    :param page_source: HTML of the page, as str or bytes.
+    :param phrase: The search phrase to count occurrences in article content.
+    :param selector_stats: The statistics the selectors matching each field are counted in.
+    :return: A dictionary with the keys `articles` (list of article data dictionaries, in the
+        same format as `CustomSelenium`), `next_page_url` and `categories`, or None when the
+        page holds no results container, meaning it is rendered by JavaScript.
+    """
+    try:
+        document = lxml_html.document_fromstring(page_source)
+    except (ParserError, ValueError) as exception:
+        logger.warning("Error parsing results page: %s", exception)
+        return None
+
+    if not find_all_with_chain(document, SelectorChain.RESULTS):
+        return None
+
+    next_page_link = find_with_chain(document, SelectorChain.NEXT_PAGE, selector_stats)
+    return {
+        "articles": [extract_article_data(element, phrase, selector_stats)
+                     for element in find_all_with_chain(
+                         document, SelectorChain.ARTICLE, selector_stats)],
+        "next_page_url": next_page_link.get("href") if next_page_link is not None else None,
+        "categories": extract_categories(document)}
+
+
+def probe_page(page_source, sample: int = 20) -> dict:
+    """
+    Counts the matches of every selector of the chains, like `Script.PROBE_SELECTORS`.
+
+    :param page_source: HTML of the page, as str or bytes.
+    :param sample: Number of article cards the field selectors are counted on.
+    :return: The counts, in the format of the browser probe (see `build_health_report`).
+    """
+    article_chain, page_chains, field_chains, sample = probe_arguments(sample)
+    try:
+        document = lxml_html.document_fromstring(page_source)
+    except (ParserError, ValueError) as exception:
+        logger.warning("Error parsing results page: %s", exception)
+        document = None
+
+    probe = {"articles": [], "page": {}, "fields": {}, "cards": 0}
+    if document is None:
+        return probe
+    cards = []
+    for xpath in article_chain:
+        probe["articles"].append(count_matches(xpath, document))
+        if not cards and probe["articles"][-1] > 0:
+            cards = document.xpath(xpath)[:sample]
+    probe["cards"] = len(cards)
+    for name, chain in page_chains.items():
+        probe["page"][name] = [count_matches(xpath, document) for xpath in chain]
+    for name, chain in field_chains.items():
+        probe["fields"][name] = []
+        for xpath in chain:
+            matches = [count_matches(xpath, card) for card in cards]
+            probe["fields"][name].append(
+                -1 if -1 in matches else sum(1 for found in matches if found > 0))
+    return probe
+
+
+def parse_articles_in_range(articles: list[dict], max_date: datetime) -> tuple[list[dict], bool]:
+    """
+    Keeps the articles of a parsed page within the months searched.
+
+    Results are sorted by newest, so once the last article of a page is older than the months
+    searched, the following pages are older too.
+
+    :param articles: Article data dictionaries of a page.
+    :param max_date: The oldest date to include articles.
+    :return: The articles in range and whether the next page must be read.
+    """
+    in_range = [article for article in articles
+                if (article["date"].year, article["date"].month) >=
+                (max_date.year, max_date.month)]
+    return in_range, bool(articles) and len(in_range) == len(articles)
+
+
+def extract_article_data(element, phrase: str, selector_stats: SelectorStats = None) -> dict:
+    """
+    Extracts the data of an article card.
+
+    :param element: The lxml element of the article.
+    :param phrase: The search phrase to count occurrences in article content.
+    :param selector_stats: The statistics the selectors matching each field are counted in.
+    :return: The article data dictionary.
+    """
+    text = normalize_text(element.text_content())
+    return {
+        "title": first_text(
+            element, SelectorChain.TITLE, "Article without tittle", selector_stats),
+        "date": extract_date(element, selector_stats),
+        "description": first_text(
+            element, SelectorChain.DESCRIPTION, "Article without description",
+            selector_stats),
+        "image_filename": extract_image_filename(element, selector_stats),
+        "search_count": count_search_phrase(text, phrase),
+        "contains_money": contains_money(text),
+        "picture_url": extract_picture_url(element),
+        "url": extract_article_url(element, selector_stats)}
+
+
+def parse_article_page(page_source, selector_stats: SelectorStats = None) -> dict:
+    """
+    Extracts the body, the author and the publication and update times of an article page.
+
+    The body is read paragraph by paragraph, one line each, so the captions and share links
+    around the story are left out.
+
+    :param page_source: HTML of the page, as str or bytes.
+    :param selector_stats: The statistics the selectors matching each field are counted in.
+    :return: A dictionary with the keys `body`, `author`, `published_at` and `updated_at`
+        (None when missing), or None when the page cannot be parsed or holds no story body.
+    """
+    try:
+        document = lxml_html.document_fromstring(page_source)
+    except (ParserError, ValueError) as exception:
+        logger.warning("Error parsing article page: %s", exception)
+        return None
+
+    body_element = find_with_chain(document, SelectorChain.BODY, selector_stats)
+    if body_element is None:
+        return None
+    paragraphs = [normalize_text(paragraph.text_content())
+                  for paragraph in body_element.xpath(".//p")]
+    return {
+        "body": "\n".join(filter(None, paragraphs)) or normalize_text(
+            body_element.text_content()),
+        "author": extract_author(document, selector_stats),
+        "published_at": extract_page_time(document, SelectorChain.PUBLISHED, selector_stats),
+        "updated_at": extract_page_time(document, SelectorChain.UPDATED, selector_stats)}
+
+
+def extract_date(element, selector_stats: SelectorStats = None) -> datetime:
+    """Extracts the publication date of an article card, now when it is missing"""
+    timestamp = find_with_chain(element, SelectorChain.DATE, selector_stats)
+    try:
+        return datetime.fromtimestamp(int(timestamp.get(Locator.DATA_TIMESTAMP.value)) / 1000.0)
+    except (AttributeError, TypeError, ValueError):
+        article_logger.warning("Article without date")
+        return datetime.now()
+
+
+def extract_image_filename(element, selector_stats: SelectorStats = None) -> str:
+    """Extracts the picture file name of an article card, None when it has no picture"""
+    media = find_with_chain(element, SelectorChain.MEDIA, selector_stats)
+    if media is None:
+        return None
+    labels = media.xpath(f".//{Locator.TAG_A.value}/@{Locator.ARIA_LABEL.value}")
+    return format_to_allowed_filename(labels[0]) if labels else None
+
+
+def extract_picture_url(element) -> str:
+    """Extracts the picture URL of an article card, None when it has no picture"""
+    media = find_with_chain(element, SelectorChain.MEDIA)
+    if media is None:
+        return None
+    sources = media.xpath(
+        f".//{Locator.PICTURE_TAG_NAME.value}"
+        f"{class_xpath(Locator.IMAGE_CLASS_NAME.value)[1:]}/@{Locator.SOURCE.value}")
+    return sources[0] if sources else None
+
+
+def extract_article_url(element, selector_stats: SelectorStats = None) -> str:
+    """Extracts the link to the article page of a card, None when it has no link"""
+    link = find_with_chain(element, SelectorChain.LINK, selector_stats)
+    return link.get(Locator.HREF.value) if link is not None else None
+
+
+def extract_author(document, selector_stats: SelectorStats = None) -> str:
+    """Extracts the byline of an article page without its "By", None when it is missing"""
+    byline = find_with_chain(document, SelectorChain.AUTHOR, selector_stats)
+    if byline is None:
+        return None
+    author = normalize_text(byline.get("content") or byline.text_content())
+    if author.lower().startswith("by "):
+        author = author[3:].strip()
+    return author or None
+
+
+def extract_page_time(document, chain: SelectorChain, selector_stats: SelectorStats = None):
+    """
+    Extracts a time of an article page, from a `meta` element or a timestamp attribute.
+
+    :param document: The lxml document of the page.
+    :param chain: The chain of the time (`SelectorChain.PUBLISHED` or `UPDATED`).
+    :param selector_stats: The statistics the matching selector is counted in.
+    :return: The time as a local datetime, like the card dates, or None when it is missing.
+    """
+    element = find_with_chain(document, chain, selector_stats)
+    if element is None:
+        return None
+    try:
+        if element.get("content"):
+            # Python 3.10 does not read the "Z" UTC designator.
+            content = element.get("content").strip()
+            value = datetime.fromisoformat(
+                content[:-1] + "+00:00" if content.endswith("Z") else content)
+            return value.astimezone().replace(tzinfo=None) if value.tzinfo else value
+        return datetime.fromtimestamp(int(element.get(Locator.DATA_TIMESTAMP.value)) / 1000.0)
+    except (TypeError, ValueError, OverflowError, OSError):
+        article_logger.warning("Article page with an unreadable %s time", chain.name.lower())
+        return None
+
+
+def extract_categories(document) -> dict:
+    """
+    Extracts the category map of the search filter.
+
+    Category names are upper-cased, as the page displays them and as `CustomSelenium` reads
+    them.
+    """
+    categories = {}
+    for item in document.xpath(class_xpath(Locator.FILTER_ITEMS_CSS_SELECTOR.value[1:])):
+        names = item.xpath(f"{class_xpath('CheckboxInput-label')}//span")
+        values = item.xpath(f".//{Locator.INPUT.value}/@value")
+        if names and values:
+            categories[str.upper(normalize_text(names[0].text_content()))] = values[0]
+    return categories
+
+
+def first_text(
+        element, chain: SelectorChain, default: str, selector_stats: SelectorStats = None) -> str:
+    """Returns the text of the first descendant matched by the chain, or a default"""
+    match = find_with_chain(element, chain, selector_stats)
+    if match is None:
+        return default
+    return normalize_text(match.text_content())
+
+
+def count_matches(xpath: str, context) -> int:
+    """Returns the number of elements matched by an XPath, -1 when it is invalid"""
+    try:
+        return len(context.xpath(xpath))
+    except (XPathError, ValueError):
+        return -1
+
+
+def find_with_chain(context, chain: SelectorChain, selector_stats: SelectorStats = None):
+    """
+    Returns the first element matched by the selectors of a chain, tried in order.
+
+    :param context: The lxml document or element to search from.
+    :param chain: The chain of XPath selectors of the field.
+    :param selector_stats: The statistics the matching selector is counted in.
+    :return: The element, or None when no selector matches.
+    """
+    for index, xpath in enumerate(chain.value):
+        elements = context.xpath(xpath)
+        if elements:
+            if selector_stats:
+                selector_stats.record(chain, index)
+            return elements[0]
+    if selector_stats:
+        selector_stats.record(chain, None)
+    return None
+
+
+def find_all_with_chain(context, chain: SelectorChain, selector_stats: SelectorStats = None):
+    """
+    Returns the elements matched by the first selector of a chain that matches any.
+
+    :param context: The lxml document or element to search from.
+    :param chain: The chain of XPath selectors of the field.
+    :param selector_stats: The statistics the matching selector is counted in.
+    :return: The elements, an empty list when no selector matches.
+    """
+    for index, xpath in enumerate(chain.value):
+        elements = context.xpath(xpath)
+        if elements:
+            if selector_stats:
+                selector_stats.record(chain, index)
+            return elements
+    return []
+
+
+def normalize_text(text: str) -> str:
+    """Collapses the whitespace of a text the way the browser renders it"""
+    return " ".join(text.split())
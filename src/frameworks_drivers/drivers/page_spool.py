@@ -0,0 +1,185 @@
+"""
+This module hands pages over to parser processes without serializing them.
+
+Parsing the results pages with lxml is CPU bound, so a long replay parses its pages in a pool of
+processes. Giving each page to a worker as an argument pickles the whole HTML, megabytes for a
+large page, writes it through a pipe and unpickles it on the other side, which eats most of the
+gain of the pool. Instead, `PageSpool` appends each page to a spool file and the workers receive
+only its offset and length. Every worker maps the spool file in memory once and parses each
+page straight from its mapping, which shares the operating system page cache with the writer,
+so the HTML is neither copied between the processes nor decoded into a Python string.
+
+lxml parses from a buffer since version 5; with older versions each worker copies the bytes of
+the page out of its mapping, which still avoids the pickling and the pipe.
+
+Classes:
+    PageSpool: Append-only spool file the pages are written to.
+    SpooledPageParser: Pool of parser processes reading the pages from a spool.
+
+Functions:
+    parse_spooled_page: Parses a results page of the spool in a worker process.
+"""
+from concurrent.futures import Future, ProcessPoolExecutor
+import logging
+import mmap
+import multiprocessing
+import os
+import uuid
+
+from frameworks_drivers.drivers import html_page_parser
+
+logger = logging.getLogger(__name__)
+
+# Mapping of the spool file in a worker process, opened on first use and grown with the file.
+_worker_spool = {"path": None, "file": None, "mapping": None, "buffers": None}
+
+
+class PageSpool:
+    """
+    Append-only spool file holding the pages handed over to the parser processes.
+
+    The spool is removed when it is closed, so it only lives as long as the pool reading it.
+
+    Attributes:
+        path (str): Path of the spool file.
+        size (int): Number of bytes written.
+    """
+    def __init__(self, spool_dir: str):
+        os.makedirs(spool_dir, exist_ok=True)
+        self.path = os.path.join(spool_dir, f"{os.getpid()}-{uuid.uuid4().hex}.spool")
+        self.size = 0
+        self._file = open(self.path, "wb")  # pylint: disable=consider-using-with
+
+    def write(self, content: bytes) -> tuple[int, int]:
+        """
+        Appends a page to the spool.
+
+        The page is flushed to the operating system before the method returns, so a worker
+        mapping the file afterwards sees it.
+
+        Args:
+            content (bytes): The HTML of the page.
+
+        Returns:
+            tuple[int, int]: The offset and the length of the page in the spool.
+        """
+        offset = self.size
+        self._file.write(content)
+        self._file.flush()
+        self.size += len(content)
+        return offset, len(content)
+
+    def close(self) -> None:
+        """Closes and removes the spool file."""
+        self._file.close()
+        try:
+            os.remove(self.path)
+        except OSError as exception:
+            logger.warning("Error removing page spool %s: %s", self.path, exception)
+
+    def __enter__(self) -> "PageSpool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class SpooledPageParser:
+    """
+    Pool of processes parsing results pages handed over through a `PageSpool`.
+
+    The workers are started with the "spawn" method on every platform, so they never inherit
+    the threads of the scraper (the log listener, the asyncio executors) in a forked state.
+
+    Attributes:
+        spool (PageSpool): The spool the pages are written to.
+        workers (int): Number of parser processes.
+    """
+    def __init__(self, spool_dir: str, workers: int = None):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.spool = PageSpool(spool_dir)
+        self.executor = ProcessPoolExecutor(
+            self.workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def submit(self, content: bytes, phrase: str) -> Future:
+        """
+        Writes a results page to the spool and queues its parsing.
+
+        Args:
+            content (bytes): The HTML of the page.
+            phrase (str): The search phrase to count occurrences in article content.
+
+        Returns:
+            Future: Resolves to the parsed page (see
+            `html_page_parser.parse_search_results_page`).
+        """
+        offset, length = self.spool.write(content)
+        return self.executor.submit(
+            parse_spooled_page, self.spool.path, offset, length, phrase)
+
+    def close(self) -> None:
+        """Stops the workers, cancelling the pages not parsed yet, and removes the spool."""
+        try:
+            self.executor.shutdown(cancel_futures=True)
+        finally:
+            self.spool.close()
+
+    def __enter__(self) -> "SpooledPageParser":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def parse_spooled_page(path: str, offset: int, length: int, phrase: str) -> dict:
+    """
+    Parses a results page of the spool in a worker process.
+
+    Args:
+        path (str): Path of the spool file.
+        offset (int): Offset of the page in the spool.
+        length (int): Length of the page.
+        phrase (str): The search phrase to count occurrences in article content.
+
+    Returns:
+        dict: The parsed page (see `html_page_parser.parse_search_results_page`), or None.
+    """
+    mapping = map_spool(path, offset + length)
+    with memoryview(mapping)[offset:offset + length] as page:
+        return html_page_parser.parse_search_results_page(
+            page if _worker_spool["buffers"] else bytes(page), phrase)
+
+
+def map_spool(path: str, size: int) -> mmap.mmap:
+    """
+    Returns the mapping of the spool file in the worker, mapping it again once it grew.
+
+    Args:
+        path (str): Path of the spool file.
+        size (int): Number of bytes the mapping must cover.
+
+    Returns:
+        mmap.mmap: The read-only mapping of the spool.
+    """
+    spool = _worker_spool
+    if spool["path"] != path or spool["mapping"] is None or len(spool["mapping"]) < size:
+        if spool["mapping"] is not None:
+            spool["mapping"].close()
+        if spool["path"] != path:
+            if spool["file"] is not None:
+                spool["file"].close()
+            spool["file"] = open(path, "rb")  # pylint: disable=consider-using-with
+            spool["path"] = path
+        spool["mapping"] = mmap.mmap(spool["file"].fileno(), 0, access=mmap.ACCESS_READ)
+    if spool["buffers"] is None:
+        spool["buffers"] = parses_buffers()
+    return spool["mapping"]
+
+
+def parses_buffers() -> bool:
+    """Returns True when the installed lxml parses a memoryview without copying it to bytes"""
+    try:
+        html_page_parser.lxml_html.document_fromstring(memoryview(b"<html><p>x</p></html>"))
+        return True
+    except (TypeError, ValueError):
+        return False
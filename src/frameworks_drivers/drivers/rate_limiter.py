@@ -0,0 +1,149 @@
+"""
+This module contains the SharedRateLimiter class, which paces the navigations and picture
+fetches of every worker running on the same host.
+
+The limiter is a token bucket whose state lives in a small JSON file guarded by a file lock,
+so concurrent robots draw from the same budget. The refill rate adapts with AIMD (additive
+increase, multiplicative decrease): it grows slowly while the site answers fast and is cut
+when responses slow down or fail, keeping the throughput at the highest level the site
+tolerates.
+
+Classes:
+    SharedRateLimiter: Host-wide token bucket with adaptive rate.
+"""
+import json
+import logging
+import os
+import time
+
+from utils.lock_utils import file_lock
+
+logger = logging.getLogger(__name__)
+
+
+class SharedRateLimiter:
+    """
+    Host-wide token bucket with an AIMD adapted refill rate.
+
+    Attributes:
+        state_file (str): Path of the JSON file holding the shared bucket state.
+        initial_rate (float): Requests per second used when no state exists yet.
+        min_rate (float): Lowest requests per second the rate can be cut to.
+        max_rate (float): Highest requests per second the rate can grow to.
+        burst (float): Capacity of the bucket.
+        target_latency (float): Average latency (in seconds) above which the rate is cut.
+        increase (float): Requests per second added after a fast response.
+        decrease (float): Factor applied to the rate after a slow or failed response.
+    """
+
+    # Weight of the newest sample in the moving average of the latency.
+    LATENCY_SMOOTHING = 0.3
+
+    def __init__(
+            self,
+            state_file: str,
+            initial_rate: float = 1.0,
+            min_rate: float = 0.1,
+            max_rate: float = 5.0,
+            burst: float = 3.0,
+            target_latency: float = 5.0,
+            increase: float = 0.1,
+            decrease: float = 0.5):
+        self.state_file = state_file
+        self.lock_file = f"{state_file}.lock"
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.target_latency = target_latency
+        self.increase = increase
+        self.decrease = decrease
+
+    @classmethod
+    def from_settings(cls, settings: dict, state_dir: str):
+        """
+        Creates a limiter from the `rate_limiter` settings of values.json.
+
+        Args:
+            settings (dict): The `rate_limiter` settings.
+            state_dir (str): Directory where the default state file is kept.
+
+        Returns:
+            SharedRateLimiter: The limiter, or None when it is disabled.
+        """
+        if not settings.get("enabled", False):
+            return None
+        options = {key: value for key, value in settings.items()
+                   if key not in ("enabled", "state_file")}
+        return cls(
+            settings.get("state_file", os.path.join(state_dir, ".rate_limiter.json")),
+            **options)
+
+    def acquire(self, cost: float = 1.0) -> None:
+        """
+        Blocks until the bucket holds enough tokens and takes them.
+
+        Args:
+            cost (float): Number of tokens to take, one per request.
+        """
+        while True:
+            with file_lock(self.lock_file):
+                state = self._read_state()
+                if state["tokens"] >= cost:
+                    state["tokens"] -= cost
+                    self._write_state(state)
+                    return
+                wait = (cost - state["tokens"]) / state["rate"]
+            time.sleep(wait)
+
+    def record(self, latency: float, failed: bool = False) -> None:
+        """
+        Adapts the shared rate to the outcome of a request.
+
+        The rate is cut by `decrease` when the request failed or the moving average of the
+        latency exceeds `target_latency`, and grows by `increase` otherwise. Cuts are applied
+        at most once per `target_latency` seconds, so one slow burst seen by many workers
+        counts once.
+
+        Args:
+            latency (float): Time the request took (in seconds).
+            failed (bool): Whether the request failed or was throttled.
+        """
+        with file_lock(self.lock_file):
+            state = self._read_state()
+            state["latency"] = (self.LATENCY_SMOOTHING * latency +
+                                (1 - self.LATENCY_SMOOTHING) * state["latency"])
+            now = time.time()
+            if failed or state["latency"] > self.target_latency:
+                if now - state["decreased_at"] >= self.target_latency:
+                    state["rate"] = max(self.min_rate, state["rate"] * self.decrease)
+                    state["decreased_at"] = now
+                    logger.warning(
+                        "Site is slowing down (%.1fs average), navigation rate cut to %.2f/s",
+                        state["latency"], state["rate"])
+            else:
+                state["rate"] = min(self.max_rate, state["rate"] + self.increase)
+            self._write_state(state)
+
+    def _read_state(self) -> dict:
+        """Reads the shared state and refills the bucket for the time elapsed."""
+        now = time.time()
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            state = {
+                "tokens": self.burst,
+                "rate": self.initial_rate,
+                "latency": 0.0,
+                "decreased_at": 0.0,
+                "updated_at": now}
+        elapsed = max(0.0, now - state["updated_at"])
+        state["tokens"] = min(self.burst, state["tokens"] + elapsed * state["rate"])
+        state["updated_at"] = now
+        return state
+
+    def _write_state(self, state: dict) -> None:
+        """Writes the shared state; must be called while holding the lock."""
+        with open(self.state_file, "w", encoding="utf-8") as file:
+            json.dump(state, file)
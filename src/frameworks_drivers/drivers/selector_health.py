@@ -0,0 +1,171 @@
+"""
+This module checks that the selectors of the results page still match the site layout.
+
+When the site changes its markup, the selectors stop matching and every wait runs to its
+timeout before the run fails or returns empty data. The first results page is therefore probed
+once, counting the matches of every selector of the `SelectorChain` values (in the page with
+`Script.PROBE_SELECTORS`, or with lxml for pages fetched without a browser), and the run is
+aborted with a report of the fields that no longer match when a critical one is missing.
+
+While the run goes on, `SelectorStats` counts which selector of each chain matched, so a layout
+change only caught by a fallback selector shows up in the run report before the fallbacks stop
+matching too.
+
+Classes:
+    SelectorHealthError: Raised when a critical field no longer matches.
+    SelectorStats: Counts the matches of each selector of the chains during a run.
+
+Functions:
+    probe_arguments: Builds the chains given to the probe.
+    build_health_report: Turns the probe counts into a report of every field.
+"""
+import logging
+
+from utils.enums.selenium_enum import SelectorChain
+
+logger = logging.getLogger(__name__)
+
+# Fields read once per page, with absolute selectors.
+PAGE_FIELDS = ("RESULTS", "NEXT_PAGE")
+# Fields read from every article card, with selectors relative to the card.
+ARTICLE_FIELDS = ("TITLE", "DATE", "DESCRIPTION", "MEDIA")
+# Fields without which the run cannot produce correct data. The next page link is missing on
+# the last page and descriptions and pictures are missing on some articles.
+CRITICAL_FIELDS = ("RESULTS", "ARTICLE", "TITLE", "DATE")
+
+
+class SelectorHealthError(RuntimeError):
+    """
+    Raised when a critical field of the results page no longer matches any of its selectors.
+
+    Attributes:
+        report (dict): The health report (see `build_health_report`).
+    """
+    def __init__(self, report: dict):
+        super().__init__(
+            "The results page layout changed, aborting: " + "; ".join(report["failures"]))
+        self.report = report
+
+
+class SelectorStats:
+    """
+    Counts the matches of each selector of the chains during a run.
+
+    Attributes:
+        counts (dict): For each field, the number of lookups matched by each selector of its
+            chain, followed by the number of lookups no selector matched.
+    """
+    def __init__(self):
+        self.counts = {}
+
+    def record(self, chain: SelectorChain, index: int) -> None:
+        """
+        Records a lookup of a field.
+
+        Args:
+            chain (SelectorChain): The chain of the field.
+            index (int): Position of the selector that matched, None when none did.
+        """
+        counts = self.counts.setdefault(chain.name, [0] * (len(chain.value) + 1))
+        counts[-1 if index is None else index] += 1
+        if index:
+            logger.debug("%s matched by fallback selector %d", chain.name, index)
+
+    def as_dict(self) -> dict:
+        """
+        Returns the counts of each field.
+
+        Returns:
+            dict: For each field, `selectors` (the matches of each selector, in chain order),
+            `missing` (lookups no selector matched) and `fallback_share` (share of the matched
+            lookups answered by a fallback selector).
+        """
+        stats = {}
+        for name, counts in self.counts.items():
+            matched = sum(counts[:-1])
+            stats[name] = {
+                "selectors": counts[:-1],
+                "missing": counts[-1],
+                "fallback_share": round((matched - counts[0]) / matched, 3) if matched else 0.0}
+        return stats
+
+
+def probe_arguments(sample: int) -> tuple:
+    """
+    Builds the chains given to the probe, in the order of the `Script.PROBE_SELECTORS` arguments.
+
+    Args:
+        sample (int): Number of article cards the field selectors are counted on.
+
+    Returns:
+        tuple: The article chain, the page chains and the article field chains by name, and
+        the sample size.
+    """
+    return (SelectorChain.ARTICLE.value,
+            {name: SelectorChain[name].value for name in PAGE_FIELDS},
+            {name: SelectorChain[name].value for name in ARTICLE_FIELDS},
+            sample)
+
+
+def build_health_report(probe: dict, min_coverage: float = 0.5) -> dict:
+    """
+    Turns the probe counts into a report of every field.
+
+    A critical field fails when none of its selectors matches or, for article fields, when the
+    best one matches less than `min_coverage` of the sampled cards. Fields matched only by a
+    fallback selector and missing optional fields are reported as warnings. Article fields are
+    not checked when no article card was found, the cards being the failure to report.
+
+    Args:
+        probe (dict): The counts returned by the probe, with the keys `articles`, `page`,
+            `fields` and `cards`.
+        min_coverage (float): Share of the sampled cards a critical article field must match.
+
+    Returns:
+        dict: `healthy`, `cards`, `fields` (for each field: `critical`, `selector` (position of
+        the first matching selector, None when none does), `xpath`, `counts` and, for article
+        fields, `coverage`), `failures` and `warnings`.
+    """
+    cards = probe.get("cards", 0)
+    counts_by_field = {"ARTICLE": probe.get("articles", [])}
+    counts_by_field.update(probe.get("page", {}))
+    counts_by_field.update(probe.get("fields", {}))
+
+    report = {"healthy": True, "cards": cards, "fields": {}, "failures": [], "warnings": []}
+    for name, counts in counts_by_field.items():
+        chain = SelectorChain[name].value
+        critical = name in CRITICAL_FIELDS
+        selector = next((index for index, count in enumerate(counts) if count > 0), None)
+        field = {
+            "critical": critical,
+            "selector": selector,
+            "xpath": chain[selector] if selector is not None else None,
+            "counts": counts}
+        if name in ARTICLE_FIELDS:
+            field["coverage"] = round(max(counts, default=0) / cards, 3) if cards else 0.0
+        report["fields"][name] = field
+        if name in ARTICLE_FIELDS and not cards:
+            continue
+
+        invalid = [chain[index] for index, count in enumerate(counts) if count < 0]
+        if invalid:
+            report["warnings"].append(f"{name}: invalid selectors {invalid}")
+        if selector is None:
+            message = f"{name}: no selector matched (tried {chain})"
+            if name == "ARTICLE" and max(counts_by_field.get("RESULTS", []), default=0) > 0:
+                message += "; the results container matched, the search may have no results"
+        elif name in ARTICLE_FIELDS and field["coverage"] < min_coverage:
+            message = (f"{name}: matched in {field['coverage']:.0%} of {cards} articles by "
+                       f"{chain[selector]}")
+        else:
+            if selector:
+                report["warnings"].append(
+                    f"{name}: only matched by fallback selector {selector} ({chain[selector]})")
+            continue
+        if critical:
+            report["failures"].append(message)
+        else:
+            report["warnings"].append(message)
+
+    report["healthy"] = not report["failures"]
+    return report
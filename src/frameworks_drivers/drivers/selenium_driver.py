@@ -6,11 +6,14 @@ navigating pages, interacting with page elements, and extracting data from web p
 Classes:
     CustomSelenium: A class that encapsulates methods for web interaction using Selenium WebDriver.
 """
+import base64
+import binascii
+import json
 import logging
+import os
 import time
 from datetime import datetime
 import itertools
-import re
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -23,15 +26,56 @@ from selenium.common.exceptions import (
     TimeoutException,
     ElementClickInterceptedException,
     ElementNotInteractableException,
+    WebDriverException,
 )
 from selenium.webdriver.remote.webelement import WebElement
 
 from webdriver_manager.chrome import ChromeDriverManager
 
-from utils.enums.selenium_enum import Locator, SortBy, HttpCode
-from utils.values_utils import get_output_dir_value
-from utils.strings_utils import format_to_allowed_filename
+from utils.enums.selenium_enum import (
+    Locator, SelectorChain, SortBy, HttpCode, Script, ImageCaptureMode)
+from utils.values_utils import (
+    get_output_dir_value,
+    get_state_dir_value,
+    get_resource_blocking_value,
+    get_image_capture_mode_value,
+    get_rate_limiter_value,
+    get_suppress_overlays_value,
+    get_memory_watchdog_value,
+    get_browser_profile_value,
+    get_selector_health_value,
+    get_article_details_value,
+)
+from utils.strings_utils import define_page_url, format_to_allowed_filename
+from utils.text_utils import count_search_phrase, contains_money
 from utils.dir_utils import create_new_dir_to_save_images
+from frameworks_drivers.drivers.rate_limiter import SharedRateLimiter
+from frameworks_drivers.drivers.article_details import ArticleDetailsEnricher
+from frameworks_drivers.drivers.selector_health import (
+    SelectorHealthError,
+    SelectorStats,
+    build_health_report,
+    probe_arguments,
+)
+from frameworks_drivers.repositories.checkpoint_repository import CheckpointRepository
+from frameworks_drivers.repositories.page_archive_repository import PageArchiveRepository
+from frameworks_drivers.repositories.browser_profile_repository import (
+    BrowserProfileRepository,
+    define_fingerprint,
+)
+from utils.network_utils import (
+    build_blocked_url_patterns,
+    parse_performance_log,
+    summarize_network_events,
+)
+from utils.process_utils import read_process_tree_rss
+
+logger = logging.getLogger(__name__)
+# Per-article messages, sampled by `utils.logging_utils` on large searches.
+article_logger = logging.getLogger(f"{__name__}.articles")
+
+# Bytes in a megabyte, for the memory figures.
+MEGABYTE = 1024 * 1024
 
 
 class CustomSelenium:
@@ -72,11 +116,84 @@ class CustomSelenium:
             Selects categories by clicking on corresponding checkboxes.
         sort_by_newest: 
             Sorts the elements on the page by the newest.
+        block_resources: 
+            Blocks heavy third-party resources through the DevTools protocol.
+        collect_page_network_stats: 
+            Summarizes the requests made and blocked since the last call.
+        extract_page_data: 
+            Extracts the data of the current page and records its time and network statistics.
+        capture_pictures_in_page: 
+            Saves the pictures already loaded by the results page without navigating.
+        read_cached_resources: 
+            Reads resources loaded by the current page through the DevTools protocol.
+        read_article_pages: 
+            Reads several article pages at once in a bounded pool of browser tabs.
+        iter_data_from_verified_articles_pages: 
+            Yields the data of the articles within the date range, one page at a time.
+        load_checkpoint: 
+            Loads the saved progress of the work item, resumed by the next extraction.
+        install_overlay_suppressor: 
+            Removes the cookie dialog and overlay modal as soon as any page adds them.
+        start_driver: 
+            Starts and configures Chrome.
+        check_memory: 
+            Samples the browser memory at a page boundary and restarts the browser when needed.
+        restart_driver: 
+            Replaces the browser with a new one and re-opens the current results page.
+        check_selectors: 
+            Probes every selector on the first results page and aborts when the layout changed.
+        wait_for_request_slot: 
+            Waits for the shared rate limiter before a navigation or picture fetch.
+        report_request: 
+            Reports the outcome of a navigation or picture fetch to the shared rate limiter.
     """
 
-    def __init__(self):
-        logging.info("Starting configuration")
+    def __init__(
+            self,
+            checkpoint: CheckpointRepository = None,
+            page_archive: PageArchiveRepository = None):
+        logger.info("Starting configuration")
+        self.checkpoint = checkpoint
+        self.resume_state = None
+        self.page_archive = page_archive
+        self.images_dir = create_new_dir_to_save_images(
+            get_output_dir_value())
+        self.page_network_stats = []
+        self.network_requests = None
+        self.page_timings = []
+        self.page_started_at = time.monotonic()
+        self.last_url = None
+        self.memory_timeline = []
+        self.browser_restarts = 0
+        self.memory_watchdog = get_memory_watchdog_value()
+        self.captured_images = set()
+        self.image_capture_mode = ImageCaptureMode(
+            get_image_capture_mode_value())
+        self.rate_limiter = SharedRateLimiter.from_settings(
+            get_rate_limiter_value(), get_state_dir_value())
+        self.overlays_suppressed = 0
+        self.selector_health = get_selector_health_value()
+        self.selector_report = None
+        self.selector_stats = SelectorStats()
+        self.browser_profile = BrowserProfileRepository.from_settings(
+            get_browser_profile_value())
+        article_details = get_article_details_value()
+        self.article_tabs = max(1, article_details.get("concurrency", 4))
+        self.article_details = ArticleDetailsEnricher.from_settings(
+            self.read_article_pages, article_details, self.selector_stats)
+        self._driver = None
+        self.start_driver()
+        logger.info("configuration finished")
+
+    def start_driver(self) -> None:
+        """
+        Starts Chrome and installs the overlay suppressor and the resource blocking in it.
 
+        Used when the class is created and again by `restart_driver`, so a restarted browser
+        is configured like the first one. When persistent profiles are enabled, the browser
+        takes a free profile slot (see `BrowserProfileRepository`), so its disk cache and
+        cookies are kept from the previous runs; otherwise it starts with a throwaway profile.
+        """
         try:
             chrome_options = Options()
             chrome_options.add_argument('--no-sandbox')
@@ -86,31 +203,49 @@ class CustomSelenium:
             chrome_options.add_argument("--disable-gpu")
             chrome_options.add_argument("--start-maximized")
             chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument('--remote-debugging-port=9222')
             chrome_options.add_argument("--disable-cookies")
             chrome_options.add_argument(
                 "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
             chrome_options.add_experimental_option(
                 "excludeSwitches", ["enable-logging"])
             prefs = {
-                "download.default_directory": create_new_dir_to_save_images(
-                    get_output_dir_value()),
+                "download.default_directory": self.images_dir,
                 "download.prompt_for_download": False,
                 "download.directory_upgrade": True,
                 "safebrowsing.enabled": True}
+            if self.browser_profile and self.browser_profile.acquire(
+                    define_fingerprint(chrome_options.arguments, prefs)):
+                for argument in self.browser_profile.chrome_arguments():
+                    chrome_options.add_argument(argument)
+            else:
+                chrome_options.add_argument('--remote-debugging-port=0')
             chrome_options.add_experimental_option("prefs", prefs)
+            chrome_options.set_capability(
+                "goog:loggingPrefs", {"performance": "ALL"})
 
             service = Service(ChromeDriverManager().install())
 
-            self._driver = webdriver.Chrome(
-                service=service, options=chrome_options)
-
-            logging.basicConfig(level=logging.INFO)
-
-            logging.info("configuration finished")
+            try:
+                self._driver = webdriver.Chrome(
+                    service=service, options=chrome_options)
+            except WebDriverException:
+                if self.browser_profile:
+                    self.browser_profile.release()
+                raise
+            self.network_requests = {}
+
+            if get_suppress_overlays_value():
+                self.install_overlay_suppressor()
+            resource_blocking = get_resource_blocking_value()
+            if resource_blocking.get("enabled", False):
+                self.block_resources(
+                    resource_blocking.get("resource_types", []),
+                    resource_blocking.get("domain_patterns", []))
+            if self.memory_watchdog.get("enabled", False):
+                self.enable_performance_metrics()
 
         except ImportError as exception:
-            logging.error(("Error initializing configuration: %s", exception))
+            logger.error("Error initializing configuration: %s", exception)
             raise
 
     @property
@@ -119,11 +254,242 @@ class CustomSelenium:
 
         return self._driver
 
+    def block_resources(self, resource_types: list, domain_patterns: list) -> None:
+        """
+        Blocks requests matching the given resource types and domain patterns.
+
+        The patterns are applied with the CDP command `Network.setBlockedURLs`, so blocked
+        requests are refused by the browser before they reach the network.
+
+        :param resource_types: Names of `BlockedResource` members to block.
+        :param domain_patterns: Wildcard patterns of domains to block.
+        """
+        blocked_url_patterns = build_blocked_url_patterns(
+            resource_types, domain_patterns)
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": blocked_url_patterns})
+            logger.info(
+                "Blocking %d URL patterns while scraping", len(blocked_url_patterns))
+        except WebDriverException as exception:
+            logger.warning("Resource blocking is not available: %s", exception)
+
+    def collect_page_network_stats(self, page: int | None) -> dict:
+        """
+        Summarizes the requests made and blocked since the last call and stores the summary.
+
+        The requests still loading are kept in `network_requests`, so their bytes are counted
+        in the domain and resource type they were sent for when they finish. The requests made
+        after the last results page, such as the picture downloads, are collected with the page
+        None when the browser quits, and only stored when there are some.
+
+        :param page: The number of the search results page the summary belongs to, None for
+            the requests made outside of the results pages.
+        :return: The network summary of the page.
+        """
+        try:
+            events = parse_performance_log(self.driver.get_log("performance"))
+        except WebDriverException as exception:
+            logger.warning("Performance log is not available: %s", exception)
+            events = []
+        page_stats = summarize_network_events(events, self.network_requests)
+        page_stats["page"] = page
+        if page is None and not (page_stats["requests"] or page_stats["bytes_transferred"]):
+            return page_stats
+        self.page_network_stats.append(page_stats)
+        logger.info(
+            "Page %s: %d requests (%d from cache), %d bytes transferred, "
+            "%d requests blocked %s",
+            page,
+            page_stats["requests"],
+            page_stats["cached_requests"],
+            page_stats["bytes_transferred"],
+            page_stats["blocked_requests"],
+            page_stats["blocked_by_type"])
+        return page_stats
+
+    def enable_performance_metrics(self) -> None:
+        """Enables the CDP `Performance` domain read by `sample_memory`."""
+        try:
+            self.driver.execute_cdp_cmd("Performance.enable", {})
+        except WebDriverException as exception:
+            logger.warning("Performance metrics are not available: %s", exception)
+
+    def sample_memory(self, page: int) -> dict:
+        """
+        Samples the memory of the browser and stores the sample in `memory_timeline`.
+
+        The JavaScript heap, DOM nodes and documents of the page come from the CDP command
+        `Performance.getMetrics`; the resident memory of chromedriver and every browser
+        process is read from the operating system, when it allows it.
+
+        :param page: The number of the search results page about to be read.
+        :return: The memory sample, with `crashed` set when the page no longer answers.
+        """
+        sample = {
+            "page": page,
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "js_heap_used_mb": None,
+            "js_heap_total_mb": None,
+            "nodes": None,
+            "documents": None,
+            "browser_rss_mb": None,
+            "crashed": False}
+        try:
+            metrics = {
+                metric["name"]: metric["value"]
+                for metric in self.driver.execute_cdp_cmd(
+                    "Performance.getMetrics", {}).get("metrics", [])}
+            sample["js_heap_used_mb"] = round(
+                metrics.get("JSHeapUsedSize", 0) / MEGABYTE, 1)
+            sample["js_heap_total_mb"] = round(
+                metrics.get("JSHeapTotalSize", 0) / MEGABYTE, 1)
+            sample["nodes"] = int(metrics.get("Nodes", 0))
+            sample["documents"] = int(metrics.get("Documents", 0))
+        except WebDriverException as exception:
+            logger.warning("Browser did not answer the memory sample: %s", exception)
+            sample["crashed"] = True
+        try:
+            browser_rss = read_process_tree_rss(self.driver.service.process.pid)
+        except AttributeError:
+            browser_rss = None
+        if browser_rss:
+            sample["browser_rss_mb"] = round(browser_rss / MEGABYTE, 1)
+        self.memory_timeline.append(sample)
+        logger.debug("Page %d memory: %s", page, sample)
+        return sample
+
+    def check_memory(self, page: int) -> bool:
+        """
+        Samples the browser memory at a page boundary and restarts the browser when needed.
+
+        The browser is restarted when the page no longer answers (the renderer was killed) or
+        when the JavaScript heap or the resident memory of the browser exceeds the limits of
+        the `memory_watchdog` settings. The new browser opens the given URL, so the search
+        goes on from the results page last opened.
+
+        :param page: The number of the search results page about to be read.
+        :return: True when the browser was restarted.
+        """
+        if not self.memory_watchdog.get("enabled", False):
+            return False
+        sample = self.sample_memory(page)
+        sample["restarted"] = False
+        max_js_heap = self.memory_watchdog.get("max_js_heap_mb")
+        max_browser_rss = self.memory_watchdog.get("max_browser_rss_mb")
+        if sample["crashed"]:
+            reason = "the page stopped answering"
+        elif max_js_heap and (sample["js_heap_used_mb"] or 0) > max_js_heap:
+            reason = f"JS heap of {sample['js_heap_used_mb']} MB"
+        elif max_browser_rss and (sample["browser_rss_mb"] or 0) > max_browser_rss:
+            reason = f"browser memory of {sample['browser_rss_mb']} MB"
+        else:
+            return False
+        logger.warning("Restarting the browser before page %d: %s", page, reason)
+        self.restart_driver(self.last_url)
+        sample["restarted"] = True
+        return True
+
+    def restart_driver(self, url: str) -> None:
+        """
+        Quits the browser, starts a new one and opens the given URL in it.
+
+        :param url: The URL to open in the new browser.
+        """
+        self.driver_quit()
+        self.start_driver()
+        self.browser_restarts += 1
+        self.open_site(url)
+
+    def check_selectors(self) -> dict:
+        """
+        Probes the selectors of every field on the current results page in one script call.
+
+        The page is probed again until the article cards appear or `probe_timeout` seconds
+        pass, so a page still rendering is not taken for a layout change, and a layout change
+        costs seconds instead of the timeouts of every wait.
+
+        :return: The health report (see `build_health_report`), None when the probe could not run.
+        :raises SelectorHealthError: When a critical field no longer matches.
+        """
+        arguments = probe_arguments(self.selector_health.get("sample", 20))
+        deadline = time.monotonic() + self.selector_health.get("probe_timeout", 10)
+        while True:
+            try:
+                probe = self.driver.execute_script(Script.PROBE_SELECTORS.value, *arguments)
+            except WebDriverException as exception:
+                logger.warning("Selector probe is not available: %s", exception)
+                return None
+            if max(probe["articles"], default=0) > 0 or time.monotonic() >= deadline:
+                break
+            time.sleep(0.5)
+
+        self.selector_report = build_health_report(
+            probe, self.selector_health.get("min_coverage", 0.5))
+        for warning in self.selector_report["warnings"]:
+            logger.warning("Selector health: %s", warning)
+        if not self.selector_report["healthy"]:
+            for failure in self.selector_report["failures"]:
+                logger.error("Selector health: %s", failure)
+            raise SelectorHealthError(self.selector_report)
+        logger.info("Selector health check passed on %d articles", self.selector_report["cards"])
+        return self.selector_report
+
+    def install_overlay_suppressor(self) -> None:
+        """
+        Removes the cookie consent dialog and the overlay modal as soon as any page adds them.
+
+        The suppressor is registered with the CDP command `Page.addScriptToEvaluateOnNewDocument`,
+        so it runs at the start of every document, before the page scripts, and watches the DOM
+        with a MutationObserver. Clicks are then no longer intercepted by those elements.
+        """
+        source = (f"var overlayXPath = {json.dumps(Locator.OVERLAY_XPATH.value)};"
+                  f"{Script.OVERLAY_SUPPRESSOR.value}")
+        try:
+            self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": source})
+            logger.info("Overlay suppressor installed")
+        except WebDriverException as exception:
+            logger.warning("Overlay suppressor is not available: %s", exception)
+
+    def count_overlays_suppressed(self) -> int:
+        """
+        Returns how many times the overlay suppressor fired on the current page since the last call.
+
+        :return: The number of elements removed from the current page.
+        """
+        try:
+            return int(self.driver.execute_script(Script.OVERLAY_SUPPRESSED_COUNT.value))
+        except (WebDriverException, TypeError, ValueError):
+            return 0
+
+    def wait_for_request_slot(self, cost: float = 1.0) -> float:
+        """
+        Waits until the shared rate limiter allows a navigation or picture fetch.
+
+        :param cost: Number of requests about to be made.
+        :return: The time the request starts, to be given to `report_request`.
+        """
+        if self.rate_limiter:
+            self.rate_limiter.acquire(cost)
+        return time.monotonic()
+
+    def report_request(self, started_at: float, failed: bool = False) -> None:
+        """
+        Reports the latency and outcome of a request to the shared rate limiter.
+
+        :param started_at: The value returned by `wait_for_request_slot`.
+        :param failed: Whether the request failed or was throttled by the site.
+        """
+        if self.rate_limiter:
+            self.rate_limiter.record(time.monotonic() - started_at, failed)
+
     def close_overlay(self):
         """
         Thread method that continuously checks for and closes overlay elements on the webpage.
         """
-        logging.info("Starting overlay close thread")
+        logger.info("Starting overlay close thread")
         self.close_cookies()
         try:
             overlay_present = len(
@@ -132,17 +498,15 @@ class CustomSelenium:
                     Locator.OVERLAY_XPATH.value)) > 0
 
             if overlay_present:
-                print("overlay apareceu")
-                logging.info("Overlay detected, attempting to close")
+                logger.info("Overlay detected, attempting to close")
                 close_button = self.driver.find_element(
                     By.XPATH, Locator.CLOSE_BUTTON_XPATH.value)
                 close_button.click()
-                logging.info("Overlay closed successfully")
-                print("overlay foi fechada")
+                logger.info("Overlay closed successfully")
                 return True
 
         except ImportError as e:
-            logging.error(("Overlay not found or other error: %s", e))
+            logger.error("Overlay not found or other error: %s", e)
 
         return False
 
@@ -153,19 +517,25 @@ class CustomSelenium:
             self.driver.execute_script(
                 "document.querySelector('#onetrust-consent-sdk').style.display = 'none';")
         except ImportError:
-            logging.warning("Doenst have any cookie on the page")
+            logger.warning("Doenst have any cookie on the page")
 
     def driver_quit(self):
         """
         Attempts to quit the WebDriver instance and logs the success or failure of the attempt.
         """
-        logging.info("Attempting to quit WebDriver")
+        logger.info("Attempting to quit WebDriver")
         try:
             if self.driver:
+                if self.network_requests is not None:
+                    self.collect_page_network_stats(None)
+                    self.network_requests = None
                 self.driver.quit()
-                logging.info("WebDriver quit successfully")
+                logger.info("WebDriver quit successfully")
         except ImportError as exception:
-            logging.error(("Error quitting WebDriver: %s", exception))
+            logger.error("Error quitting WebDriver: %s", exception)
+        finally:
+            if self.browser_profile:
+                self.browser_profile.release()
 
     def looking_at_element(self, locator):
         """
@@ -173,16 +543,15 @@ class CustomSelenium:
 
         :param locator: The CSS locator of the element to find.
         """
-        logging.info(("Looking at element with locator: %s", locator))
+        logger.info("Looking at element with locator: %s", locator)
         try:
             element = self.driver.find_element(By.CSS_SELECTOR, locator)
-            logging.info(("Element found with locator %s: %s",
-                         locator, dir(element)))
+            logger.info("Element found with locator %s: %s", locator, element.tag_name)
         except ImportError as exception:
-            logging.error((
+            logger.error(
                 "Error finding element with locator %s: %s",
                 locator,
-                exception))
+                exception)
 
     def open_site(self, url):
         """
@@ -190,12 +559,19 @@ class CustomSelenium:
 
         :param url: The URL of the webpage to open.
         """
-        logging.info(("Opening site: %s", url))
+        logger.info("Opening site: %s", url)
+        started_at = self.wait_for_request_slot()
+        self.page_started_at = started_at
+        self.last_url = url
         try:
             self.driver.get(url)
-            logging.info(("Site opened: %s", url))
+            self.report_request(started_at)
+            logger.info("Site opened: %s", url)
+        except TimeoutException as exception:
+            self.report_request(started_at, failed=True)
+            logger.error("Timeout opening site %s: %s", url, exception)
         except ImportError as exception:
-            logging.error(("Error opening site %s: %s", url, exception))
+            logger.error("Error opening site %s: %s", url, exception)
 
     def get_categories(self) -> dict:
         """
@@ -204,7 +580,7 @@ class CustomSelenium:
 
         :return: A dictionary of categories.
         """
-        logging.info("Extracting categories...")
+        logger.info("Extracting categories...")
         categories = {}
         try:
             self.close_cookies()
@@ -223,54 +599,74 @@ class CustomSelenium:
                     By.CSS_SELECTOR, Locator.INPUT.value).get_attribute("value")
                 categories[span_text] = input_value
 
-            logging.info(("Extracted categories: %s", categories))
+            logger.info("Extracted categories: %s", categories)
         except ImportError as exception:
-            logging.error((
-                "An error occurred while extracting categories: %s", exception))
+            logger.error(
+                "An error occurred while extracting categories: %s", exception)
         except NoSuchElementException:
-            logging.warning("Not found categories in site")
+            logger.warning("Not found categories in site")
         except ElementNotInteractableException:
             is_overlay_present = self.close_overlay()
             if is_overlay_present:
                 self.get_categories()
         return categories
 
-    def go_to_next_page(self, timeout=100):
+    def go_to_next_page(self, timeout=100, retry=True):
         """
         Navigates to the next page of results and waits for the page to fully load.
+
+        When the browser fails during the navigation, e.g. because its renderer was killed,
+        it is restarted on the results page last opened and the navigation is tried once more.
+
+        :param timeout: Maximum time to wait for the next page to load (in seconds).
+        :param retry: Whether to restart the browser and try again when it fails.
+        :return: False when there is no next page.
         """
-        logging.info("Going to the next page.")
+        logger.info("Going to the next page.")
 
+        started_at = None
         try:
             self.close_cookies()
-            pagination_div = self.driver.find_element(
-                By.CLASS_NAME, Locator.PAGINATION_NEXT_PAGE_CLASS.value)
-            next_page_link = pagination_div.find_element(
-                By.TAG_NAME, Locator.TAG_A.value)
+            next_page_link = find_with_chain(
+                self.driver, SelectorChain.NEXT_PAGE, self.selector_stats)
+            started_at = self.wait_for_request_slot()
+            self.page_started_at = started_at
             next_page_link.click()
             WebDriverWait(
                 self.driver, timeout).until(
-                EC.presence_of_element_located(
-                    (By.CLASS_NAME, Locator.SEARCH_RESULTS_CLASS.value)))
+                lambda driver: find_all_with_chain(driver, SelectorChain.RESULTS))
+            self.report_request(started_at)
+            self.last_url = self.driver.current_url
         except NoSuchElementException as exception:
-            logging.error((
-                "Element not found: %s . This may be due to don't have a next page", exception))
+            logger.error(
+                "Element not found: %s . This may be due to don't have a next page", exception)
 
         except TimeoutException:
-            logging.warning(
+            logger.warning(
                 """Timeout while waiting for the page to load. 
                 The page or element might be taking too long to load, veryfing errors...""")
+            self.report_request(started_at, failed=True)
             if self.check_error_404():
-                logging.warning(
+                logger.warning(
                     "Error 404 from apnews, the next page doens't exist")
                 return False
 
+        except WebDriverException as exception:
+            if not retry:
+                raise
+            logger.warning(
+                "The browser failed going to the next page, restarting it: %s", exception)
+            if started_at is not None:
+                self.report_request(started_at, failed=True)
+            self.restart_driver(self.last_url)
+            return self.go_to_next_page(timeout, retry=False)
+
         except ImportError as exception:
-            logging.error(
+            logger.error(
                 """An( unexpected error occurred: %s. )
                 Please check the details for more information.""", exception)
 
-        logging.info("Next page has loaded successfully.")
+        logger.info("Next page has loaded successfully.")
         return True
 
     @staticmethod
@@ -285,9 +681,9 @@ class CustomSelenium:
 
         last_article_date = datetime.fromtimestamp(
             (int(
-                last_article.find_element(
-                    By.TAG_NAME,
-                    Locator.TIMESTAMP_TAG_NAME.value).get_attribute(
+                find_with_chain(
+                    last_article,
+                    SelectorChain.DATE).get_attribute(
                     Locator.DATA_TIMESTAMP.value))) /
             1000.0)
 
@@ -316,7 +712,7 @@ class CustomSelenium:
         """
         Function to click the SVG element that opens the categories.
         """
-        logging.info("Attempting to click the categories toggle button.")
+        logger.info("Attempting to click the categories toggle button.")
 
         try:
             self.close_cookies()
@@ -327,14 +723,14 @@ class CustomSelenium:
                 By.XPATH, Locator.FILTER_SEE_ALL_BUTTON_XPATH.value)
             toggle_open_all_filter.click()
 
-            logging.info("Successfully clicked the categories toggle button.")
+            logger.info("Successfully clicked the categories toggle button.")
         except ElementClickInterceptedException:
             is_overlay_present = self.close_overlay()
             if is_overlay_present:
                 self.open_categories()
         except ImportError as exception:
-            logging.error((
-                "Failed to( click the categories toggle button: %s", str(exception)))
+            logger.error(
+                "Failed to( click the categories toggle button: %s", str(exception))
 
     def get_data_from_verified_articles_element(
             self,
@@ -349,47 +745,199 @@ class CustomSelenium:
         :param categories_value: List of category values to filter articles by.
         :param has_category: Boolean indicating if a category filter should be applied.
         """
-        logging.info("Extracting articles...")
-        validated_data_from_articles = []
         try:
+            return list(itertools.chain.from_iterable(
+                self.iter_data_from_verified_articles_pages(
+                    max_date, categories_value, has_category, phrase)))
+        except ImportError:
+            logger.error("Error to extract articles")
+            return []
+
+    def iter_data_from_verified_articles_pages(
+            self,
+            max_date: datetime,
+            categories_value: list,
+            has_category: bool,
+            phrase: str,
+            capture_pictures: bool = True):
+        """
+        Yields the data of the articles within the date range, one results page at a time.
+
+        The sort order and categories are expected to be encoded in the URL already opened;
+        the page controls are only used for the parts of that state the page did not apply.
+        When a checkpoint is set, the progress is saved after every completed page, before
+        leaving it. When `load_checkpoint` found a saved progress, the search is not opened
+        again: the browser opens the saved next page and the saved rows are yielded first.
+        The browser stays on a page while its data is being consumed.
+
+        :param max_date: The maximum date to include articles.
+        :param categories_value: List of category values to filter articles by.
+        :param has_category: Boolean indicating if a category filter should be applied.
+        :param phrase: The search phrase to count occurrences in article content.
+        :param capture_pictures: Whether to save the pictures of each page while on it.
+        """
+        logger.info("Extracting articles...")
+        validated_data_from_articles = []
+        state = self.resume_state
+        if state:
+            self.open_site(state["resume_url"])
+            validated_data_from_articles.append(state["rows"])
+            self.captured_images.update(state["images"])
+            page = state["page"] + 1
+            yield state["rows"]
+        else:
+            page = 1
+            self.apply_search_state(categories_value, has_category)
+        if self.selector_health.get("enabled", False):
+            self.check_selectors()
+        articles_element = self.get_articles_element()
+        while self.is_article_in_range_time(
+                articles_element[-1], max_date):
+            validated_data_from_articles.append(
+                self.extract_page_data(articles_element, phrase, page, capture_pictures))
+            yield validated_data_from_articles[-1]
+            self.save_checkpoint(page, validated_data_from_articles)
+            if not self.go_to_next_page():
+                return
+            page += 1
+            time.sleep(1)
+            self.check_memory(page)
+            articles_element = self.get_articles_element()
+        if self.is_article_in_range_time(articles_element[0], max_date):
+            yield self.extract_page_data(
+                self.get_last_articles_in_range_time(articles_element, max_date),
+                phrase,
+                page,
+                capture_pictures)
+
+    def apply_search_state(self, categories_value: list, has_category: bool) -> None:
+        """
+        Sorts by newest and checks the categories with the page controls, when the URL did not.
+
+        :param categories_value: List of category values to filter articles by.
+        :param has_category: Boolean indicating if a category filter should be applied.
+        """
+        WebDriverWait(
+            self.driver, 10).until(
+            lambda driver: driver.execute_script(
+                Locator.ELEMENT_READY_STATE.value) == Locator.COMPLETE.value)
+        is_sorted, are_categories_checked = self.get_search_state(
+            categories_value if has_category else [])
+        if not is_sorted:
             self.sort_by_newest()
             WebDriverWait(
                 self.driver, 10).until(
                 lambda driver: driver.execute_script(
                     Locator.ELEMENT_READY_STATE.value) == Locator.COMPLETE.value)
-            if has_category:
-                self.open_categories()
-                self.check_categories(categories_values=categories_value)
-            articles_element = self.get_articles_element()
-            while self.is_article_in_range_time(
-                    articles_element[-1], max_date):
-                validated_data_from_articles.append(
-                    self.extract_useful_data_from_articles_element(
-                        articles_element, phrase))
-                if self.go_to_next_page():
-                    time.sleep(1)
-                    articles_element = self.get_articles_element()
-                else:
-                    return list(itertools.chain(*validated_data_from_articles))
-            if self.is_article_in_range_time(articles_element[0], max_date):
-                validated_data_from_articles.append(
-                    self.extract_useful_data_from_articles_element(
-                        self.get_last_articles_in_range_time(
-                            articles_element, max_date), phrase))
-        except ImportError:
-            logging.error("Error to extract articles")
-            return []
+        if has_category and not are_categories_checked:
+            self.open_categories()
+            self.check_categories(categories_values=categories_value)
+
+    def extract_page_data(
+            self,
+            articles_element: list,
+            phrase: str,
+            page: int,
+            capture_pictures: bool = True) -> list[dict]:
+        """
+        Extracts the data of the articles of the current page and records the page statistics.
 
-        return list(itertools.chain(*validated_data_from_articles))
+        The time of the page is measured from the navigation that opened it until its data and
+        pictures are extracted, and stored in `page_timings`. When the enrichment is enabled,
+        the article pages of the page are read before the browser leaves it (see
+        `ArticleDetailsEnricher`).
+
+        :param articles_element: List of article WebElements of the page.
+        :param phrase: The search phrase to count occurrences in article content.
+        :param page: Number of the results page.
+        :param capture_pictures: Whether to save the pictures of the page while on it.
+        :return: A list of dictionaries containing extracted data from each article.
+        """
+        if self.page_archive:
+            self.page_archive.save_page(self.driver.page_source, self.driver.current_url, page)
+        page_data = self.extract_useful_data_from_articles_element(articles_element, phrase)
+        if capture_pictures:
+            self.capture_pictures_in_page(page_data)
+        if self.article_details:
+            self.article_details.enrich(page_data, phrase)
+        self.collect_page_network_stats(page)
+        self.page_timings.append({
+            "page": page,
+            "seconds": round(time.monotonic() - self.page_started_at, 3),
+            "articles": len(page_data)})
+        overlays_suppressed = self.count_overlays_suppressed()
+        if overlays_suppressed:
+            self.overlays_suppressed += overlays_suppressed
+            logger.info(
+                "Page %d: %d overlays suppressed (%d in total)",
+                page, overlays_suppressed, self.overlays_suppressed)
+        return page_data
+
+    def get_search_state(self, categories_values: list) -> tuple[bool, bool]:
+        """
+        Checks, in a single script call, the state applied to the current results page.
+
+        :param categories_values: Values of the categories expected to be checked.
+        :return: Tuple indicating whether the results are sorted by newest and whether every
+            expected category is checked.
+        """
+        try:
+            is_sorted, are_categories_checked = self.driver.execute_script(
+                Script.VERIFY_SEARCH_STATE.value,
+                Locator.SORT_BY_XPATH.value,
+                SortBy.NEWEST.value,
+                categories_values)
+        except WebDriverException as exception:
+            logger.warning("Error verifying the search state: %s", exception)
+            return False, not categories_values
+        if not (is_sorted and are_categories_checked):
+            logger.warning(
+                "Search URL state not applied (sorted: %s, categories: %s), using the page controls",
+                is_sorted, are_categories_checked)
+        return is_sorted, are_categories_checked
+
+    def load_checkpoint(self) -> dict:
+        """
+        Loads the saved progress of the work item, when a checkpoint is set.
+
+        The progress is resumed by the next `iter_data_from_verified_articles_pages` call, so
+        the caller must not open the search when a progress is returned.
+
+        :return: The saved progress (see `CheckpointRepository.load`), or None.
+        """
+        self.resume_state = self.checkpoint.load() if self.checkpoint else None
+        return self.resume_state
+
+    def save_checkpoint(self, page: int, validated_data_from_articles: list[list]) -> None:
+        """
+        Saves the progress after a completed page, when a checkpoint is set.
+
+        Must be called while the browser is still on the completed page, before going to the
+        next one: the resume point is the URL of the next page, built from the URL of the
+        current one, so a browser failing on the way is resumed from the right page.
+
+        :param page: Number of the completed page.
+        :param validated_data_from_articles: Article data extracted so far, grouped by page.
+        """
+        if not self.checkpoint:
+            return
+        try:
+            self.checkpoint.save(
+                page,
+                define_page_url(self.driver.current_url, page + 1),
+                list(itertools.chain(*validated_data_from_articles)),
+                self.captured_images)
+        except (OSError, TypeError, ValueError) as exception:
+            logger.warning("Error saving checkpoint: %s", exception)
 
     def check_categories(self, categories_values: list, timeout=10) -> None:
         """
             Clicks on a checkbox based on the 'value' attribute.
             :param value: The 'value' attribute of the checkbox to click.
         """
-        logging.info((
+        logger.info(
             "Starting to find and click the checkbox with the values: %s",
-            ", ".join(categories_values)))
+            ", ".join(categories_values))
 
         try:
             self.close_cookies()
@@ -405,22 +953,22 @@ class CustomSelenium:
 
                 if checkbox and not checkbox.is_selected():
                     checkbox.click()
-                    logging.info((
-                        "Successfully clicked the checkbox with value: %s", value))
+                    logger.info(
+                        "Successfully clicked the checkbox with value: %s", value)
                 else:
-                    logging.warning((
-                        "Checkbox with value '%s' is already selected or not found.", value))
+                    logger.warning(
+                        "Checkbox with value '%s' is already selected or not found.", value)
         except NoSuchElementException:
-            logging.error("Overlay found trying again...")
+            logger.error("Overlay found trying again...")
             self.check_categories(categories_values, timeout=10)
         except ElementNotInteractableException:
             is_overlay_present = self.close_overlay()
             if is_overlay_present:
                 self.check_categories(categories_values)
         except ImportError as exception:
-            logging.error((
+            logger.error(
                 "An error occurred while trying to click the checkbox: %s",
-                exception))
+                exception)
 
         self.refresh_and_wait_for_categories()
 
@@ -436,7 +984,7 @@ class CustomSelenium:
             NoSuchElementException: If the sort dropdown is not found on the page.
             UnexpectedTagNameException: If the located element is not a <select> tag.
         """
-        logging.info("Attempting to sort items by 'Newest'.")
+        logger.info("Attempting to sort items by 'Newest'.")
 
         try:
             sort_by_element = self.driver.find_element(
@@ -444,12 +992,12 @@ class CustomSelenium:
             sort_by_ui = Select(sort_by_element)
             sort_by_ui.select_by_visible_text(SortBy.NEWEST.value)
             self.refresh_and_wait_for_sort_results()
-            logging.info(
+            logger.info(
                 "Page refreshed and waiting for results to be updated.")
 
         except ImportError as exception:
-            logging.error((
-                "An error occurred while attempting to sort by 'Newest': %s", exception))
+            logger.error(
+                "An error occurred while attempting to sort by 'Newest': %s", exception)
             raise
 
     def refresh_and_wait_for_sort_results(self, timeout=5):
@@ -461,17 +1009,17 @@ class CustomSelenium:
         """
         try:
             # Refresh the page
+            started_at = self.wait_for_request_slot()
             self.driver.refresh()
-            logging.info("Page refreshed")
+            logger.info("Page refreshed")
 
             WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(
-                    (By.CLASS_NAME, Locator.SEARCH_RESULTS_CLASS.value))
-            )
-            logging.info("Page result sorted")
+                lambda driver: find_all_with_chain(driver, SelectorChain.RESULTS))
+            self.report_request(started_at)
+            logger.info("Page result sorted")
 
         except ImportError:
-            logging.error("Error to sort page")
+            logger.error("Error to sort page")
 
     def refresh_and_wait_for_categories(self, timeout=5):
         """
@@ -482,41 +1030,54 @@ class CustomSelenium:
         """
         try:
             # Refresh the page
+            started_at = self.wait_for_request_slot()
             self.driver.refresh()
-            logging.info("Page refreshed")
+            logger.info("Page refreshed")
 
             WebDriverWait(self.driver, timeout).until(
                 EC.presence_of_element_located(
                     (By.XPATH, Locator.CATEGORIES_XPATH.value))
             )
-            logging.info("Categories element is fully loaded")
+            self.report_request(started_at)
+            logger.info("Categories element is fully loaded")
 
         except ImportError:
-            logging.error(
+            logger.error(
                 "Error waiting categories: Categories not found, your search is blank")
             raise
 
-    def get_articles_element(self, timeout=10):
+    def get_articles_element(self, timeout=10, retry=True):
         """
         Waits for and retrieves article elements from the page.
 
+        When the browser fails while reading the page, e.g. because its renderer was killed,
+        it is restarted on the results page last opened and the articles are read once more.
+
         :param timeout: Maximum time to wait for articles to load (in seconds).
+        :param retry: Whether to restart the browser and try again when it fails.
         :return: List of WebElements representing articles.
         """
         try:
-            logging.info("getting article")
-            WebDriverWait(
+            logger.info("getting article")
+            articles_scraped = WebDriverWait(
                 self.driver,
                 timeout).until(
-                EC.presence_of_element_located(
-                    (By.XPATH, Locator.ARTICLE_XPATH.value)))
-            articles_scraped = self.driver.find_elements(
-                By.XPATH, Locator.ARTICLE_XPATH.value)
+                lambda driver: find_all_with_chain(
+                    driver, SelectorChain.ARTICLE, self.selector_stats))
         except NoSuchElementException:
-            logging.error("No articles were found: stopping application")
+            logger.error("No articles were found: stopping application")
+            raise
+        except TimeoutException:
             raise
+        except WebDriverException as exception:
+            if not retry:
+                raise
+            logger.warning(
+                "The browser failed reading the articles, restarting it: %s", exception)
+            self.restart_driver(self.last_url)
+            return self.get_articles_element(timeout, retry=False)
         except ImportError:
-            logging.error("No articles were found: stopping application ")
+            logger.error("No articles were found: stopping application ")
             raise
 
         return articles_scraped
@@ -539,21 +1100,24 @@ class CustomSelenium:
             if articles_element:
                 for article_element in articles_element:
                     article_data = {
-                        "title": extract_title(article_element),
-                        "date": extract_date(article_element),
-                        "description": extract_description(article_element),
-                        "image_filename": extract_image_filename(article_element),
+                        "title": extract_title(article_element, self.selector_stats),
+                        "date": extract_date(article_element, self.selector_stats),
+                        "description": extract_description(
+                            article_element, self.selector_stats),
+                        "image_filename": extract_image_filename(
+                            article_element, self.selector_stats),
                         "search_count": extract_search_count(
                             article_element,
                             phrase),
                         "contains_money": extract_contains_money(article_element),
-                        "picture_url": self.extract_picture_url(article_element)}
+                        "picture_url": self.extract_picture_url(article_element),
+                        "url": extract_article_url(article_element, self.selector_stats)}
 
                     formated_data_articles.append(article_data)
             else:
                 return []
         except ImportError as exception:
-            logging.error(("Error extracting useful data: %s", exception ))
+            logger.error("Error extracting useful data: %s", exception)
 
         return formated_data_articles
 
@@ -568,7 +1132,8 @@ class CustomSelenium:
         try:
             for data_article in data_articles:
                 image_url = data_article["picture_url"]
-                if image_url:
+                if image_url and format_to_allowed_filename(
+                        data_article["image_filename"]) not in self.captured_images:
                     self.open_site(image_url)
                     file_name = format_to_allowed_filename(
                         data_article["image_filename"])
@@ -585,7 +1150,206 @@ class CustomSelenium:
                 time.sleep(0.5)
 
         except ImportError as exception:
-            logging.error(("Error downloading images: %s ", exception))
+            logger.error("Error downloading images: %s ", exception)
+
+    def capture_pictures_in_page(self, data_articles: list[dict], timeout=30) -> set[str]:
+        """
+        Saves the pictures of the given articles from the current results page.
+
+        The pictures are read with `read_pictures_in_page` and written straight to the images
+        directory. Pictures that could not be read are left to `download_pictures`.
+
+        :param data_articles: List of dictionaries containing article data including picture URLs.
+        :param timeout: Maximum time to wait for the script (in seconds).
+        :return: The set of file names saved.
+        """
+        captured = set()
+        for file_name, picture in self.read_pictures_in_page(data_articles, timeout).items():
+            try:
+                self.save_picture(file_name, picture)
+                captured.add(file_name)
+            except OSError as exception:
+                logger.warning("Error saving picture %s: %s", file_name, exception)
+        self.captured_images.update(captured)
+        return captured
+
+    def read_pictures_in_page(self, data_articles: list[dict], timeout=30) -> dict[str, bytes]:
+        """
+        Reads the pictures of the given articles from the current results page.
+
+        The pictures were already loaded by the page, so their bytes are read from the browser
+        cache in a single asynchronous script call, without navigating away from the page.
+        The pictures the script cannot fetch (a cross-origin response without CORS headers)
+        are read with `read_cached_resources`, as the browser stored them.
+        The caller adds the names of the pictures it saves to `captured_images`, so the ones
+        it fails to save are still downloaded by `download_pictures`.
+
+        :param data_articles: List of dictionaries containing article data including picture URLs.
+        :param timeout: Maximum time to wait for the script (in seconds).
+        :return: The bytes of each picture read, by file name.
+        """
+        if self.image_capture_mode != ImageCaptureMode.IN_PAGE:
+            return {}
+
+        pending_pictures = [
+            [data_article["picture_url"],
+             format_to_allowed_filename(data_article["image_filename"])]
+            for data_article in data_articles
+            if data_article["picture_url"] and data_article["image_filename"]
+            and format_to_allowed_filename(
+                data_article["image_filename"]) not in self.captured_images]
+        if not pending_pictures:
+            return {}
+
+        pictures = {}
+        unread_pictures = {}
+        started_at = self.wait_for_request_slot()
+        try:
+            self.driver.set_script_timeout(timeout)
+            results = self.driver.execute_async_script(
+                Script.CAPTURE_IMAGES.value, pending_pictures)
+            self.report_request(started_at)
+            for file_name, encoded_picture, loaded_url in results:
+                if encoded_picture:
+                    pictures[file_name] = base64.b64decode(encoded_picture)
+                else:
+                    unread_pictures[file_name] = loaded_url
+        except (WebDriverException, binascii.Error) as exception:
+            logger.warning("Error capturing pictures from page: %s", exception)
+        if unread_pictures:
+            pictures.update(self.read_cached_resources(unread_pictures))
+
+        logger.info(
+            "Captured %d of %d pictures from page", len(pictures), len(pending_pictures))
+        return pictures
+
+    def read_cached_resources(self, urls: dict[str, str]) -> dict[str, bytes]:
+        """
+        Reads resources loaded by the current page through the DevTools protocol.
+
+        `Page.getResourceContent` returns the bytes the browser received, whatever their origin,
+        so pictures the page script cannot fetch are still read as served, without a request.
+
+        :param urls: URL of each resource, by file name.
+        :return: The bytes of each resource read, by file name.
+        """
+        resources = {}
+        try:
+            self.driver.execute_cdp_cmd("Page.enable", {})
+            frame_id = self.driver.execute_cdp_cmd(
+                "Page.getFrameTree", {})["frameTree"]["frame"]["id"]
+        except (WebDriverException, KeyError) as exception:
+            logger.warning("Cached resources are not available: %s", exception)
+            return resources
+        for file_name, url in urls.items():
+            try:
+                resource = self.driver.execute_cdp_cmd(
+                    "Page.getResourceContent", {"frameId": frame_id, "url": url})
+                content = resource["content"]
+                resources[file_name] = (base64.b64decode(content) if resource["base64Encoded"]
+                                        else content.encode("utf-8"))
+            except (WebDriverException, KeyError, binascii.Error) as exception:
+                logger.debug("Resource %s is not cached: %s", url, exception)
+        return resources
+
+    def read_article_pages(self, urls: list[str], timeout=30) -> dict[str, str]:
+        """
+        Reads the HTML of several article pages, loading up to `article_tabs` of them at once.
+
+        Each page is opened in a new tab without waiting for it to load, so the pages of the
+        pool load in parallel; every tab is closed once its page is read, and the next URL is
+        opened in a new one. The results page stays open in its own tab, which is active
+        again when the method returns.
+
+        :param urls: URLs of the article pages.
+        :param timeout: Maximum time to wait for each page to load (in seconds).
+        :return: The HTML of each page read, by URL.
+        """
+        results_window = self.driver.current_window_handle
+        pending = list(urls)
+        open_tabs = {}
+        pages = {}
+        try:
+            while pending or open_tabs:
+                while pending and len(open_tabs) < self.article_tabs:
+                    url = pending.pop(0)
+                    started_at = self.wait_for_request_slot()
+                    windows = set(self.driver.window_handles)
+                    self.driver.switch_to.window(results_window)
+                    self.driver.execute_script(Script.OPEN_TAB.value, url)
+                    new_windows = set(self.driver.window_handles) - windows
+                    if not new_windows:
+                        logger.warning("Could not open a tab for %s", url)
+                        self.report_request(started_at, failed=True)
+                        continue
+                    open_tabs[new_windows.pop()] = (url, started_at)
+                for window, (url, started_at) in list(open_tabs.items()):
+                    loaded, failed = self.read_article_tab(window, url, started_at, timeout)
+                    if not (loaded or failed):
+                        continue
+                    if loaded:
+                        pages[url] = self.driver.page_source
+                    self.report_request(started_at, failed=failed)
+                    self.close_tab(window)
+                    del open_tabs[window]
+                if open_tabs:
+                    time.sleep(0.05)
+        finally:
+            for window in open_tabs:
+                self.close_tab(window)
+            self.driver.switch_to.window(results_window)
+        logger.info("Read %d of %d article pages", len(pages), len(urls))
+        return pages
+
+    def read_article_tab(
+            self,
+            window: str,
+            url: str,
+            started_at: float,
+            timeout=30) -> tuple[bool, bool]:
+        """
+        Switches to an article tab and checks whether its page finished loading.
+
+        :param window: Handle of the tab.
+        :param url: URL of the article page opened in the tab.
+        :param started_at: Time the page was opened.
+        :param timeout: Maximum time to wait for the page to load (in seconds).
+        :return: Whether the page is loaded, and whether it failed or timed out.
+        """
+        try:
+            self.driver.switch_to.window(window)
+            ready_state, location = self.driver.execute_script(Script.PAGE_LOAD_STATE.value)
+        except WebDriverException as exception:
+            logger.warning("Error reading article page %s: %s", url, exception)
+            return False, True
+        if ready_state == Locator.COMPLETE.value and location != "about:blank":
+            return True, False
+        if time.monotonic() - started_at > timeout:
+            logger.warning("Timeout loading article page %s", url)
+            return False, True
+        return False, False
+
+    def close_tab(self, window: str) -> None:
+        """
+        Closes a tab opened by `read_article_pages`.
+
+        :param window: Handle of the tab.
+        """
+        try:
+            self.driver.switch_to.window(window)
+            self.driver.close()
+        except WebDriverException as exception:
+            logger.warning("Error closing article tab: %s", exception)
+
+    def save_picture(self, file_name: str, picture: bytes) -> None:
+        """
+        Writes the bytes of a picture to the images directory.
+
+        :param file_name: File name of the picture.
+        :param picture: Bytes of the picture.
+        """
+        with open(os.path.join(self.images_dir, file_name), "wb") as file:
+            file.write(picture)
 
     def get_data_from_articles(self,
                                phrase: str,
@@ -633,7 +1397,7 @@ class CustomSelenium:
             return False
 
         except ImportError as e:
-            print(f"Element not found or an error occurred: {e}")
+            logger.warning("Element not found or an error occurred: %s", e)
             return False
 
     def extract_picture_url(self, element: WebElement, timeout=10) -> None:
@@ -646,10 +1410,8 @@ class CustomSelenium:
         try:
             WebDriverWait(
                 self.driver, timeout).until(
-                EC.presence_of_element_located(
-                    (By.CLASS_NAME, Locator.PAGE_PROMO_MEDIA_CLASS_NAME.value)))
-            div_image_element = element.find_element(
-                By.CLASS_NAME, Locator.PAGE_PROMO_MEDIA_CLASS_NAME.value)
+                lambda driver: find_all_with_chain(driver, SelectorChain.MEDIA))
+            div_image_element = find_with_chain(element, SelectorChain.MEDIA)
             picture_element = div_image_element.find_element(
                 By.TAG_NAME, Locator.PICTURE_TAG_NAME.value)
             img_url = picture_element.find_element(
@@ -657,104 +1419,123 @@ class CustomSelenium:
                 Locator.IMAGE_CLASS_NAME.value).get_attribute(
                 Locator.SOURCE.value)
         except NoSuchElementException:
-            logging.warning("Article without image")
+            article_logger.warning("Article without image")
             return None
 
         except ImportError as exception:
-            logging.error(("Error extracting picture url: %s", exception))
+            logger.error("Error extracting picture url: %s", exception)
             return None
 
         return img_url
 
 
 @staticmethod
-def extract_title(element: WebElement) -> str:
+def extract_title(element: WebElement, selector_stats: SelectorStats = None) -> str:
     """
     Extracts the title from the given article WebElement.
 
     :param element: The WebElement representing the article.
+    :param selector_stats: The statistics the selector matching the title is counted in.
     :return: The extracted title as a string.
     """
     try:
-        title_element = element.find_element(
-            By.CLASS_NAME, Locator.PAGE_PROMO_TITLE_CLASS_NAME.value)
+        title_element = find_with_chain(element, SelectorChain.TITLE, selector_stats)
         return title_element.text
 
     except NoSuchElementException:
-        logging.warning("Article without tittle")
+        article_logger.warning("Article without tittle")
         return "Article without tittle"
     except ImportError as e:
-        print(f"Error extracting title: {e}")
+        article_logger.error("Error extracting title: %s", e)
         return None
 
 
 @staticmethod
-def extract_date(element: WebElement) -> datetime:
+def extract_date(element: WebElement, selector_stats: SelectorStats = None) -> datetime:
     """
     Extracts the publication date from the given article WebElement.
 
     :param element: The WebElement representing the article.
+    :param selector_stats: The statistics the selector matching the date is counted in.
     :return: The extracted publication date as a datetime object.
     """
     try:
         date_article = datetime.fromtimestamp(
             (int(
-                element.find_element(
-                    By.TAG_NAME,
-                    Locator.TIMESTAMP_TAG_NAME.value).get_attribute(
+                find_with_chain(
+                    element,
+                    SelectorChain.DATE,
+                    selector_stats).get_attribute(
                     Locator.DATA_TIMESTAMP.value))) /
             1000.0)
 
         return date_article
     except NoSuchElementException:
-        logging.warning("Article without date")
+        article_logger.warning("Article without date")
         return datetime.now()
     except ImportError as exception:
-        logging.warning(("Error to extract article date: %s", exception))
+        article_logger.warning("Error to extract article date: %s", exception)
         return datetime.now()
 
 
 @staticmethod
-def extract_description(element: WebElement) -> str:
+def extract_description(element: WebElement, selector_stats: SelectorStats = None) -> str:
     """
     Extracts the description from the given article WebElement.
 
     :param element: The WebElement representing the article.
+    :param selector_stats: The statistics the selector matching the description is counted in.
     :return: The extracted description as a string.
     """
     try:
-        description_element = element.find_element(
-            By.CLASS_NAME, Locator.PAGE_PROMO_DESCRIPTION_CLASS_NAME.value)
+        description_element = find_with_chain(
+            element, SelectorChain.DESCRIPTION, selector_stats)
         return description_element.text
     except NoSuchElementException:
-        logging.warning("Article without description")
+        article_logger.warning("Article without description")
         return "Article without description"
     except ImportError as e:
-        print(f"Error extracting description: {e}")
+        article_logger.error("Error extracting description: %s", e)
         return None
 
 
 @staticmethod
-def extract_image_filename(element: WebElement) -> str:
+def extract_image_filename(element: WebElement, selector_stats: SelectorStats = None) -> str:
     """
     Extracts the image filename from the given article WebElement.
 
     :param element: The WebElement representing the article.
+    :param selector_stats: The statistics the selector matching the picture is counted in.
     :return: The extracted image filename as a string.
     """
     try:
-        div_image_element = element.find_element(
-            By.CLASS_NAME, Locator.PAGE_PROMO_MEDIA_CLASS_NAME.value)
+        div_image_element = find_with_chain(element, SelectorChain.MEDIA, selector_stats)
         filename = div_image_element.find_element(
             By.TAG_NAME, Locator.TAG_A.value).get_attribute(
             Locator.ARIA_LABEL.value)
         return format_to_allowed_filename(filename)
     except NoSuchElementException:
-        logging.warning("Article without image name")
+        article_logger.warning("Article without image name")
         return None
 
     except ImportError as e:
-        print(f"Error extracting image filename: {e}")
+        article_logger.error("Error extracting image filename: %s", e)
+        return None
+
+
+def extract_article_url(element: WebElement, selector_stats: SelectorStats = None) -> str:
+    """
+    Extracts the link to the article page from the given article WebElement.
+
+    :param element: The WebElement representing the article.
+    :param selector_stats: The statistics the selector matching the link is counted in.
+    :return: The absolute URL of the article page, or None when the card has no link.
+    """
+    try:
+        return find_with_chain(element, SelectorChain.LINK, selector_stats).get_attribute(
+            Locator.HREF.value)
+    except NoSuchElementException:
+        article_logger.warning("Article without link")
         return None
 
 
@@ -768,10 +1549,9 @@ def extract_search_count(element: WebElement, search_phrase: str,) -> int:
     :return: The count of occurrences of the search phrase.
     """
     try:
-        count_search_phrase = element.text.lower().count(search_phrase.lower())
-        return count_search_phrase
+        return count_search_phrase(element.text, search_phrase)
     except ImportError as e:
-        print(f"Error extracting search count: {e}")
+        article_logger.error("Error extracting search count: %s", e)
         return 0
 
 
@@ -784,19 +1564,47 @@ def extract_contains_money(element: WebElement) -> bool:
     :return: True if the article contains monetary values, False otherwise.
     """
     try:
-        text = element.text
-        money_patterns = [
-            r'\$\d+(?:\.\d+)?',
-            r'\$\d{1,3}(?:,\d{3})+(?:\.\d{2})',
-            r'\b\d+\s+dollars\b',
-            r'\b\d+\s+USD\b'
-        ]
-
-        patterns = [re.compile(pattern, re.IGNORECASE)
-                    for pattern in money_patterns]
-        contains_money = any(pattern.search(text) for pattern in patterns)
-
-        return contains_money
+        return contains_money(element.text)
     except ImportError as e:
-        print(f"Error checking for money formats: {e}")
+        article_logger.error("Error checking for money formats: %s", e)
         return False
+
+
+def find_with_chain(context, chain: SelectorChain, selector_stats: SelectorStats = None):
+    """
+    Finds the first element matched by the selectors of a chain, tried in order.
+
+    :param context: The WebDriver or WebElement to search from.
+    :param chain: The chain of XPath selectors of the field.
+    :param selector_stats: The statistics the matching selector is counted in.
+    :return: The WebElement found.
+    :raises NoSuchElementException: When no selector of the chain matches, like `find_element`.
+    """
+    for index, xpath in enumerate(chain.value):
+        elements = context.find_elements(By.XPATH, xpath)
+        if elements:
+            if selector_stats:
+                selector_stats.record(chain, index)
+            return elements[0]
+    if selector_stats:
+        selector_stats.record(chain, None)
+    raise NoSuchElementException(f"No selector of {chain.name} matched")
+
+
+def find_all_with_chain(
+        context, chain: SelectorChain, selector_stats: SelectorStats = None) -> list:
+    """
+    Finds the elements matched by the first selector of a chain that matches any.
+
+    :param context: The WebDriver or WebElement to search from.
+    :param chain: The chain of XPath selectors of the field.
+    :param selector_stats: The statistics the matching selector is counted in.
+    :return: The WebElements found, an empty list when no selector matches.
+    """
+    for index, xpath in enumerate(chain.value):
+        elements = context.find_elements(By.XPATH, xpath)
+        if elements:
+            if selector_stats:
+                selector_stats.record(chain, index)
+            return elements
+    return []
@@ -1,17 +1,21 @@
 """ Article logical Implementation 
 
 """
-from frameworks_drivers.gateways.article_scraper_gateway import ArticleScraper
+from typing import TYPE_CHECKING
+
 from interfaces.gateways.article_interface import ArticleInterface
-from entities.article_entity import Article
+from entities.article_batch_entity import ArticleBatch
+
+if TYPE_CHECKING:
+    from frameworks_drivers.gateways.article_scraper_gateway import ArticleScraper
 
 class ArticleGateway(ArticleInterface):
     """ Classe responsible for the implementation of the interface Article
     """
-    def __init__(self, scraper: ArticleScraper ):
+    def __init__(self, scraper: "ArticleScraper"):
         self.scraper = scraper
 
-    def return_articles(self) -> list[Article]:
-        """ List[Article]: a list of articles"""
+    def return_articles(self) -> ArticleBatch:
+        """ ArticleBatch: a batch of articles"""
         return self.scraper.scrape_news()
     
\ No newline at end of file
@@ -0,0 +1,330 @@
+""" Responsible to implement the logical to scraping the news site without a browser
+
+The search results pages are fetched with a pooled HTTP client and parsed with the same
+`Locator` selectors used by the browser. When a page only renders with JavaScript, or when the
+HTTP client or the parser are not installed, the scrape falls back to `ArticleScraper`. When a
+later page fails, the browser continues from that page: the pages already parsed are handed
+over as its checkpoint, and the pages it reads are added to the same page archive.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+import time
+from urllib.parse import urljoin
+
+from frameworks_drivers.gateways.article_params_gateway import ParamsGateway
+from frameworks_drivers.gateways.article_scraper_gateway import (
+    ArticleScraper,
+    convert_to_articles_batch,
+    create_page_archive,
+    create_run_report,
+    get_category_values,
+    get_link_with_phrase_searched,
+)
+from frameworks_drivers.drivers import html_page_parser
+from frameworks_drivers.drivers.article_details import ArticleDetailsEnricher
+from frameworks_drivers.drivers.rate_limiter import SharedRateLimiter
+from frameworks_drivers.drivers.selector_health import (
+    SelectorHealthError,
+    SelectorStats,
+    build_health_report,
+)
+from frameworks_drivers.repositories.category_cache_repository import CategoryCacheRepository
+from interfaces.gateways.article_scraper_interface import ArticleScraperInterface
+from entities.article_batch_entity import ArticleBatch
+from utils.enums.selenium_enum import SortByUrlValue
+from utils.strings_utils import define_page_url, format_to_allowed_filename
+import utils.date_utils
+import utils.dir_utils
+import utils.values_utils
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+logger = logging.getLogger(__name__)
+
+
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+
+_session = None
+
+
+def get_session():
+    """
+    Returns the HTTP session shared by every scrape of the process.
+
+    The session keeps a pool of open connections, so consecutive pages and pictures reuse
+    the same TCP and TLS connections.
+    """
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=2)
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+        _session.headers["User-Agent"] = USER_AGENT
+    return _session
+
+
+class ArticleHttpScraper(ArticleScraperInterface):
+    """ Class of ArticleHttpScraper, responsible to scrape the articles without a browser
+    """
+
+    def __init__(self, search_params: ParamsGateway, timeout: int = 30):
+        self.search_params = search_params
+        self.timeout = timeout
+        self.page_archive = create_page_archive(search_params)
+        self.failed_page = None
+        self.page_timings = []
+        self.selector_health = utils.values_utils.get_selector_health_value()
+        self.selector_report = None
+        self.selector_stats = SelectorStats()
+        self.rate_limiter = SharedRateLimiter.from_settings(
+            utils.values_utils.get_rate_limiter_value(),
+            utils.values_utils.get_state_dir_value())
+        article_details = utils.values_utils.get_article_details_value()
+        self.article_workers = max(1, article_details.get("concurrency", 4))
+        self.article_details = ArticleDetailsEnricher.from_settings(
+            self.fetch_article_pages, article_details, self.selector_stats)
+
+    def scrape_news(self) -> ArticleBatch:
+        """Function to scrape data from a news, with the browser only when needed"""
+        articles = None
+        if requests is not None and html_page_parser.is_available():
+            run_report = create_run_report("http", self.search_params)
+            try:
+                articles = self.fetch_article(self.search_params)
+            except SelectorHealthError:
+                run_report.add_selector_health(
+                    self.selector_report, self.selector_stats.as_dict())
+                run_report.save(0, failed=True)
+                raise
+            finally:
+                if articles is not None:
+                    run_report.add_pages(self.page_timings, [])
+                    run_report.add_selector_health(
+                        self.selector_report, self.selector_stats.as_dict())
+                    if self.article_details:
+                        run_report.add_article_details(self.article_details.stats)
+                    run_report.save(len(articles))
+        else:
+            logger.warning("HTTP client or HTML parser not installed")
+        if articles is None:
+            browser_scraper = ArticleScraper(self.search_params, self.page_archive)
+            if self.failed_page:
+                page_number, url, articles_data = self.failed_page
+                browser_scraper.create_checkpoint().save(
+                    page_number - 1, define_page_url(url, page_number), articles_data, set())
+                logger.warning(
+                    "Continuing from page %d with the browser scraper", page_number)
+            else:
+                logger.warning("Falling back to the browser scraper")
+            return browser_scraper.scrape_news()
+        return articles
+
+    def fetch_article(self, search_params: ParamsGateway) -> ArticleBatch:
+        """
+        Fetches the articles within the months searched and downloads their pictures.
+
+        Args:
+            search_params (ParamsGateway): The search parameters.
+
+        Returns:
+            ArticleBatch: The articles, or None when the pages cannot be read without a browser.
+        """
+        articles_data = self.fetch_articles_data(search_params)
+        if articles_data is None:
+            return None
+        self.download_pictures(articles_data)
+        return convert_to_articles_batch(articles_data)
+
+    def fetch_articles_data(self, search_params: ParamsGateway) -> list[dict]:
+        """
+        Fetches and parses the search results pages within the months searched.
+
+        Args:
+            search_params (ParamsGateway): The search parameters.
+
+        Returns:
+            list[dict]: The article data dictionaries, or None when the pages cannot be read
+            without a browser. When a page after the first one fails, its number, its URL
+            and the article data of the previous pages are kept in `failed_page`.
+        """
+        logger.info("Starting HTTP Scraping.....")
+        categories_value, has_category = get_category_values(
+            self.load_categories_site(search_params), search_params.categories)
+        max_date = utils.date_utils.return_current_month_plus_next_months(
+            search_params.current_month_plus - 1)
+        url = get_link_with_phrase_searched(
+            search_params.phrase,
+            sort_by=SortByUrlValue.NEWEST,
+            categories_value=categories_value if has_category else None)
+
+        articles_data = []
+        page_number = 0
+        while url:
+            page_number += 1
+            started_at = time.monotonic()
+            page = self.fetch_page(url, search_params.phrase, page_number)
+            if page is None:
+                if page_number > 1:
+                    self.failed_page = (page_number, url, articles_data)
+                return None
+            articles_in_range, has_next_page = html_page_parser.parse_articles_in_range(
+                page["articles"], max_date)
+            if self.article_details:
+                self.article_details.enrich(articles_in_range, search_params.phrase)
+            articles_data.extend(articles_in_range)
+            self.page_timings.append({
+                "page": page_number,
+                "seconds": round(time.monotonic() - started_at, 3),
+                "articles": len(articles_in_range)})
+            logger.info("Page %s: %d articles in range", url, len(articles_in_range))
+            url = urljoin(url, page["next_page_url"]) \
+                if has_next_page and page["next_page_url"] else None
+        return articles_data
+
+    def fetch_page(self, url: str, phrase: str, page_number: int = None) -> dict:
+        """
+        Fetches and parses a search results page.
+
+        Args:
+            url (str): URL of the page.
+            phrase (str): The search phrase to count occurrences in article content.
+            page_number (int, optional): Number of the results page, to archive it.
+
+        Returns:
+            dict: The parsed page (see `html_page_parser.parse_search_results_page`), or None
+            when it could not be fetched or needs JavaScript.
+        """
+        content = self.get(url)
+        if content is None:
+            return None
+        page = html_page_parser.parse_search_results_page(content, phrase, self.selector_stats)
+        if page is None:
+            logger.warning("Page %s needs JavaScript to render its results", url)
+            return None
+        if page_number == 1 and self.selector_health.get("enabled", False):
+            self.check_selectors(content)
+        for article_data in page["articles"]:
+            if article_data["picture_url"]:
+                article_data["picture_url"] = urljoin(url, article_data["picture_url"])
+            if article_data["url"]:
+                article_data["url"] = urljoin(url, article_data["url"])
+        if self.page_archive and page_number:
+            self.page_archive.save_page(content.decode("utf-8", "replace"), url, page_number)
+        return page
+
+    def check_selectors(self, content: bytes) -> dict:
+        """
+        Probes the selectors of every field on the first results page.
+
+        Args:
+            content (bytes): HTML of the page.
+
+        Returns:
+            dict: The health report (see `selector_health.build_health_report`).
+
+        Raises:
+            SelectorHealthError: When a critical field no longer matches.
+        """
+        self.selector_report = build_health_report(
+            html_page_parser.probe_page(content, self.selector_health.get("sample", 20)),
+            self.selector_health.get("min_coverage", 0.5))
+        for warning in self.selector_report["warnings"]:
+            logger.warning("Selector health: %s", warning)
+        if not self.selector_report["healthy"]:
+            raise SelectorHealthError(self.selector_report)
+        return self.selector_report
+
+    def load_categories_site(self, search_params: ParamsGateway) -> dict:
+        """
+        Returns the category map of the site, from the cache or from a plain search page.
+
+        Args:
+            search_params (ParamsGateway): The search parameters.
+
+        Returns:
+            dict: Dictionary mapping category names to values.
+        """
+        if not search_params.categories:
+            return {}
+        site = utils.values_utils.get_url_value()
+        category_cache = CategoryCacheRepository(
+            utils.values_utils.get_category_cache_ttl_value())
+        categories_site = category_cache.get(site)
+        if categories_site is None:
+            page = self.fetch_page(
+                get_link_with_phrase_searched(search_params.phrase), search_params.phrase)
+            categories_site = page["categories"] if page else {}
+            if categories_site:
+                category_cache.save(site, categories_site)
+        return categories_site
+
+    def fetch_article_pages(self, urls: list[str]) -> dict[str, bytes]:
+        """
+        Fetches several article pages at once, with up to `article_workers` requests in flight.
+
+        Args:
+            urls (list[str]): URLs of the article pages.
+
+        Returns:
+            dict[str, bytes]: The HTML of each page fetched, by URL.
+        """
+        with ThreadPoolExecutor(
+                min(self.article_workers, len(urls)) or 1,
+                thread_name_prefix="article-pages") as executor:
+            contents = executor.map(self.get, urls)
+            return {url: content for url, content in zip(urls, contents)
+                    if content is not None}
+
+    def download_pictures(self, articles_data: list[dict]) -> None:
+        """
+        Downloads the pictures of the articles into the images directory.
+
+        Args:
+            articles_data (list[dict]): Article data including picture URLs.
+        """
+        images_dir = utils.dir_utils.create_new_dir_to_save_images(
+            utils.values_utils.get_output_dir_value())
+        for article_data in articles_data:
+            if not (article_data["picture_url"] and article_data["image_filename"]):
+                continue
+            picture = self.get(article_data["picture_url"])
+            if picture is None:
+                continue
+            file_name = format_to_allowed_filename(article_data["image_filename"])
+            try:
+                with open(os.path.join(images_dir, file_name), "wb") as file:
+                    file.write(picture)
+            except OSError as exception:
+                logger.warning("Error saving picture %s: %s", file_name, exception)
+
+    def get(self, url: str) -> bytes:
+        """
+        Requests a URL through the shared rate limiter.
+
+        Args:
+            url (str): The URL to request.
+
+        Returns:
+            bytes: The response body, or None when the request failed.
+        """
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        started_at = time.monotonic()
+        try:
+            response = get_session().get(url, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.RequestException as exception:
+            logger.warning("Error requesting %s: %s", url, exception)
+            if self.rate_limiter:
+                self.rate_limiter.record(time.monotonic() - started_at, failed=True)
+            return None
+        if self.rate_limiter:
+            self.rate_limiter.record(time.monotonic() - started_at)
+        return response.content
@@ -0,0 +1,102 @@
+""" Responsible to implement the logical to re-extract the articles of an archived run
+
+The results pages archived by `PageArchiveRepository` are parsed again with the current
+extraction code, without a browser and without network access. When the enrichment is enabled,
+the articles are completed with the details of their article pages kept in the cache.
+
+Long runs are parsed in a pool of processes, the pages being handed over through a spool file
+instead of being pickled (see `SpooledPageParser`).
+"""
+from datetime import datetime
+import logging
+import os
+
+from frameworks_drivers.drivers import html_page_parser
+from frameworks_drivers.drivers.article_details import ArticleDetailsEnricher
+from frameworks_drivers.drivers.page_spool import SpooledPageParser
+from frameworks_drivers.gateways.article_scraper_gateway import convert_to_articles_batch
+from frameworks_drivers.repositories.page_archive_repository import PageArchiveRepository
+from interfaces.gateways.article_scraper_interface import ArticleScraperInterface
+from entities.article_batch_entity import ArticleBatch
+import utils.date_utils
+import utils.values_utils
+
+logger = logging.getLogger(__name__)
+
+
+class ArticleReplayScraper(ArticleScraperInterface):
+    """ Class of ArticleReplayScraper, responsible to re-extract the articles of an archived run
+    """
+
+    def __init__(self, archive: PageArchiveRepository):
+        self.archive = archive
+
+    def scrape_news(self) -> ArticleBatch:
+        """Function to re-extract the articles of the archived run"""
+        return self.fetch_article(self.archive.query)
+
+    def fetch_article(self, search_params) -> ArticleBatch:
+        """
+        Re-extracts the articles within the months searched from the archived pages.
+
+        The months are counted back from the time each page was archived, not from now, so
+        the replay keeps the articles the original run kept.
+
+        Args:
+            search_params (dict): Search parameters stored with the archive, with the keys
+                `phrase` and `months`.
+
+        Returns:
+            ArticleBatch: The articles extracted from the archived pages.
+        """
+        if not html_page_parser.is_available():
+            raise RuntimeError("lxml is required to replay archived pages")
+        logger.info("Replaying archived run %s", self.archive.run_id)
+        article_details = ArticleDetailsEnricher.from_settings(
+            None, utils.values_utils.get_article_details_value())
+        articles_data = []
+        for entry, page in self.parse_pages(search_params.get("phrase") or ""):
+            if page is None:
+                logger.warning("Archived page %d has no results", entry["page"])
+                continue
+            max_date = utils.date_utils.return_current_month_plus_next_months(
+                search_params.get("months", 1) - 1,
+                datetime.fromtimestamp(entry["timestamp"]))
+            articles_in_range, _ = html_page_parser.parse_articles_in_range(
+                page["articles"], max_date)
+            if article_details:
+                article_details.enrich(articles_in_range, search_params.get("phrase") or "")
+            articles_data.extend(articles_in_range)
+        logger.info(
+            "Replayed %d articles from run %s", len(articles_data), self.archive.run_id)
+        return convert_to_articles_batch(articles_data)
+
+    def parse_pages(self, phrase: str):
+        """
+        Yields the metadata and the parsed content of each archived page, in page order.
+
+        Runs with at least `min_pages` pages are parsed by a `SpooledPageParser` of `workers`
+        processes (every CPU when 0), the next pages being decompressed while the first ones
+        are parsed; shorter runs, and hosts with a single CPU, are parsed in this process,
+        where starting the pool would cost more than it saves.
+
+        Args:
+            phrase (str): The search phrase to count occurrences in article content.
+        """
+        settings = utils.values_utils.get_parser_pool_value()
+        pages = len(self.archive.read_index())
+        workers = min(settings.get("workers") or os.cpu_count() or 1, pages)
+        if not settings.get("enabled", False) or pages < settings.get("min_pages", 8) \
+                or workers < 2:
+            for entry, content in self.archive.iter_pages():
+                yield entry, html_page_parser.parse_search_results_page(content, phrase)
+            return
+
+        logger.info("Parsing %d archived pages in %d processes", pages, workers)
+        with SpooledPageParser(
+                os.path.join(utils.values_utils.get_output_dir_value(), "page_spool"),
+                workers) as parser:
+            parsed_pages = [(entry, parser.submit(content, phrase))
+                            for entry, content in self.archive.iter_pages()]
+            for entry, parsed_page in parsed_pages:
+                yield entry, parsed_page.result()
@@ -1,41 +1,306 @@
 """ Responsible to implement the logical to scraping the news site
+
+Selenium is only imported when a browser is started (see `create_browser`), so the HTTP and
+replay scrapers, which reuse the helpers of this module, and runs answered from the cache or the
+index do not pay for importing it.
 """
 import logging
+import queue
+from typing import TYPE_CHECKING
+from urllib.parse import urlencode
 from  frameworks_drivers.gateways.article_params_gateway import ParamsGateway
-from frameworks_drivers.drivers.selenium_driver import CustomSelenium
-import utils.mappers_utils
+from frameworks_drivers.repositories.checkpoint_repository import CheckpointRepository
+from frameworks_drivers.repositories.category_cache_repository import CategoryCacheRepository
+from frameworks_drivers.repositories.page_archive_repository import PageArchiveRepository
+from frameworks_drivers.repositories.run_report_repository import RunReportRepository
 import utils.values_utils
 import utils.date_utils
+from utils.enums.selenium_enum import SearchUrlParam, SortByUrlValue
+
+from entities.article_batch_entity import ArticleBatch
+
+if TYPE_CHECKING:
+    from frameworks_drivers.drivers.selenium_driver import CustomSelenium
 
-from entities.article_entity import Article
+logger = logging.getLogger(__name__)
 
 
+# Longest time (in seconds) to wait for the pictures of a page to be written by the caller.
+PICTURES_WRITTEN_TIMEOUT = 60
+
 
 class ArticleScraper:
     """ Class of ArticleScraper, responsible to ensure the scraping of a article
     """
 
-    def __init__(self, search_params: ParamsGateway):
+    def __init__(self, search_params: ParamsGateway,
+                 page_archive: PageArchiveRepository = None):
         self.search_params = search_params
+        self.page_archive = page_archive
 
-    def scrape_news(self) -> list[Article]:
+    def scrape_news(self) -> ArticleBatch:
         """Function to scrape data from a news """
-        logging.info("Starting Scraping.....")
-        browser = CustomSelenium()
+        logger.info("Starting Scraping.....")
+        run_report = create_run_report("browser", self.search_params)
+        checkpoint = self.create_checkpoint()
+        browser = create_browser(
+            checkpoint, self.page_archive or create_page_archive(self.search_params))
+        articles_data = None
+        try:
+            categories_value, has_category = self.start_search(browser)
+            articles_data = browser.get_data_from_articles(
+                self.search_params.phrase,
+                self.define_max_date(),
+                categories_value,
+                has_category
+            )
+            checkpoint.clear()
+        finally:
+            if articles_data is None:
+                # The browser quits itself once the articles are read; it also holds the
+                # browser profile slot, so it must not outlive a failed run.
+                browser.driver_quit()
+            save_browser_run_report(
+                run_report, browser, len(articles_data or []), failed=articles_data is None)
+        return convert_to_articles_batch(articles_data)
+
+    def iter_news_pages(self, written_pictures: queue.Queue = None):
+        """
+        Scrapes the news one results page at a time.
+
+        Yields, for each page, the article data dictionaries and the bytes of the pictures
+        read from the page, by file name. Pictures that could not be read from the pages are
+        downloaded once every page has been scraped. The browser is quit when the generator
+        finishes or is closed, so it must be consumed or closed from a single thread.
+
+        Args:
+            written_pictures (queue.Queue, optional): Queue the caller puts, for each page
+                yielded, the set of file names of the pictures it wrote, or None when it stops.
+                Only the pictures written count as captured, so the others are downloaded.
+                When not given, every picture yielded counts as captured.
+        """
+        logger.info("Starting Scraping.....")
+        run_report = create_run_report("browser", self.search_params)
+        checkpoint = self.create_checkpoint()
+        browser = create_browser(
+            checkpoint, self.page_archive or create_page_archive(self.search_params))
+        articles_data = []
+        completed = False
+        pages_pending = 0
+        try:
+            categories_value, has_category = self.start_search(browser)
+            for page_data in browser.iter_data_from_verified_articles_pages(
+                    self.define_max_date(),
+                    categories_value,
+                    has_category,
+                    self.search_params.phrase,
+                    capture_pictures=False):
+                articles_data.extend(page_data)
+                pictures = browser.read_pictures_in_page(page_data)
+                if written_pictures is None:
+                    browser.captured_images.update(pictures)
+                yield page_data, pictures
+                if written_pictures is not None:
+                    pages_pending += 1
+                    pages_pending -= mark_written_pictures(
+                        browser, written_pictures, pages_pending, wait=False)
+            if written_pictures is not None:
+                mark_written_pictures(browser, written_pictures, pages_pending, wait=True)
+            browser.download_pictures(articles_data)
+            checkpoint.clear()
+            completed = True
+        finally:
+            browser.driver_quit()
+            save_browser_run_report(run_report, browser, len(articles_data), failed=not completed)
+
+    def create_checkpoint(self) -> CheckpointRepository:
+        """Creates the checkpoint of the work item defined by the search parameters"""
+        return CheckpointRepository(
+            CheckpointRepository.define_checkpoint_key(
+                self.search_params.phrase,
+                self.search_params.categories,
+                self.search_params.current_month_plus))
+
+    def define_max_date(self):
+        """Returns the oldest date of the months searched"""
+        return utils.date_utils.return_current_month_plus_next_months(
+            self.search_params.current_month_plus - 1)
+
+    def start_search(self, browser: "CustomSelenium") -> tuple[list, bool]:
+        """
+        Opens the search, unless the browser resumes the saved progress of the work item.
+
+        A resumed scrape opens the results page it stopped at, so neither the categories nor
+        the search state are needed.
+
+        Returns:
+            tuple[list, bool]: List of valid category values and a boolean indicating success.
+        """
+        if browser.load_checkpoint():
+            return [], False
+        return self.open_search(browser)
+
+    def open_search(self, browser: "CustomSelenium") -> tuple[list, bool]:
+        """
+        Opens the results page sorted by newest and filtered by the requested categories.
+
+        Returns:
+            tuple[list, bool]: List of valid category values and a boolean indicating success.
+        """
+        categories_value, has_category = get_category_values(
+            load_categories_site(
+                browser, self.search_params.phrase, self.search_params.categories),
+            self.search_params.categories)
         browser.open_site(
             get_link_with_phrase_searched(
-                self.search_params.phrase))
+                self.search_params.phrase,
+                sort_by=SortByUrlValue.NEWEST,
+                categories_value=categories_value if has_category else None))
+        return categories_value, has_category
+
+
+def create_browser(
+        checkpoint: CheckpointRepository,
+        page_archive: PageArchiveRepository) -> "CustomSelenium":
+    """
+    Starts the browser, importing Selenium on first use.
+
+    Args:
+        checkpoint (CheckpointRepository): The checkpoint of the work item.
+        page_archive (PageArchiveRepository): The archive of the run, or None.
+
+    Returns:
+        CustomSelenium: The browser.
+    """
+    # pylint: disable=import-outside-toplevel
+    from frameworks_drivers.drivers.selenium_driver import CustomSelenium
+    return CustomSelenium(checkpoint, page_archive)
+
+
+def mark_written_pictures(
+        browser: "CustomSelenium",
+        written_pictures: queue.Queue,
+        pages: int,
+        wait: bool) -> int:
+    """
+    Marks the pictures reported as written by the caller of `iter_news_pages` as captured.
+
+    Args:
+        browser (CustomSelenium): The browser whose `captured_images` are updated.
+        written_pictures (queue.Queue): The queue of the file names written for each page.
+        pages (int): Number of pages yielded and not reported yet.
+        wait (bool): Whether to wait for every page to be reported.
+
+    Returns:
+        int: The number of pages reported.
+    """
+    reported = 0
+    while reported < pages:
+        try:
+            if wait:
+                names = written_pictures.get(timeout=PICTURES_WRITTEN_TIMEOUT)
+            else:
+                names = written_pictures.get_nowait()
+        except queue.Empty:
+            if wait:
+                logger.warning(
+                    "The pictures of %d pages were not reported as written", pages - reported)
+            break
+        if names is None:
+            break
+        browser.captured_images.update(names)
+        reported += 1
+    return reported
+
+
+def create_page_archive(search_params: ParamsGateway) -> PageArchiveRepository:
+    """
+    Creates the archive of the results pages of a run, when archiving is enabled.
+
+    Args:
+        search_params (ParamsGateway): The search parameters of the run.
+
+    Returns:
+        PageArchiveRepository: The archive of the run, or None when archiving is disabled.
+    """
+    if not utils.values_utils.get_archive_pages_value():
+        return None
+    return PageArchiveRepository.create_run(
+        search_params.phrase,
+        search_params.categories,
+        search_params.current_month_plus)
+
+
+def create_run_report(engine: str, search_params: ParamsGateway) -> RunReportRepository:
+    """
+    Creates the report of a run, written to the output directory when the run finishes.
+
+    Args:
+        engine (str): Name of the scraper running, e.g. "browser" or "http".
+        search_params (ParamsGateway): The search parameters of the run.
+
+    Returns:
+        RunReportRepository: The report of the run.
+    """
+    return RunReportRepository(
+        engine,
+        search_params.phrase,
+        search_params.categories,
+        search_params.current_month_plus)
+
+
+def save_browser_run_report(
+        run_report: RunReportRepository,
+        browser: "CustomSelenium",
+        articles: int,
+        failed: bool) -> None:
+    """
+    Completes the report of a browser run with the statistics of the browser and writes it.
+
+    Args:
+        run_report (RunReportRepository): The report of the run.
+        browser (CustomSelenium): The browser of the run, already quit.
+        articles (int): Number of articles extracted.
+        failed (bool): Whether the run ended with an error.
+    """
+    run_report.add_pages(browser.page_timings, browser.page_network_stats)
+    run_report.add_memory_timeline(browser.memory_timeline, browser.browser_restarts)
+    run_report.add_selector_health(browser.selector_report, browser.selector_stats.as_dict())
+    if browser.article_details:
+        run_report.add_article_details(browser.article_details.stats)
+    run_report.save(articles, failed=failed)
+
+
+def load_categories_site(
+        browser: "CustomSelenium",
+        phrase: str,
+        categories_param: str) -> dict:
+    """
+    Returns the category map of the site, reading it from the browser only when needed.
+
+    Nothing is read when no category was requested. Otherwise the cached map is used while it
+    is fresh, and the map read from the search page is cached for the next runs.
+
+    Args:
+        browser (CustomSelenium): Browser used when the map must be read from the site.
+        phrase (str): Search phrase, used to open a search page holding the category filter.
+        categories_param (str): Comma-separated string of category names.
+
+    Returns:
+        dict: Dictionary mapping category names to values.
+    """
+    if not categories_param:
+        return {}
+    site = utils.values_utils.get_url_value()
+    category_cache = CategoryCacheRepository(
+        utils.values_utils.get_category_cache_ttl_value())
+    categories_site = category_cache.get(site)
+    if categories_site is None:
+        browser.open_site(get_link_with_phrase_searched(phrase))
         categories_site = browser.get_categories()
-        categories_value, has_category = get_category_values(
-            categories_site, self.search_params.categories)
-        articles_data = browser.get_data_from_articles(
-            self.search_params.phrase,
-            utils.date_utils.return_current_month_plus_next_months(
-                self.search_params.current_month_plus - 1),
-            categories_value,
-            has_category
-        )
-        return convert_to_list_articles_entity(articles_data)
+        if categories_site:
+            category_cache.save(site, categories_site)
+    return categories_site
 
 
 def get_category_values(categories_site: dict,
@@ -65,57 +330,61 @@ def get_category_values(categories_site: dict,
             return checked_categories_values, True
 
         if unchecked_categories:
-            logging.warning(
+            logger.warning(
                 "Categories not found: %s",
                 ", ".join(unchecked_categories))
         return None, False
     except AttributeError:
-        logging.warning("Categories was not filled")
+        logger.warning("Categories was not filled")
         return None, False
     except TypeError:
-        logging.warning("Categories was not filled")
+        logger.warning("Categories was not filled")
         return None, False
 
 
-def convert_to_list_articles_entity(articles_data) -> list[Article]:
+def convert_to_articles_batch(articles_data) -> ArticleBatch:
     """
-    Converts a list of article data dictionaries to Article entities.
+    Converts a list of article data dictionaries to a columnar batch of articles.
 
     Args:
         articles_data (list[dict]): List of article data dictionaries.
 
     Returns:
-        list[Article]: List of Article entities or an empty list if an error occurs.
+        ArticleBatch: Batch of articles or an empty batch if an error occurs.
     """
-    article_entity_list: list[Article] = []
     try:
-        for article_data in articles_data:
-            article_entity_list.append(
-                utils.mappers_utils.map_object_to_article_entity(
-                    title=article_data["title"],
-                    date=article_data["date"],
-                    description=article_data["description"],
-                    image_filename=article_data["image_filename"],
-                    search_count=article_data["search_count"],
-                    contains_money=article_data["contains_money"]))
-
-    except ImportError:
-        logging.error("Error to convert to articles entity")
-        return []
+        return ArticleBatch.from_rows(articles_data)
+    except (KeyError, TypeError, AttributeError):
+        logger.error("Error to convert to articles entity")
+        return ArticleBatch()
 
-    return article_entity_list
 
-
-def get_link_with_phrase_searched(phrase):
+def get_link_with_phrase_searched(
+        phrase,
+        sort_by: SortByUrlValue = SortByUrlValue.RELEVANCE,
+        categories_value: list = None,
+        page: int = None):
     """
-    Creates a search URL with the given phrase.
+    Creates a search URL with the given phrase and the state of the results page.
+
+    Encoding the sort order, the categories and the page in the URL reaches the wanted
+    results page with a single navigation instead of interacting with the page controls.
 
     Args:
         phrase (str): Search phrase.
+        sort_by (SortByUrlValue): Sorting option of the results.
+        categories_value (list): Values of the categories to select.
+        page (int): Number of the results page, the first page when not given.
 
     Returns:
         str: Constructed search URL.
     """
     if phrase == "":
         phrase = "..."
-    return f"{utils.values_utils.get_url_value()}search?q={phrase}&s=0"
+    query = [(SearchUrlParam.QUERY.value, phrase),
+             (SearchUrlParam.SORT.value, sort_by.value)]
+    query.extend(
+        (SearchUrlParam.CATEGORY.value, value) for value in categories_value or [])
+    if page and page > 1:
+        query.append((SearchUrlParam.PAGE.value, page))
+    return f"{utils.values_utils.get_url_value()}search?{urlencode(query)}"
@@ -0,0 +1,43 @@
+""" Article logical Implementation served from the query result cache
+
+Wraps another `ArticleInterface` so identical searches made within the cache TTL reuse the
+articles and pictures of the first one instead of scraping the site again.
+"""
+from frameworks_drivers.gateways.article_params_gateway import ParamsGateway
+from frameworks_drivers.repositories.query_cache_repository import QueryCacheRepository
+from interfaces.gateways.article_interface import ArticleInterface
+from entities.article_batch_entity import ArticleBatch
+import utils.values_utils
+from utils.strings_utils import define_query_key
+
+
+class CachedArticleGateway(ArticleInterface):
+    """ Classe responsible for serving the articles of a search from the cache when possible
+    """
+    def __init__(
+            self,
+            article_gateway: ArticleInterface,
+            search_params: ParamsGateway,
+            query_cache: QueryCacheRepository):
+        self.article_gateway = article_gateway
+        self.query_cache = query_cache
+        self.key = define_query_key(
+            search_params.phrase, search_params.categories, search_params.current_month_plus)
+
+    def return_articles(self) -> ArticleBatch:
+        """
+        ArticleBatch: the cached articles of the search, or the ones of a new scrape.
+
+        Identical searches running at the same time wait for the first one to fill the cache.
+        """
+        images_dir = utils.values_utils.get_news_images_dir_value()
+        articles = self.query_cache.get(self.key, images_dir)
+        if articles is not None:
+            return articles
+        with self.query_cache.single_flight(self.key):
+            articles = self.query_cache.get(self.key, images_dir)
+            if articles is not None:
+                return articles
+            articles = self.article_gateway.return_articles()
+            self.query_cache.save(self.key, articles, images_dir)
+        return articles
@@ -0,0 +1,40 @@
+""" Article logical Implementation served from the local article index
+
+Wraps another `ArticleInterface` so a search indexed recently enough (see
+`ArticleIndexRepository`) is answered from the index instead of opening the browser. The index
+keeps the article data only, so no pictures are delivered for a search answered this way.
+"""
+from frameworks_drivers.gateways.article_params_gateway import ParamsGateway
+from frameworks_drivers.repositories.article_index_repository import ArticleIndexRepository
+from interfaces.gateways.article_interface import ArticleInterface
+from entities.article_batch_entity import ArticleBatch
+import utils.date_utils
+
+
+class IndexedArticleGateway(ArticleInterface):
+    """ Classe responsible for answering covered searches from the article index
+    """
+    def __init__(
+            self,
+            article_gateway: ArticleInterface,
+            search_params: ParamsGateway,
+            article_index: ArticleIndexRepository,
+            max_age: float):
+        self.article_gateway = article_gateway
+        self.search_params = search_params
+        self.article_index = article_index
+        self.max_age = max_age
+
+    def return_articles(self) -> ArticleBatch:
+        """ ArticleBatch: the indexed articles of the search, or the ones of a new scrape"""
+        articles = self.article_index.get_covered_articles(
+            self.search_params.phrase,
+            self.search_params.categories,
+            self.search_params.current_month_plus,
+            self.max_age,
+            utils.date_utils.return_start_of_month(
+                utils.date_utils.return_current_month_plus_next_months(
+                    self.search_params.current_month_plus - 1)))
+        if articles is not None:
+            return articles
+        return self.article_gateway.return_articles()
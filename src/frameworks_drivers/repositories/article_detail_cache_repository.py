@@ -0,0 +1,93 @@
+"""
+Module for caching the details read from the article pages.
+
+An article page does not change much once published, and the same articles come back in the
+results of every search of the same phrase. The body, author and times read from each page are
+therefore kept on disk, one small JSON file per article URL, so an article page is fetched only
+once, by whichever run or worker reads it first.
+
+Each entry is written to a temporary file first and then renamed, so concurrent workers never
+read a partial entry and need no lock; two workers reading the same page at the same time both
+write the same entry.
+"""
+from datetime import datetime
+import hashlib
+import json
+import logging
+import os
+import time
+
+import utils.values_utils
+
+logger = logging.getLogger(__name__)
+
+
+class ArticleDetailCacheRepository:
+    """
+    Repository for the details of each article page, by URL.
+
+    Attributes:
+        cache_dir (str): Directory holding one JSON file per article URL.
+        max_age (int): Time (in seconds) after which an entry is read again from the site,
+            0 to keep the entries forever.
+    """
+    def __init__(self, max_age: int = 0):
+        self.cache_dir = os.path.join(
+            utils.values_utils.get_state_dir_value(), "article_details")
+        self.max_age = max_age
+
+    def get(self, url: str) -> dict:
+        """
+        Returns the cached details of an article page.
+
+        Args:
+            url (str): URL of the article page.
+
+        Returns:
+            dict: The details, with the keys `body`, `author`, `published_at` and `updated_at`,
+            or None when they are missing or expired.
+        """
+        try:
+            with open(self._define_path(url), "r", encoding="utf-8") as file:
+                entry = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exception:
+            logger.warning("Ignoring unreadable article details of %s: %s", url, exception)
+            return None
+        if self.max_age and time.time() - entry["saved_at"] >= self.max_age:
+            return None
+        details = entry["details"]
+        for key in ("published_at", "updated_at"):
+            if details[key] is not None:
+                details[key] = datetime.fromtimestamp(details[key])
+        return details
+
+    def save(self, url: str, details: dict) -> None:
+        """
+        Saves the details read from an article page.
+
+        Args:
+            url (str): URL of the article page.
+            details (dict): The details (see `html_page_parser.parse_article_page`).
+        """
+        path = self._define_path(url)
+        entry = {
+            "url": url,
+            "saved_at": time.time(),
+            "details": dict(details, **{
+                key: details[key].timestamp() if details[key] else None
+                for key in ("published_at", "updated_at")})}
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                json.dump(entry, file)
+            os.replace(temporary_path, path)
+        except OSError as exception:
+            logger.warning("Error caching the article details of %s: %s", url, exception)
+
+    def _define_path(self, url: str) -> str:
+        """Returns the path of the entry of a URL, spread over subdirectories."""
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.json")
@@ -0,0 +1,284 @@
+"""
+Module for the local full-text index of every article extracted.
+
+Each run writes its own Excel file, so answering "how often was X mentioned in the last N
+months" used to mean scraping again. This module keeps every article extracted in a SQLite
+database with an FTS5 index over the title and description, so such questions are answered
+locally in milliseconds (see `query_index.py`).
+
+The database also records which searches it covers and when they ran. A search covered recently
+enough can be answered from the index instead of opening the browser
+(see `IndexedArticleGateway`).
+
+Tables:
+    articles: One row per article, identified by its date and title (see `ArticleBatch.keys`).
+    articles_fts: FTS5 index over the title and description of `articles`.
+    coverage: Searches indexed, by query key, with the time they ran.
+    coverage_articles: Articles returned by each search, with their search count.
+"""
+from datetime import datetime
+import json
+import os
+import sqlite3
+import time
+
+from entities.article_batch_entity import ArticleBatch
+from utils.strings_utils import define_query_key, normalize_query
+from utils.text_utils import count_search_phrase
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    article_key TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    date_ms INTEGER NOT NULL,
+    image_filename TEXT,
+    contains_money INTEGER NOT NULL,
+    indexed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_date ON articles (date_ms);
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, description, content='articles', content_rowid='id', tokenize='unicode61'
+);
+CREATE TABLE IF NOT EXISTS coverage (
+    query_key TEXT PRIMARY KEY,
+    phrase TEXT NOT NULL,
+    categories TEXT NOT NULL,
+    months INTEGER NOT NULL,
+    indexed_at REAL NOT NULL,
+    articles INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS coverage_articles (
+    query_key TEXT NOT NULL,
+    article_id INTEGER NOT NULL,
+    search_count INTEGER NOT NULL,
+    PRIMARY KEY (query_key, article_id)
+);
+"""
+
+
+class ArticleIndexRepository:
+    """
+    Repository for the full-text index of the articles extracted.
+
+    Attributes:
+        path (str): Path of the SQLite database.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+
+    @classmethod
+    def from_settings(cls, settings: dict, state_dir: str):
+        """
+        Opens the index from the `article_index` settings of values.json.
+
+        Args:
+            settings (dict): The `article_index` settings.
+            state_dir (str): Directory where the default database is kept.
+
+        Returns:
+            ArticleIndexRepository: The index, or None when it is disabled.
+        """
+        if not settings.get("enabled", False):
+            return None
+        return cls(settings.get("path", os.path.join(state_dir, "articles_index.sqlite")))
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self.connection.close()
+
+    def add_articles(
+            self,
+            articles: ArticleBatch,
+            phrase: str = None,
+            categories: str = None,
+            months: int = None) -> int:
+        """
+        Indexes the articles of a run and records the search as covered.
+
+        Articles already indexed are kept; the coverage of the search is replaced by the
+        articles of this run.
+
+        Args:
+            articles (ArticleBatch): The articles extracted.
+            phrase (str, optional): The search phrase of the run, None for a backfill.
+            categories (str, optional): The comma-separated categories of the run.
+            months (int, optional): The number of months searched.
+
+        Returns:
+            int: The number of articles not indexed before.
+        """
+        now = time.time()
+        added = 0
+        article_ids = []
+        with self.connection:
+            for key, title, description, date_ms, image_filename, money in zip(
+                    articles.keys(), articles.titles, articles.descriptions, articles.dates,
+                    articles.image_filenames, articles.contains_money):
+                cursor = self.connection.execute(
+                    "INSERT OR IGNORE INTO articles (article_key, title, description, date_ms, "
+                    "image_filename, contains_money, indexed_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, title, description, date_ms, image_filename, int(money), now))
+                if cursor.rowcount:
+                    added += 1
+                    article_id = cursor.lastrowid
+                    self.connection.execute(
+                        "INSERT INTO articles_fts (rowid, title, description) VALUES (?, ?, ?)",
+                        (article_id, title, description))
+                else:
+                    article_id = self.connection.execute(
+                        "SELECT id FROM articles WHERE article_key = ?", (key,)).fetchone()[0]
+                article_ids.append(article_id)
+
+            if phrase is not None:
+                query_key = define_query_key(phrase, categories, months)
+                self.connection.execute(
+                    "DELETE FROM coverage_articles WHERE query_key = ?", (query_key,))
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO coverage_articles (query_key, article_id, "
+                    "search_count) VALUES (?, ?, ?)",
+                    [(query_key, article_id, search_count)
+                     for article_id, search_count in zip(article_ids, articles.search_counts)])
+                normalized_phrase, normalized_categories, normalized_months = \
+                    normalize_query(phrase, categories, months)
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO coverage (query_key, phrase, categories, months, "
+                    "indexed_at, articles) VALUES (?, ?, ?, ?, ?, ?)",
+                    (query_key, normalized_phrase, normalized_categories, normalized_months,
+                     now, len(article_ids)))
+        return added
+
+    def count_phrase(
+            self,
+            phrase: str,
+            since: datetime = None,
+            until: datetime = None,
+            contains_money: bool = None) -> dict:
+        """
+        Counts the articles mentioning a phrase and the occurrences of the phrase.
+
+        Args:
+            phrase (str): The phrase, matched as consecutive words in the title or description.
+            since (datetime, optional): Oldest publication date included.
+            until (datetime, optional): Newest publication date included.
+            contains_money (bool, optional): Only articles with (True) or without (False)
+                money amounts.
+
+        Returns:
+            dict: `articles` (number of articles matching) and `occurrences` (number of times
+            the phrase appears in their title and description).
+        """
+        rows = self.search(phrase, since, until, contains_money)
+        return {
+            "articles": len(rows),
+            "occurrences": sum(
+                count_search_phrase(f"{row['title']} {row['description']}", phrase)
+                for row in rows)}
+
+    def search(
+            self,
+            phrase: str,
+            since: datetime = None,
+            until: datetime = None,
+            contains_money: bool = None,
+            limit: int = None) -> list[dict]:
+        """
+        Returns the articles mentioning a phrase, newest first.
+
+        Args:
+            phrase (str): The phrase, matched as consecutive words in the title or description.
+                An empty phrase matches every article.
+            since (datetime, optional): Oldest publication date included.
+            until (datetime, optional): Newest publication date included.
+            contains_money (bool, optional): Only articles with (True) or without (False)
+                money amounts.
+            limit (int, optional): Maximum number of articles returned.
+
+        Returns:
+            list[dict]: The articles, with the keys `title`, `description`, `date`,
+            `image_filename` and `contains_money`.
+        """
+        conditions, params = [], []
+        if phrase and phrase.strip():
+            conditions.append(
+                "id IN (SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?)")
+            params.append(to_fts_phrase(phrase))
+        if since is not None:
+            conditions.append("date_ms >= ?")
+            params.append(int(since.timestamp() * 1000))
+        if until is not None:
+            conditions.append("date_ms <= ?")
+            params.append(int(until.timestamp() * 1000))
+        if contains_money is not None:
+            conditions.append("contains_money = ?")
+            params.append(int(contains_money))
+        sql = ("SELECT title, description, date_ms, image_filename, contains_money "
+               "FROM articles")
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY date_ms DESC"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return [{
+            "title": title,
+            "description": description,
+            "date": datetime.fromtimestamp(date_ms / 1000.0),
+            "image_filename": image_filename,
+            "contains_money": bool(money)}
+            for title, description, date_ms, image_filename, money
+            in self.connection.execute(sql, params)]
+
+    def get_covered_articles(
+            self,
+            phrase: str,
+            categories: str,
+            months: int,
+            max_age: float,
+            since: datetime) -> ArticleBatch:
+        """
+        Returns the articles of a search indexed recently enough to skip scraping it.
+
+        Args:
+            phrase (str): The search phrase.
+            categories (str): The comma-separated categories.
+            months (int): The number of months searched.
+            max_age (float): Maximum age (in seconds) of the indexed search.
+            since (datetime): Oldest publication date of the months searched.
+
+        Returns:
+            ArticleBatch: The articles of the search, or None when it is not covered or stale.
+        """
+        query_key = define_query_key(phrase, categories, months)
+        coverage = self.connection.execute(
+            "SELECT indexed_at FROM coverage WHERE query_key = ?", (query_key,)).fetchone()
+        if coverage is None or time.time() - coverage[0] > max_age:
+            return None
+        batch = ArticleBatch()
+        for title, date_ms, description, image_filename, search_count, money in \
+                self.connection.execute(
+                    "SELECT a.title, a.date_ms, a.description, a.image_filename, "
+                    "c.search_count, a.contains_money FROM coverage_articles c "
+                    "JOIN articles a ON a.id = c.article_id "
+                    "WHERE c.query_key = ? AND a.date_ms >= ? ORDER BY a.date_ms DESC",
+                    (query_key, int(since.timestamp() * 1000))):
+            batch.append(title, datetime.fromtimestamp(date_ms / 1000.0), description,
+                         image_filename, search_count, money)
+        return batch
+
+
+def to_fts_phrase(phrase: str) -> str:
+    """
+    Quotes a phrase for an FTS5 MATCH, so its words must appear consecutively.
+
+    Args:
+        phrase (str): The phrase as typed.
+
+    Returns:
+        str: The FTS5 phrase query.
+    """
+    return '"' + " ".join(phrase.split()).replace('"', '""') + '"'
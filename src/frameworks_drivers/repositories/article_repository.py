@@ -3,18 +3,24 @@ Module for handling article data storage and management.
 
 This module provides functionality to save articles to an Excel file, zip image files, 
 and define file paths for output directories and filenames. It implements the 
-ArticleRepositoryInterface to interact with article data.
+ArticleRepositoryInterface to interact with article data. Articles can also be streamed
+into the Excel file page by page with `ArticlesXlsxWriter`. When the image store is enabled,
+the pictures are packed into `ImageStoreRepository` and the zip is exported from it.
 """
 from datetime import datetime
 import logging
-from openpyxl import Workbook
+import os
 
 from entities.article_entity import Article
+from entities.article_batch_entity import ArticleBatch
+from frameworks_drivers.repositories.image_store_repository import ImageStoreRepository
 from interfaces.repositories.article_repository_interface import ArticleRepositoryInterface
 import utils.dir_utils
 import utils.values_utils
 import utils.date_utils
+from utils.strings_utils import format_to_allowed_filename
 
+logger = logging.getLogger(__name__)
 
 
 class ArticleRepository(ArticleRepositoryInterface):
@@ -25,49 +31,69 @@ class ArticleRepository(ArticleRepositoryInterface):
     """
     def save_articles(
             self,
-            articles: list[Article],
+            articles: list[Article] | ArticleBatch,
             search_phrase: str,
             month: int) -> None:
         """
-        Saves a list of articles to an Excel file.
+        Saves a list or batch of articles to an Excel file.
 
         Args:
-            articles (list[Article]): List of Article objects to save.
+            articles (list[Article] | ArticleBatch): Articles to save. A batch is written
+                row by row without building `Article` objects.
             search_phrase (str): Search phrase used for the filename.
             month (int): The month to be included in the filename.
         """
+        if not isinstance(articles, ArticleBatch):
+            articles = ArticleBatch.from_articles(articles)
+        writer = self.open_articles_writer(search_phrase, month)
+        writer.append(articles)
+        writer.close()
+
+    def open_articles_writer(self, search_phrase: str, month: int) -> "ArticlesXlsxWriter":
+        """
+        Opens a writer that streams articles into the Excel file of a search.
+
+        Args:
+            search_phrase (str): Search phrase used for the filename.
+            month (int): The month to be included in the filename.
+
+        Returns:
+            ArticlesXlsxWriter: The writer; the file is written when it is closed.
+        """
         output_dir = define_output_dir()
-        xlsx_filename = self.define_xlsx_filename(search_phrase, output_dir, month)
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Articles"
-
-        ws.append(["Title",
-                   "Date",
-                   "Description",
-                   "Image Filename",
-                   "Search Count",
-                   "Contains Money"])
-        try:
-            for article in articles:
-                ws.append([article.title,
-                           article.date,
-                           article.description,
-                           article.image_filename,
-                           article.search_count,
-                           article.contains_money])
-        except ImportError as exception:
-            logging.error("Error to save article in database: %s", exception)
-
-        wb.save(xlsx_filename)
-
-    def save_articles_images(self) -> None:
+        return ArticlesXlsxWriter(
+            self.define_xlsx_filename(search_phrase, output_dir, month),
+            details=utils.values_utils.get_article_details_value().get("enabled", False))
+
+    def save_articles_images(self, image_filenames: list[str] = None) -> None:
         """
         Zips and saves images associated with articles.
+
+        When the image store is enabled, the picture files are packed into the store first and
+        the zip is exported from it, holding only the pictures of the given file names.
+
+        Args:
+            image_filenames (list[str], optional): Image file names of the articles, as
+                written in their rows. All the pictures are zipped when not given.
         """
         src_folder_images = utils.values_utils.get_news_images_dir_value()
         target_zip_folder = define_output_dir()
-        utils.dir_utils.zip_folder(src_folder_images, target_zip_folder)
+        image_store = ImageStoreRepository.from_settings(
+            utils.values_utils.get_image_store_value())
+        if image_store is None:
+            utils.dir_utils.zip_folder(src_folder_images, target_zip_folder)
+            return
+        names = None
+        if image_filenames is not None:
+            names = sorted({format_to_allowed_filename(image_filename)
+                            for image_filename in image_filenames if image_filename})
+        try:
+            image_store.import_files(src_folder_images, names)
+            written = image_store.export_zip(
+                os.path.join(target_zip_folder, "news_images.zip"), names)
+        finally:
+            image_store.close()
+        logger.info("Zipped %d pictures from the image store", written)
 
     @staticmethod
     def define_xlsx_filename(
@@ -91,6 +117,69 @@ class ArticleRepository(ArticleRepositoryInterface):
         return f"{src_dir}/news_search_{phrase_searched}_{from_date}_to_{to_date}.xlsx"
 
 
+class ArticlesXlsxWriter:
+    """
+    Streams articles into an Excel file.
+
+    The workbook is opened in write-only mode, so the rows appended are not kept as cells
+    in memory and can be appended page by page while the scrape progresses.
+
+    Attributes:
+        xlsx_filename (str): Path of the Excel file written on `close`.
+        details (bool): Whether the columns read from the article pages are written.
+    """
+    HEADER = ["Title",
+              "Date",
+              "Description",
+              "Image Filename",
+              "Search Count",
+              "Contains Money"]
+    DETAILS_HEADER = ["URL",
+                      "Body",
+                      "Author",
+                      "Published At",
+                      "Updated At"]
+    # Maximum number of characters of an Excel cell, longer bodies are cut.
+    MAX_CELL_LENGTH = 32767
+
+    def __init__(self, xlsx_filename: str, details: bool = False):
+        from openpyxl import Workbook  # pylint: disable=import-outside-toplevel
+        self.xlsx_filename = xlsx_filename
+        self.details = details
+        self.workbook = Workbook(write_only=True)
+        self.worksheet = self.workbook.create_sheet("Articles")
+        self.worksheet.append(self.HEADER + (self.DETAILS_HEADER if details else []))
+
+    def append(self, articles: ArticleBatch) -> None:
+        """
+        Appends a batch of articles to the sheet.
+
+        Args:
+            articles (ArticleBatch): The articles to append.
+        """
+        try:
+            if not self.details:
+                for row in articles.rows():
+                    self.worksheet.append(row)
+                return
+            for row, (url, body, author, published_at, updated_at) in zip(
+                    articles.rows(), articles.details()):
+                self.worksheet.append(row + (
+                    url,
+                    body[:self.MAX_CELL_LENGTH] if body else body,
+                    author,
+                    published_at,
+                    updated_at))
+        except (TypeError, ValueError) as exception:
+            logger.error("Error to save article in database: %s", exception)
+
+    def close(self) -> None:
+        """
+        Writes the Excel file.
+        """
+        self.workbook.save(self.xlsx_filename)
+
+
 def define_output_dir():
     """
     Retrieves the directory path for output files.
@@ -0,0 +1,208 @@
+"""
+Module for the persistent Chrome profiles of the workers.
+
+By default every browser starts with a throwaway profile, so each run downloads the JavaScript
+bundles, style sheets and fonts of the site again and shows the cookie consent dialog again.
+When enabled (`browser_profile.enabled`, off by default), this module keeps a fixed number of
+profile slots under `browser_profiles/` of the state directory; a browser takes a free slot for its lifetime,
+so its HTTP disk cache and cookies are warm from the previous runs.
+
+Policies:
+    Locking: each slot is held with a non-blocking lock on `slot-<n>.lock`, so two concurrent
+        workers never share a profile; a worker finding every slot taken starts with a
+        throwaway profile, as before. The lock is released by the operating system if the
+        worker dies.
+    Disk cache: Chrome is started with `--disk-cache-size`, so the cache of a slot is bounded.
+    Cleanup: a slot is wiped when it is older than `max_age`, larger than `max_profile_mb` or
+        was created with other browser options (see `define_fingerprint`), so every profile
+        is rebuilt from the same configuration. The singleton files left by a crashed browser
+        are removed before the profile is used again.
+    Debugging port: each slot uses its own `--remote-debugging-port`, so concurrent browsers
+        do not collide on the same port. Browsers without a slot let Chrome pick a free port.
+"""
+from datetime import datetime
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+
+import utils.values_utils
+from utils.dir_utils import measure_dir
+from utils.lock_utils import try_lock_file, unlock_file
+
+logger = logging.getLogger(__name__)
+
+
+# Bytes in a megabyte, for the size settings.
+MEGABYTE = 1024 * 1024
+
+
+class BrowserProfileRepository:
+    """
+    Repository for the profile slots reused by the browsers of the host.
+
+    One instance holds at most one slot at a time, between `acquire` and `release`.
+
+    Attributes:
+        slots (int): Number of profile slots, usually the number of concurrent workers.
+        disk_cache_mb (int): Maximum size (in MB) of the HTTP disk cache of a profile.
+        max_profile_mb (int): Size (in MB) over which a profile is wiped before being used.
+        max_age (int): Age (in seconds) after which a profile is wiped before being used.
+        base_port (int): Remote debugging port of the first slot; slot n uses base_port + n.
+        slot (int): The slot held, or None.
+        path (str): The profile directory of the slot held, or None.
+    """
+    PROFILE_FILENAME = "profile.json"
+    # Files Chrome leaves behind when it does not exit cleanly and that stop it from starting.
+    STALE_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie", "DevToolsActivePort")
+
+    def __init__(
+            self,
+            slots: int = 4,
+            disk_cache_mb: int = 256,
+            max_profile_mb: int = 1024,
+            max_age: int = 7 * 86400,
+            base_port: int = 9222):
+        self.slots = slots
+        self.disk_cache_mb = disk_cache_mb
+        self.max_profile_mb = max_profile_mb
+        self.max_age = max_age
+        self.base_port = base_port
+        self.profiles_dir = os.path.abspath(os.path.join(
+            utils.values_utils.get_state_dir_value(), "browser_profiles"))
+        self.slot = None
+        self.path = None
+        self._lock = None
+
+    @classmethod
+    def from_settings(cls, settings: dict):
+        """
+        Creates the repository from the `browser_profile` settings of values.json.
+
+        Args:
+            settings (dict): The `browser_profile` settings.
+
+        Returns:
+            BrowserProfileRepository: The repository, or None when persistent profiles are
+            disabled.
+        """
+        if not settings.get("enabled", False):
+            return None
+        return cls(**{key: value for key, value in settings.items() if key != "enabled"})
+
+    @property
+    def debugging_port(self) -> int:
+        """int: The remote debugging port of the slot held."""
+        return self.base_port + self.slot
+
+    def acquire(self, fingerprint: str) -> bool:
+        """
+        Takes the first free slot and prepares its profile for a browser.
+
+        Args:
+            fingerprint (str): Fingerprint of the browser options (see `define_fingerprint`);
+                a profile created with other options is wiped.
+
+        Returns:
+            bool: Whether a slot was taken. When every slot is in use, the browser should start
+            with a throwaway profile.
+        """
+        if self.slot is not None:
+            return True
+        for slot in range(self.slots):
+            lock = try_lock_file(os.path.join(self.profiles_dir, f"slot-{slot}.lock"))
+            if lock is None:
+                continue
+            self.slot, self._lock = slot, lock
+            self.path = os.path.join(self.profiles_dir, f"slot-{slot}")
+            try:
+                self._prepare(fingerprint)
+            except OSError:
+                self.release()
+                raise
+            return True
+        logger.warning("All %d browser profiles are in use, starting with a throwaway profile",
+                       self.slots)
+        return False
+
+    def release(self) -> None:
+        """Releases the slot held, once its browser has quit."""
+        if self.slot is None:
+            return
+        self._remove_stale_files()
+        unlock_file(self._lock)
+        logger.info("Released browser profile %d", self.slot)
+        self.slot, self.path, self._lock = None, None, None
+
+    def chrome_arguments(self) -> list[str]:
+        """
+        Returns the Chrome arguments using the slot held.
+
+        Returns:
+            list[str]: The profile directory, disk cache size and remote debugging port
+            arguments.
+        """
+        return [f"--user-data-dir={self.path}",
+                f"--disk-cache-size={int(self.disk_cache_mb * MEGABYTE)}",
+                f"--remote-debugging-port={self.debugging_port}"]
+
+    def _prepare(self, fingerprint: str) -> None:
+        """Wipes the profile of the slot held when the cleanup policy requires it."""
+        profile = self._read_profile()
+        reason = None
+        if profile is None:
+            reason = "new profile"
+        elif profile.get("fingerprint") != fingerprint:
+            reason = "browser options changed"
+        elif time.time() - profile.get("created_at", 0) > self.max_age:
+            reason = "profile expired"
+        elif measure_dir(self.path) > self.max_profile_mb * MEGABYTE:
+            reason = "profile too large"
+
+        if reason:
+            shutil.rmtree(self.path, ignore_errors=True)
+            profile = {"created_at": time.time(), "fingerprint": fingerprint, "runs": 0}
+            logger.info("Starting browser profile %d from scratch: %s", self.slot, reason)
+        else:
+            self._remove_stale_files()
+            logger.info("Reusing browser profile %d (%d runs since %s)", self.slot,
+                        profile["runs"], datetime.fromtimestamp(profile["created_at"]))
+        os.makedirs(self.path, exist_ok=True)
+        profile["runs"] += 1
+        profile["used_at"] = time.time()
+        with open(os.path.join(self.path, self.PROFILE_FILENAME), "w",
+                  encoding="utf-8") as file:
+            json.dump(profile, file)
+
+    def _read_profile(self) -> dict:
+        """Reads the metadata of the profile of the slot held, None when missing."""
+        try:
+            with open(os.path.join(self.path, self.PROFILE_FILENAME), "r",
+                      encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def _remove_stale_files(self) -> None:
+        """Removes the singleton files a browser that did not exit cleanly left behind."""
+        for file_name in self.STALE_FILES:
+            path = os.path.join(self.path, file_name)
+            if os.path.lexists(path):
+                os.remove(path)
+
+
+def define_fingerprint(arguments: list[str], prefs: dict) -> str:
+    """
+    Defines the fingerprint of the browser options a profile is created with.
+
+    Args:
+        arguments (list[str]): The Chrome arguments, without the profile ones.
+        prefs (dict): The Chrome preferences.
+
+    Returns:
+        str: The fingerprint.
+    """
+    options = json.dumps({"arguments": sorted(arguments), "prefs": prefs}, sort_keys=True)
+    return hashlib.sha1(options.encode("utf-8")).hexdigest()
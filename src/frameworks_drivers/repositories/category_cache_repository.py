@@ -0,0 +1,69 @@
+"""
+Module for caching the category map of the news site.
+
+The category filter of the search page maps each category name to the value of its checkbox.
+That map rarely changes, so it is kept on disk for a configurable time instead of being read
+from the page on every run.
+"""
+import json
+import logging
+import os
+import time
+
+import utils.values_utils
+from utils.lock_utils import file_lock
+
+logger = logging.getLogger(__name__)
+
+
+class CategoryCacheRepository:
+    """
+    Repository for the category name to value map of each site.
+
+    Attributes:
+        path (str): Path of the JSON cache file, shared by every site.
+        ttl (int): Time (in seconds) a cached map stays fresh.
+    """
+    def __init__(self, ttl: int):
+        self.path = os.path.join(
+            utils.values_utils.get_state_dir_value(), "category_cache.json")
+        self.ttl = ttl
+
+    def get(self, site: str) -> dict:
+        """
+        Returns the cached category map of a site when it is still fresh.
+
+        Args:
+            site (str): URL of the site.
+
+        Returns:
+            dict: The category map, or None when it is missing or expired.
+        """
+        with file_lock(f"{self.path}.lock"):
+            entry = self._read().get(site)
+        if entry and time.time() - entry["saved_at"] < self.ttl:
+            logger.info("Using cached categories of %s", site)
+            return entry["categories"]
+        return None
+
+    def save(self, site: str, categories: dict) -> None:
+        """
+        Saves the category map of a site.
+
+        Args:
+            site (str): URL of the site.
+            categories (dict): The category map read from the site.
+        """
+        with file_lock(f"{self.path}.lock"):
+            cache = self._read()
+            cache[site] = {"saved_at": time.time(), "categories": categories}
+            with open(self.path, "w", encoding="utf-8") as file:
+                json.dump(cache, file)
+
+    def _read(self) -> dict:
+        """Reads the whole cache file; must be called while holding the lock."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
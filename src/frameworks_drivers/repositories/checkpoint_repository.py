@@ -0,0 +1,115 @@
+"""
+Module for persisting the progress of a long scrape.
+
+This module provides the `CheckpointRepository` class, which stores the last completed results
+page of a search, the rows extracted so far and the pictures already saved into a small JSON
+state file. A rerun of the same work item loads that state and resumes from the next page
+instead of starting again from the first one.
+"""
+from datetime import datetime
+import hashlib
+import json
+import logging
+import os
+
+import utils.values_utils
+
+logger = logging.getLogger(__name__)
+
+
+# Fields of the rows holding a datetime, stored as timestamps; the page ones are only set when
+# the articles are enriched with their article pages.
+DATETIME_FIELDS = ("date", "published_at", "updated_at")
+
+
+class CheckpointRepository:
+    """
+    Repository for saving and restoring the progress of a scrape.
+
+    Attributes:
+        path (str): Path of the JSON state file of the work item.
+    """
+    def __init__(self, key: str):
+        checkpoint_dir = os.path.join(
+            utils.values_utils.get_state_dir_value(), "checkpoints")
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        self.path = os.path.join(checkpoint_dir, f"{key}.json")
+
+    def load(self) -> dict:
+        """
+        Loads the saved progress of the work item.
+
+        Returns:
+            dict: The saved state with the keys `page`, `resume_url`, `rows` and `images`,
+            or None when there is nothing to resume.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                state = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exception:
+            logger.warning("Ignoring unreadable checkpoint %s: %s", self.path, exception)
+            return None
+
+        for row in state["rows"]:
+            for key in DATETIME_FIELDS:
+                if row.get(key) is not None:
+                    row[key] = datetime.fromtimestamp(row[key])
+        logger.info(
+            "Resuming from page %d with %d articles", state["page"], len(state["rows"]))
+        return state
+
+    def save(self, page: int, resume_url: str, rows: list[dict], images: set[str]) -> None:
+        """
+        Saves the progress of the work item after a completed page.
+
+        The state is written to a temporary file first and then renamed, so a crash while
+        writing never leaves a broken checkpoint behind.
+
+        Args:
+            page (int): Number of the last completed results page.
+            resume_url (str): URL of the next results page to scrape.
+            rows (list[dict]): Article data extracted so far.
+            images (set[str]): File names of the pictures already saved.
+        """
+        state = {
+            "page": page,
+            "resume_url": resume_url,
+            "rows": [dict(row, **{key: row[key].timestamp()
+                                  for key in DATETIME_FIELDS if row.get(key) is not None})
+                     for row in rows],
+            "images": sorted(images)}
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+        os.replace(temporary_path, self.path)
+
+    def clear(self) -> None:
+        """
+        Removes the saved progress once the work item has completed.
+        """
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def define_checkpoint_key(phrase: str, categories: str, months: int) -> str:
+        """
+        Defines the key of a work item from its search parameters and the current day.
+
+        The day is part of the key so a checkpoint left behind is never resumed by a search
+        made on a later day, when the newest results are different.
+
+        Args:
+            phrase (str): The search phrase.
+            categories (str): The comma-separated categories.
+            months (int): The number of months searched.
+
+        Returns:
+            str: The key of the work item.
+        """
+        params = json.dumps(
+            [phrase, categories, months, datetime.now().strftime("%Y-%m-%d")])
+        return hashlib.sha1(params.encode("utf-8")).hexdigest()
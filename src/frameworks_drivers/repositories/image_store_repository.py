@@ -0,0 +1,306 @@
+"""
+Module for keeping the news pictures packed in large segment files.
+
+Every run downloads its pictures as small JPEG files into the images directory, where they
+accumulate by the tens of thousands, and zipping them walks the whole directory and opens every
+file. With the image store, the pictures of each run are appended into segment files of a few
+hundred megabytes once the run is done and their loose files are removed. An append-only index
+records where each picture lies, so a picture is read back through a memory mapping of its
+segment, and the zip of a run is built by copying the pictures segment after segment.
+
+The store is off by default (`image_store.enabled`): once enabled, the images directory no longer
+keeps the pictures of past runs and the zip only holds the pictures of the articles of the run.
+
+Store layout, under the `image_store.dir` setting (`image_store/` of the state directory by
+default):
+    segment-00000.bin, segment-00001.bin...: The picture bytes, one after the other. A new
+        segment is started when the last one would grow over `segment_mb`.
+    index.jsonl: One line per picture put, with its name, segment, offset, length and SHA-256.
+        When a name is put again, its last line wins. A picture identical to one already stored
+        is not written again, its line points at the stored bytes.
+
+Writers hold the lock of the store, so several workers on the same host can share it. Readers
+need no lock: the bytes of a picture are written before its index line, so a line read always
+points at complete bytes.
+
+Classes:
+    ImageStoreRepository: Packs, reads and exports the pictures.
+"""
+import hashlib
+import json
+import logging
+import mmap
+import os
+import time
+import zipfile
+
+import utils.values_utils
+from utils.lock_utils import file_lock
+
+logger = logging.getLogger(__name__)
+
+
+class ImageStoreRepository:
+    """
+    Repository packing the news pictures into append-only segment files.
+
+    Attributes:
+        store_dir (str): Directory holding the segments and the index.
+        segment_bytes (int): Size (in bytes) a segment is not grown over.
+        entries (dict[str, tuple]): Segment, offset, length and SHA-256 of each picture,
+            by file name.
+    """
+    INDEX_FILENAME = "index.jsonl"
+
+    def __init__(self, store_dir: str, segment_mb: int = 256):
+        self.store_dir = store_dir
+        self.segment_bytes = max(1, int(segment_mb)) * 1024 * 1024
+        self.entries = {}
+        self._hashes = {}
+        self._index_path = os.path.join(store_dir, self.INDEX_FILENAME)
+        self._index_offset = 0
+        self._mappings = {}
+        os.makedirs(store_dir, exist_ok=True)
+        self._refresh()
+
+    @classmethod
+    def from_settings(cls, settings: dict):
+        """
+        Creates the repository from the `image_store` settings of values.json.
+
+        Args:
+            settings (dict): The `image_store` settings.
+
+        Returns:
+            ImageStoreRepository: The repository, or None when the store is disabled.
+        """
+        if not settings.get("enabled", False):
+            return None
+        store_dir = settings.get("dir") or os.path.join(
+            utils.values_utils.get_state_dir_value(), "image_store")
+        return cls(store_dir, settings.get("segment_mb", 256))
+
+    def put(self, name: str, data: bytes) -> None:
+        """
+        Appends a picture to the store.
+
+        Args:
+            name (str): File name of the picture.
+            data (bytes): The picture.
+        """
+        with file_lock(os.path.join(self.store_dir, "store.lock")):
+            self._refresh(truncate=True)
+            self._append(name, data)
+
+    def import_files(self, images_dir: str, names: list[str] = None,
+                     remove: bool = True) -> int:
+        """
+        Appends the loose picture files of a directory to the store.
+
+        Args:
+            images_dir (str): Directory holding the picture files.
+            names (list[str], optional): File names of the pictures to import, all the files
+                of the directory when not given.
+            remove (bool): Whether the files are removed once stored.
+
+        Returns:
+            int: Number of pictures imported.
+        """
+        if names is None:
+            try:
+                names = sorted(entry.name for entry in os.scandir(images_dir)
+                               if entry.is_file())
+            except FileNotFoundError:
+                return 0
+        imported = []
+        with file_lock(os.path.join(self.store_dir, "store.lock")):
+            self._refresh(truncate=True)
+            for name in names:
+                path = os.path.join(images_dir, name)
+                try:
+                    with open(path, "rb") as file:
+                        data = file.read()
+                except FileNotFoundError:
+                    continue
+                except OSError as exception:
+                    logger.warning("Error reading picture %s: %s", path, exception)
+                    continue
+                self._append(name, data)
+                imported.append(path)
+        if remove:
+            for path in imported:
+                try:
+                    os.remove(path)
+                except OSError as exception:
+                    logger.warning("Error removing picture %s: %s", path, exception)
+        if imported:
+            logger.info("Imported %d pictures into the image store", len(imported))
+        return len(imported)
+
+    def get(self, name: str) -> bytes:
+        """
+        Reads a picture from the store.
+
+        Args:
+            name (str): File name of the picture.
+
+        Returns:
+            bytes: The picture, or None when it is not stored.
+        """
+        view = self._view(name)
+        if view is None:
+            return None
+        with view:
+            return bytes(view)
+
+    def names(self) -> list[str]:
+        """Returns the file names of the pictures stored."""
+        self._refresh()
+        return sorted(self.entries)
+
+    def __contains__(self, name: str) -> bool:
+        if name not in self.entries:
+            self._refresh()
+        return name in self.entries
+
+    def export_zip(self, zip_path: str, names: list[str] = None) -> int:
+        """
+        Writes pictures of the store into a zip file.
+
+        The pictures are copied in the order they lie in the segments and stored without
+        compression, as JPEG files do not compress any further.
+
+        Args:
+            zip_path (str): Path of the zip file.
+            names (list[str], optional): File names of the pictures, all of them when not given.
+
+        Returns:
+            int: Number of pictures written.
+        """
+        written = 0
+        temporary_path = f"{zip_path}.{os.getpid()}.tmp"
+        date_time = time.localtime()[:6]
+        with zipfile.ZipFile(temporary_path, "w", zipfile.ZIP_STORED) as zip_file:
+            for name in self._in_segment_order(names):
+                view = self._view(name)
+                with view:
+                    info = zipfile.ZipInfo(name, date_time)
+                    info.external_attr = 0o644 << 16
+                    zip_file.writestr(info, view)
+                written += 1
+        os.replace(temporary_path, zip_path)
+        return written
+
+    def export_dir(self, target_dir: str, names: list[str] = None) -> dict[str, str]:
+        """
+        Writes pictures of the store as files of a directory.
+
+        Args:
+            target_dir (str): Directory the files are written to.
+            names (list[str], optional): File names of the pictures, all of them when not given.
+
+        Returns:
+            dict[str, str]: Path of each picture written, by file name.
+        """
+        os.makedirs(target_dir, exist_ok=True)
+        paths = {}
+        for name in self._in_segment_order(names):
+            path = os.path.join(target_dir, name)
+            view = self._view(name)
+            with view, open(path, "wb") as file:
+                file.write(view)
+            paths[name] = path
+        return paths
+
+    def close(self) -> None:
+        """Closes the mappings of the segments."""
+        for mapping, file in self._mappings.values():
+            mapping.close()
+            file.close()
+        self._mappings = {}
+
+    def _in_segment_order(self, names: list[str] = None) -> list[str]:
+        """Returns the stored names among the given ones, sorted by segment and offset."""
+        self._refresh()
+        if names is None:
+            names = self.entries
+        stored = {name for name in names if name in self.entries}
+        return sorted(stored, key=lambda name: self.entries[name][:2])
+
+    def _view(self, name: str) -> memoryview:
+        """Returns a view of the bytes of a picture in the mapping of its segment, or None."""
+        if name not in self:
+            return None
+        segment, offset, length, _ = self.entries[name]
+        mapping = self._map_segment(segment, offset + length)
+        return memoryview(mapping)[offset:offset + length]
+
+    def _map_segment(self, segment: int, size: int) -> mmap.mmap:
+        """Returns the mapping of a segment, mapping it again once it grew past `size`."""
+        mapped = self._mappings.get(segment)
+        if mapped is not None and len(mapped[0]) >= size:
+            return mapped[0]
+        if mapped is not None:
+            mapped[0].close()
+            file = mapped[1]
+        else:
+            file = open(self._segment_path(segment), "rb")  # pylint: disable=consider-using-with
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._mappings[segment] = (mapping, file)
+        return mapping
+
+    def _append(self, name: str, data: bytes) -> None:
+        """Appends a picture and its index line; the lock of the store must be held."""
+        digest = hashlib.sha256(data).hexdigest()
+        location = self._hashes.get(digest)
+        if location is None:
+            segment = max((entry[0] for entry in self.entries.values()), default=0)
+            path = self._segment_path(segment)
+            offset = os.path.getsize(path) if os.path.exists(path) else 0
+            if offset and offset + len(data) > self.segment_bytes:
+                segment, offset = segment + 1, 0
+                path = self._segment_path(segment)
+            with open(path, "ab") as file:
+                file.seek(0, os.SEEK_END)
+                offset = file.tell()
+                file.write(data)
+            location = (segment, offset, len(data))
+        entry = {"name": name, "segment": location[0], "offset": location[1],
+                 "length": location[2], "sha256": digest}
+        with open(self._index_path, "ab") as file:
+            file.write(json.dumps(entry).encode("utf-8") + b"\n")
+        self._refresh()
+
+    def _refresh(self, truncate: bool = False) -> None:
+        """
+        Reads the index lines added since the last read, by this or another process.
+
+        A last line without its newline is being written by another process, or was cut by a
+        crash; it is left for the next read, or removed when `truncate` is set, which is only
+        done under the lock of the store.
+        """
+        try:
+            with open(self._index_path, "rb") as file:
+                file.seek(self._index_offset)
+                tail = file.read()
+        except FileNotFoundError:
+            return
+        complete = tail[:tail.rfind(b"\n") + 1]
+        for line in complete.splitlines():
+            try:
+                entry = json.loads(line)
+                location = (entry["segment"], entry["offset"], entry["length"])
+            except (ValueError, KeyError) as exception:
+                logger.warning("Ignoring unreadable image store entry: %s", exception)
+                continue
+            self.entries[entry["name"]] = location + (entry["sha256"],)
+            self._hashes.setdefault(entry["sha256"], location)
+        self._index_offset += len(complete)
+        if truncate and len(complete) < len(tail):
+            logger.warning("Removing an incomplete image store entry")
+            with open(self._index_path, "r+b") as file:
+                file.truncate(self._index_offset)
+
+    def _segment_path(self, segment: int) -> str:
+        """Returns the path of a segment file."""
+        return os.path.join(self.store_dir, f"segment-{segment:05d}.bin")
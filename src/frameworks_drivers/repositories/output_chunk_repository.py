@@ -0,0 +1,170 @@
+"""
+Module for emitting the articles of a run in chunks.
+
+A run writes one Excel file and one zip of pictures, so downstream processes can only start once
+the whole scrape is done, and then all work on the same large files. With this repository the
+articles are also handed over in chunks of a fixed number of articles, each with the picture
+files its rows refer to, as soon as enough articles have been scraped. The chunks are emitted
+through a callable, such as the creation of Robocorp output work items in `tasks.py`, so
+downstream robots can process them in parallel while the scrape goes on.
+
+Every chunk payload holds the search parameters, the chunk number, the articles and the picture
+file names. The last chunk of a run is marked with `last` and the number of chunks, so consumers
+can tell when a run is complete, and carries the pictures downloaded after their chunk was
+emitted (see `CustomSelenium.download_pictures`). Pictures already packed into the image store
+are staged from it.
+"""
+import logging
+import os
+import shutil
+from typing import Callable
+
+from entities.article_batch_entity import ArticleBatch
+from frameworks_drivers.repositories.image_store_repository import ImageStoreRepository
+import utils.values_utils
+from utils.strings_utils import format_to_allowed_filename
+
+logger = logging.getLogger(__name__)
+
+
+class OutputChunkRepository:
+    """
+    Repository emitting the articles of a run in chunks with their pictures.
+
+    Attributes:
+        emit (Callable[[dict, list[str]], None]): Called with the payload and the picture paths
+            of each chunk.
+        size (int): Number of articles per chunk.
+        chunks (int): Number of chunks emitted.
+    """
+    def __init__(
+            self,
+            emit: Callable[[dict, list[str]], None],
+            phrase: str,
+            categories: str,
+            months: int,
+            size: int = 50):
+        self.emit = emit
+        self.size = max(1, int(size))
+        self.query = {"phrase": phrase, "categories": categories, "months": months}
+        self.chunks = 0
+        self.images_dir = utils.values_utils.get_news_images_dir_value()
+        self.image_store = ImageStoreRepository.from_settings(
+            utils.values_utils.get_image_store_value())
+        self.staging_dir = os.path.join(
+            utils.values_utils.get_output_dir_value(), "output_chunks")
+        self._rows = []
+        self._pictures = {}
+        self._late_images = set()
+
+    @classmethod
+    def from_settings(
+            cls,
+            emit: Callable[[dict, list[str]], None],
+            phrase: str,
+            categories: str,
+            months: int,
+            settings: dict):
+        """
+        Creates the repository from the `output_chunks` settings of values.json.
+
+        Args:
+            emit (Callable[[dict, list[str]], None]): Called with each chunk, None to disable.
+            phrase (str): The search phrase.
+            categories (str): The comma-separated categories.
+            months (int): The number of months searched.
+            settings (dict): The `output_chunks` settings.
+
+        Returns:
+            OutputChunkRepository: The repository, or None when no emitter is given.
+        """
+        if emit is None:
+            return None
+        return cls(emit, phrase, categories, months, settings.get("size", 50))
+
+    def add(self, articles: ArticleBatch, pictures: dict[str, bytes] = None) -> None:
+        """
+        Adds the articles of a page and emits every chunk completed.
+
+        One chunk is always held back, so the last one of the run can be marked by `close`.
+
+        Args:
+            articles (ArticleBatch): The articles of the page.
+            pictures (dict[str, bytes], optional): Pictures read from the page, by file name.
+                Pictures not given are taken from the images directory or the image store.
+        """
+        self._rows.extend(articles.rows())
+        self._pictures.update(pictures or {})
+        while len(self._rows) > self.size:
+            self._emit_chunk(self._rows[:self.size])
+            del self._rows[:self.size]
+
+    def close(self) -> None:
+        """Emits the remaining articles as the last chunk, even when there are none left."""
+        late_images = {file_name for file_name in self._late_images
+                       if os.path.isfile(os.path.join(self.images_dir, file_name))
+                       or (self.image_store and file_name in self.image_store)}
+        self._emit_chunk(self._rows, last=True, late_images=late_images)
+        self._rows = []
+        self._pictures = {}
+        if self.image_store:
+            self.image_store.close()
+        logger.info("Emitted %d output chunks", self.chunks)
+
+    def _emit_chunk(self, rows: list[tuple], last: bool = False, late_images=()) -> None:
+        """Stages the pictures of the rows and emits them as the next chunk."""
+        self.chunks += 1
+        chunk_dir = os.path.join(self.staging_dir, f"chunk-{self.chunks:05d}")
+        os.makedirs(chunk_dir, exist_ok=True)
+        files = {}
+        for image_filename in sorted(set(filter(None, (row[3] for row in rows)))
+                                     | set(late_images)):
+            file_name = format_to_allowed_filename(image_filename)
+            path = self._stage_picture(file_name, chunk_dir)
+            if path:
+                files[file_name] = path
+                self._late_images.discard(file_name)
+            else:
+                self._late_images.add(file_name)
+
+        payload = {
+            "query": self.query,
+            "chunk": self.chunks,
+            "last": last,
+            "articles": [
+                {"title": title,
+                 "date": date.isoformat(),
+                 "description": description,
+                 "image_filename": image_filename,
+                 "search_count": search_count,
+                 "contains_money": contains_money}
+                for title, date, description, image_filename, search_count, contains_money
+                in rows],
+            "images": sorted(files)}
+        if last:
+            payload["chunks"] = self.chunks
+            payload["missing_images"] = sorted(self._late_images)
+        try:
+            self.emit(payload, list(files.values()))
+        finally:
+            shutil.rmtree(chunk_dir, ignore_errors=True)
+        logger.info("Emitted output chunk %d with %d articles and %d pictures",
+                    self.chunks, len(rows), len(files))
+
+    def _stage_picture(self, file_name: str, chunk_dir: str) -> str:
+        """Returns the path of a picture of the chunk, None when it is not available yet."""
+        picture = self._pictures.pop(file_name, None)
+        if picture is not None:
+            path = os.path.join(chunk_dir, file_name)
+            try:
+                with open(path, "wb") as file:
+                    file.write(picture)
+                return path
+            except OSError as exception:
+                logger.warning("Error staging picture %s: %s", file_name, exception)
+        path = os.path.join(self.images_dir, file_name)
+        if os.path.isfile(path):
+            return path
+        if self.image_store and file_name in self.image_store:
+            return self.image_store.export_dir(chunk_dir, [file_name])[file_name]
+        return None
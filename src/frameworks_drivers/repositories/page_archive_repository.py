@@ -0,0 +1,168 @@
+"""
+Module for archiving the raw results pages of a run.
+
+This module provides the `PageArchiveRepository` class, which stores the HTML of every results
+page read during a run, compressed, together with its URL, capture time and search parameters.
+Archived runs can be replayed through the extraction pipeline later without a browser, so a fix
+in the extraction reaches historical results without scraping again.
+
+Pages are compressed with zstandard, which the robot environment installs (see `conda.yaml`),
+and with gzip where it is not installed; the codec of each page is recorded in the index, so
+both can be read back.
+"""
+from datetime import datetime
+import gzip
+import json
+import logging
+import os
+
+import utils.values_utils
+from utils.strings_utils import format_to_allowed_filename
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+
+class PageArchiveRepository:
+    """
+    Repository for the raw results pages of a run.
+
+    Every run has its own directory under `output/page_archive/`, holding one compressed file
+    per page and an `index.jsonl` file with the metadata of each page.
+
+    Attributes:
+        run_id (str): Identifier of the run, also the name of its directory.
+        query (dict): Search parameters of the run, stored with every page.
+    """
+    INDEX_FILENAME = "index.jsonl"
+
+    def __init__(self, run_id: str, query: dict = None):
+        self.run_id = run_id
+        self.query = query or {}
+        self.run_dir = os.path.join(define_archive_dir(), run_id)
+
+    @classmethod
+    def create_run(cls, phrase: str, categories: str, months: int) -> "PageArchiveRepository":
+        """
+        Creates the archive of a new run.
+
+        Args:
+            phrase (str): The search phrase.
+            categories (str): The comma-separated categories.
+            months (int): The number of months searched.
+
+        Returns:
+            PageArchiveRepository: The archive of the run.
+        """
+        run_id = (f"{datetime.now().strftime('%Y%m%d-%H%M%S')}_"
+                  f"{format_to_allowed_filename(phrase or 'all')}")
+        archive = cls(run_id, {"phrase": phrase, "categories": categories, "months": months})
+        os.makedirs(archive.run_dir, exist_ok=True)
+        logger.info("Archiving results pages into %s", archive.run_dir)
+        return archive
+
+    @classmethod
+    def open_run(cls, run_id: str) -> "PageArchiveRepository":
+        """
+        Opens the archive of an earlier run, with the search parameters stored in it.
+
+        Args:
+            run_id (str): Identifier of the run.
+
+        Returns:
+            PageArchiveRepository: The archive of the run.
+        """
+        archive = cls(run_id)
+        archive.query = archive.read_index()[0]["query"]
+        return archive
+
+    def save_page(self, page_source: str, url: str, page: int) -> None:
+        """
+        Compresses and stores the HTML of a results page.
+
+        Args:
+            page_source (str): HTML of the page.
+            url (str): URL of the page.
+            page (int): Number of the results page.
+        """
+        content = page_source.encode("utf-8")
+        if zstandard is not None:
+            codec = "zstd"
+            content = zstandard.ZstdCompressor(level=3).compress(content)
+        else:
+            codec = "gzip"
+            content = gzip.compress(content, compresslevel=6)
+        filename = f"{page:05d}.html.{'zst' if codec == 'zstd' else 'gz'}"
+
+        try:
+            with open(os.path.join(self.run_dir, filename), "wb") as file:
+                file.write(content)
+            with open(os.path.join(self.run_dir, self.INDEX_FILENAME), "a",
+                      encoding="utf-8") as file:
+                file.write(json.dumps({
+                    "page": page,
+                    "url": url,
+                    "timestamp": datetime.now().timestamp(),
+                    "query": self.query,
+                    "file": filename,
+                    "codec": codec}) + "\n")
+        except OSError as exception:
+            logger.warning("Error archiving page %d: %s", page, exception)
+
+    def read_index(self) -> list[dict]:
+        """
+        Reads the metadata of the archived pages, ordered by page number.
+
+        Returns:
+            list[dict]: The metadata of each page.
+        """
+        with open(os.path.join(self.run_dir, self.INDEX_FILENAME), "r",
+                  encoding="utf-8") as file:
+            entries = [json.loads(line) for line in file if line.strip()]
+        return sorted(entries, key=lambda entry: entry["page"])
+
+    def iter_pages(self):
+        """
+        Yields the metadata and the decompressed HTML of each archived page, in page order.
+        """
+        for entry in self.read_index():
+            with open(os.path.join(self.run_dir, entry["file"]), "rb") as file:
+                content = file.read()
+            if entry["codec"] == "zstd":
+                if zstandard is None:
+                    raise RuntimeError(
+                        f"zstandard is required to read {entry['file']} of run {self.run_id}")
+                content = zstandard.ZstdDecompressor().decompress(content)
+            else:
+                content = gzip.decompress(content)
+            yield entry, content
+
+    @staticmethod
+    def list_runs() -> list[str]:
+        """
+        Lists the identifiers of the archived runs, oldest first.
+
+        Returns:
+            list[str]: The run identifiers.
+        """
+        archive_dir = define_archive_dir()
+        if not os.path.isdir(archive_dir):
+            return []
+        return sorted(
+            run_id for run_id in os.listdir(archive_dir)
+            if os.path.isfile(os.path.join(
+                archive_dir, run_id, PageArchiveRepository.INDEX_FILENAME)))
+
+
+def define_archive_dir() -> str:
+    """
+    Retrieves the directory path of the page archives.
+
+    Returns:
+        str: The directory path holding one directory per archived run.
+    """
+    return os.path.join(utils.values_utils.get_output_dir_value(), "page_archive")
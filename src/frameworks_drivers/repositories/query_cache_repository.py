@@ -0,0 +1,214 @@
+"""
+Module for caching the results of recent searches.
+
+Identical work items (same phrase, categories and months) are often submitted within minutes of
+each other. This module keeps the articles and pictures of each search under
+`query_cache/<key>/` of the state directory for a configurable time, so a repeated search is
+served from disk instead of scraping the site again.
+
+The cache is bounded in entries and bytes; when it grows over either bound, the entries used the
+longest time ago are evicted first. `single_flight` serializes identical searches across
+processes, so concurrent identical work items wait for one scrape instead of starting several.
+"""
+from contextlib import contextmanager
+from datetime import datetime
+import json
+import logging
+import os
+import shutil
+import time
+
+from entities.article_batch_entity import ArticleBatch
+from frameworks_drivers.repositories.image_store_repository import ImageStoreRepository
+import utils.values_utils
+from utils.dir_utils import measure_dir
+from utils.lock_utils import file_lock
+from utils.strings_utils import format_to_allowed_filename
+
+logger = logging.getLogger(__name__)
+
+
+class QueryCacheRepository:
+    """
+    Repository for the articles and pictures of recent searches.
+
+    Every entry is a directory holding `articles.json` and an `images` directory. The
+    `index.json` file of the cache records when each entry was saved and last used and its size.
+
+    Attributes:
+        ttl (int): Time (in seconds) an entry stays fresh.
+        max_entries (int): Maximum number of entries kept.
+        max_bytes (int): Maximum total size (in bytes) of the entries kept.
+    """
+    ARTICLES_FILENAME = "articles.json"
+    INDEX_FILENAME = "index.json"
+
+    def __init__(self, ttl: int, max_entries: int = 50, max_bytes: int = 500 * 1024 * 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.cache_dir = os.path.join(
+            utils.values_utils.get_state_dir_value(), "query_cache")
+        self.index_path = os.path.join(self.cache_dir, self.INDEX_FILENAME)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @classmethod
+    def from_settings(cls, settings: dict):
+        """
+        Creates a cache from the `query_cache` settings of values.json.
+
+        Args:
+            settings (dict): The `query_cache` settings.
+
+        Returns:
+            QueryCacheRepository: The cache, or None when it is disabled.
+        """
+        if not settings.get("enabled", False):
+            return None
+        return cls(**{key: value for key, value in settings.items() if key != "enabled"})
+
+    @contextmanager
+    def single_flight(self, key: str):
+        """
+        Holds the lock of a search while the block runs, across processes.
+
+        A second identical search blocks here until the first one has scraped and saved its
+        results, and then finds them in the cache.
+
+        Args:
+            key (str): The cache key of the search.
+        """
+        with file_lock(os.path.join(self.cache_dir, f"{key}.lock")):
+            yield
+
+    def get(self, key: str, images_dir: str) -> ArticleBatch:
+        """
+        Returns the cached articles of a search and copies its pictures to the images directory.
+
+        Args:
+            key (str): The cache key of the search.
+            images_dir (str): Directory the repository zips the pictures from.
+
+        Returns:
+            ArticleBatch: The cached articles, or None when they are missing or expired.
+        """
+        with file_lock(f"{self.index_path}.lock"):
+            index = self._read_index()
+            entry = index.get(key)
+            if not entry or time.time() - entry["saved_at"] >= self.ttl:
+                return None
+            entry["used_at"] = time.time()
+            self._write_index(index)
+
+        entry_dir = os.path.join(self.cache_dir, key)
+        try:
+            with open(os.path.join(entry_dir, self.ARTICLES_FILENAME), "r",
+                      encoding="utf-8") as file:
+                rows = json.load(file)
+            os.makedirs(images_dir, exist_ok=True)
+            for file_name in os.listdir(os.path.join(entry_dir, "images")):
+                shutil.copy2(os.path.join(entry_dir, "images", file_name), images_dir)
+        except (OSError, ValueError) as exception:
+            logger.warning("Ignoring unreadable cache entry %s: %s", key, exception)
+            return None
+
+        for row in rows:
+            row["date"] = datetime.fromtimestamp(row["date"] / 1000.0)
+            for field in ("published_at", "updated_at"):
+                row[field] = datetime.fromtimestamp(row[field] / 1000.0) if row.get(field) else None
+        logger.info("Serving %d cached articles saved %.0f seconds ago",
+                    len(rows), time.time() - entry["saved_at"])
+        return ArticleBatch.from_rows(rows)
+
+    def save(self, key: str, articles: ArticleBatch, images_dir: str) -> None:
+        """
+        Saves the articles of a search and the pictures they reference, then evicts old entries.
+
+        Args:
+            key (str): The cache key of the search.
+            articles (ArticleBatch): The articles extracted.
+            images_dir (str): Directory holding the pictures of the articles.
+        """
+        entry_dir = os.path.join(self.cache_dir, key)
+        temporary_dir = f"{entry_dir}.tmp"
+        shutil.rmtree(temporary_dir, ignore_errors=True)
+        # The async pipeline packs the pictures into the image store before they are cached.
+        image_store = ImageStoreRepository.from_settings(
+            utils.values_utils.get_image_store_value())
+        try:
+            os.makedirs(os.path.join(temporary_dir, "images"))
+            with open(os.path.join(temporary_dir, self.ARTICLES_FILENAME), "w",
+                      encoding="utf-8") as file:
+                json.dump([
+                    {"title": title,
+                     "date": date,
+                     "description": description,
+                     "image_filename": image_filename,
+                     "search_count": search_count,
+                     "contains_money": bool(contains_money),
+                     "url": url,
+                     "body": body,
+                     "author": author,
+                     "published_at": published_at,
+                     "updated_at": updated_at}
+                    for title, date, description, image_filename, search_count, contains_money,
+                    url, body, author, published_at, updated_at
+                    in zip(articles.titles, articles.dates, articles.descriptions,
+                           articles.image_filenames, articles.search_counts,
+                           articles.contains_money, articles.urls, articles.bodies,
+                           articles.authors, articles.published_at, articles.updated_at)],
+                    file)
+            for image_filename in set(filter(None, articles.image_filenames)):
+                file_name = format_to_allowed_filename(image_filename)
+                path = os.path.join(images_dir, file_name)
+                if os.path.isfile(path):
+                    shutil.copy2(path, os.path.join(temporary_dir, "images"))
+                elif image_store and file_name in image_store:
+                    image_store.export_dir(os.path.join(temporary_dir, "images"), [file_name])
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(temporary_dir, entry_dir)
+        except OSError as exception:
+            logger.warning("Error caching the search results: %s", exception)
+            shutil.rmtree(temporary_dir, ignore_errors=True)
+            return
+        finally:
+            if image_store:
+                image_store.close()
+
+        with file_lock(f"{self.index_path}.lock"):
+            index = self._read_index()
+            now = time.time()
+            index[key] = {"saved_at": now, "used_at": now, "bytes": measure_dir(entry_dir)}
+            self._evict(index)
+            self._write_index(index)
+
+    def _evict(self, index: dict) -> None:
+        """Removes expired entries and the least recently used ones over the bounds."""
+        now = time.time()
+        for key in [key for key, entry in index.items() if now - entry["saved_at"] >= self.ttl]:
+            self._remove(index, key)
+        by_use = sorted(index, key=lambda key: index[key]["used_at"])
+        while by_use and (len(index) > self.max_entries or
+                          sum(entry["bytes"] for entry in index.values()) > self.max_bytes):
+            self._remove(index, by_use.pop(0))
+
+    def _remove(self, index: dict, key: str) -> None:
+        """Removes an entry from the index and the disk."""
+        index.pop(key, None)
+        shutil.rmtree(os.path.join(self.cache_dir, key), ignore_errors=True)
+        logger.info("Evicted search results %s from the cache", key)
+
+    def _read_index(self) -> dict:
+        """Reads the index; must be called while holding the index lock."""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, index: dict) -> None:
+        """Writes the index; must be called while holding the index lock."""
+        temporary_path = f"{self.index_path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(index, file)
+        os.replace(temporary_path, self.index_path)
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""
+Module for the history of the monitored searches.
+
+The scheduler polls a list of searches again and again. For each search this module keeps, in
+a JSON file under the state directory, when it last ran, how often it is polled, a moving
+average of the new articles it produced per hour and the keys of the articles already seen,
+so the next run can tell the new articles apart.
+"""
+import json
+import os
+import time
+
+import utils.values_utils
+from utils.lock_utils import file_lock
+
+# Articles remembered per search to recognize the ones already seen.
+MAX_SEEN_ARTICLES = 2000
+
+
+class QueryHistoryRepository:
+    """
+    Repository for the polling history of each monitored search.
+
+    Every entry is keyed by `strings_utils.define_query_key` and holds `last_run`, `interval`
+    (seconds until the next poll), `new_rate` (moving average of new articles per hour), `runs`,
+    `failures` and `seen` (keys of the newest articles already seen).
+
+    Attributes:
+        path (str): Path of the JSON history file, shared by every scheduler of the host.
+    """
+    def __init__(self):
+        self.path = os.path.join(
+            utils.values_utils.get_state_dir_value(), "query_history.json")
+
+    def load(self) -> dict:
+        """
+        Loads the history of every search.
+
+        Returns:
+            dict: The history entries by query key.
+        """
+        with file_lock(f"{self.path}.lock"):
+            return self._read()
+
+    def update(self, key: str, entry: dict) -> None:
+        """
+        Saves the history of a search, keeping the entries of the other ones.
+
+        Args:
+            key (str): The query key of the search.
+            entry (dict): The history entry of the search.
+        """
+        entry["seen"] = entry["seen"][-MAX_SEEN_ARTICLES:]
+        with file_lock(f"{self.path}.lock"):
+            history = self._read()
+            history[key] = entry
+            temporary_path = f"{self.path}.tmp"
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                json.dump(history, file)
+            os.replace(temporary_path, self.path)
+
+    @staticmethod
+    def new_entry(interval: float) -> dict:
+        """
+        Creates the history of a search never run, due immediately.
+
+        Args:
+            interval (float): Seconds between polls to start with.
+
+        Returns:
+            dict: The history entry.
+        """
+        return {
+            "last_run": 0.0,
+            "interval": interval,
+            "new_rate": 0.0,
+            "runs": 0,
+            "failures": 0,
+            "seen": [],
+            "updated_at": time.time()}
+
+    def _read(self) -> dict:
+        """Reads the whole history file; must be called while holding the lock."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
@@ -0,0 +1,130 @@
+"""
+Module for the report of a run.
+
+This module provides the `RunReportRepository` class, which writes a machine-readable summary of
+each run: the search parameters, the duration, the number of articles, the time and article count
+of each results page, the network statistics of each page and their totals by domain and
+resource type, the memory of the browser at each page boundary, the health of the page selectors
+and the enrichment of the articles with their article pages.
+Load tests and runner sizing read the report instead of parsing the logs.
+
+Every run writes its own file under `output/run_reports/`, so concurrent runs sharing a working
+directory, such as the searches of the scheduler, never overwrite each other's report. The
+report of the run that finished last is also copied to `output/run_report.json`.
+"""
+from datetime import datetime
+import json
+import logging
+import os
+import time
+import uuid
+
+import utils.values_utils
+from utils.network_utils import aggregate_network_stats
+
+logger = logging.getLogger(__name__)
+
+
+class RunReportRepository:
+    """
+    Repository for the report of a run.
+
+    The report is built while the run goes on and written once, when the run finishes or
+    fails.
+
+    Attributes:
+        path (str): Path of the JSON report file of the run.
+        latest_path (str): Path of the copy of the report of the run that finished last.
+        report (dict): The report of the run.
+    """
+    FILENAME = "run_report.json"
+
+    def __init__(self, engine: str, phrase: str, categories: str, months: int):
+        output_dir = utils.values_utils.get_output_dir_value()
+        self.run_id = f"{datetime.now():%Y%m%dT%H%M%S}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.path = os.path.join(output_dir, "run_reports", f"{self.run_id}.json")
+        self.latest_path = os.path.join(output_dir, self.FILENAME)
+        self.started_at = time.monotonic()
+        self.report = {
+            "engine": engine,
+            "query": {"phrase": phrase, "categories": categories, "months": months},
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+            "duration": None,
+            "failed": False,
+            "articles": 0,
+            "network_totals": None,
+            "pages": [],
+            "network": [],
+            "memory": [],
+            "browser_restarts": 0,
+            "selectors": {"probe": None, "matches": {}},
+            "article_details": None}
+
+    def add_pages(self, page_timings: list[dict], page_network_stats: list[dict]) -> None:
+        """
+        Adds the time and the network statistics of the pages read.
+
+        Args:
+            page_timings (list[dict]): Page number, seconds and article count of each page.
+            page_network_stats (list[dict]): Network summary of each page, added up into
+                `network_totals`.
+        """
+        self.report["pages"].extend(page_timings)
+        self.report["network"].extend(page_network_stats)
+        if self.report["network"]:
+            self.report["network_totals"] = aggregate_network_stats(self.report["network"])
+
+    def add_memory_timeline(self, memory_timeline: list[dict], browser_restarts: int) -> None:
+        """
+        Adds the memory samples of the browser taken at each page boundary.
+
+        Args:
+            memory_timeline (list[dict]): The memory samples (see `CustomSelenium.sample_memory`).
+            browser_restarts (int): Number of times the browser was restarted by the watchdog.
+        """
+        self.report["memory"].extend(memory_timeline)
+        self.report["browser_restarts"] += browser_restarts
+
+    def add_selector_health(self, probe_report: dict, matches: dict) -> None:
+        """
+        Adds the selector health check of the first page and the matches of each selector.
+
+        Args:
+            probe_report (dict): The health report of the first page, None when it was not
+                probed (see `selector_health.build_health_report`).
+            matches (dict): The matches of each selector during the run
+                (see `SelectorStats.as_dict`).
+        """
+        self.report["selectors"] = {"probe": probe_report, "matches": matches}
+
+    def add_article_details(self, stats: dict) -> None:
+        """
+        Adds the enrichment of the articles with their article pages.
+
+        Args:
+            stats (dict): The articles enriched from the cache and from the site, the ones
+                whose page could not be read and the seconds spent fetching
+                (see `ArticleDetailsEnricher.stats`).
+        """
+        self.report["article_details"] = dict(stats)
+
+    def save(self, articles: int, failed: bool = False) -> None:
+        """
+        Completes the report with the outcome of the run and writes it.
+
+        Args:
+            articles (int): Number of articles extracted.
+            failed (bool): Whether the run ended with an error.
+        """
+        self.report["duration"] = round(time.monotonic() - self.started_at, 3)
+        self.report["articles"] = articles
+        self.report["failed"] = failed
+        for path in (self.path, self.latest_path):
+            temporary_path = f"{path}.{self.run_id}.tmp"
+            try:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                with open(temporary_path, "w", encoding="utf-8") as file:
+                    json.dump(self.report, file, indent=2)
+                os.replace(temporary_path, path)
+            except OSError as exception:
+                logger.warning("Error writing run report %s: %s", path, exception)
@@ -1,9 +1,9 @@
 """ Define the method and what should return from a news scraping   """
 from abc import ABC, abstractmethod
-from entities.article_entity import Article
+from entities.article_batch_entity import ArticleBatch
 
 class ArticleScraperInterface(ABC):
     """Class scraper of an Article"""
     @abstractmethod
-    def fetch_article(self, search_params) -> list[Article]:
+    def fetch_article(self, search_params) -> ArticleBatch:
         """fetch the article using the params"""
@@ -1,9 +1,10 @@
 '''Define the structure to save a article in the repository(excel in this case) '''
 from abc import ABC, abstractmethod
 from entities.article_entity import Article
+from entities.article_batch_entity import ArticleBatch
 
 class ArticleRepositoryInterface(ABC):
     """Class repository of an Article"""
     @abstractmethod
-    def save_articles(self, articles: list[Article], search_phrase: str, month:int) -> None:
+    def save_articles(self, articles: list[Article] | ArticleBatch, search_phrase: str, month:int) -> None:
         """Save articles in the repository"""
@@ -10,27 +10,55 @@ Modules:
 - `ArticleGateway`: Handles interactions with the article data source.
 - `ParamsGateway`: Manages the parameters used for scraping articles.
 - `ArticleScraper`: Performs the scraping of articles based on the provided parameters.
+- `ArticleHttpScraper`: Performs the same scraping without a browser when the pages allow it.
+- `ArticleReplayScraper`: Re-extracts the articles of an archived run without a browser.
 - `ArticleRepository`: Manages the storage and retrieval of articles.
+- `CachedArticleGateway`: Serves repeated searches from the query result cache.
+- `IndexedArticleGateway`: Answers searches recently indexed from the local article index.
+- `ArticleIndexRepository`: Full-text index of every article extracted.
+- `OutputChunkRepository`: Hands the articles over in chunks to downstream consumers.
 - `ExtractArticle`: Encapsulates the use case for extracting news articles.
+- `AsyncExtractArticle`: Runs the same use case as a pipeline of concurrent asyncio stages.
 
 Functions:
-- `main`: Sets up the necessary components and executes the news extraction process.
+- `main`: Sets up logging and executes the news extraction process.
+- `run_extraction`: Sets up the necessary components and runs the use case.
+
+The scrapers other than the browser one, the asyncio orchestrator and the heavy libraries they
+use (Selenium, requests, lxml, openpyxl) are imported only by the paths that need them, so
+runs answered from the cache or the index start quickly (see `benchmarks/startup_budget.py`).
 
 Usage:
 Run this module as the main program to start the article extraction process with default
 or provided parameters.
 """
+from typing import Callable
+
+from entities.article_batch_entity import ArticleBatch
 from frameworks_drivers.gateways.article_gateway import ArticleGateway
+from frameworks_drivers.gateways.cached_article_gateway import CachedArticleGateway
+from frameworks_drivers.gateways.indexed_article_gateway import IndexedArticleGateway
 from frameworks_drivers.gateways.article_params_gateway import ParamsGateway
 from frameworks_drivers.gateways.article_scraper_gateway import ArticleScraper
+from frameworks_drivers.repositories.page_archive_repository import PageArchiveRepository
 from frameworks_drivers.repositories.article_repository import ArticleRepository
+from frameworks_drivers.repositories.article_index_repository import ArticleIndexRepository
+from frameworks_drivers.repositories.query_cache_repository import QueryCacheRepository
+from frameworks_drivers.repositories.output_chunk_repository import OutputChunkRepository
 from use_cases.extract_news import ExtractArticle
+from utils.logging_utils import setup_logging, stop_logging
+import utils.values_utils
 
 
 def main(
         phrase: str = None,
         category: str = None,
-        months: int = None) -> None:
+        months: int = None,
+        orchestrator: str = None,
+        engine: str = None,
+        replay: str = None,
+        emit_chunk: Callable[[dict, list[str]], None] = None,
+        use_cache: bool = True) -> ArticleBatch:
     """
     Main function to execute the news extraction use case.
 
@@ -43,11 +71,62 @@ def main(
         no category filter is applied. months (int, optional): 
         The time frame in months to consider for the news articles. 
         Defaults to 1 if not provided or if the value is less than 1.
+        orchestrator (str, optional): "async" to run the scrape, picture and Excel stages
+        concurrently with `AsyncExtractArticle`. Defaults to the sequential `ExtractArticle`.
+        engine (str, optional): "http" to fetch the results pages without a browser, falling
+        back to the browser when they need JavaScript. Defaults to the browser.
+        replay (str, optional): Identifier of an archived run (see `PageArchiveRepository`) to
+        re-extract instead of scraping; the search parameters are taken from the archive.
+        emit_chunk (Callable[[dict, list[str]], None], optional): Called with the payload and
+        picture paths of each chunk of articles (see `OutputChunkRepository`). With the async
+        orchestrator the chunks are emitted while the pages are scraped.
+        use_cache (bool, optional): False to always scrape the site, bypassing the query cache
+        and the fresh coverage of the article index. Used by the scheduler, whose polls must
+        see new articles.
+
+    Returns:
+        ArticleBatch: The articles extracted, so callers such as the scheduler can tell the new
+        ones apart.
+    """
+
+    log_listener = setup_logging()
+    try:
+        return run_extraction(
+            phrase, category, months, orchestrator, engine, replay, emit_chunk, use_cache)
+    finally:
+        stop_logging(log_listener)
+
+
+def run_extraction(
+        phrase: str,
+        category: str,
+        months: int,
+        orchestrator: str,
+        engine: str,
+        replay: str,
+        emit_chunk: Callable[[dict, list[str]], None] = None,
+        use_cache: bool = True) -> ArticleBatch:
+    """
+    Builds the gateways and repositories for the given parameters and runs the use case.
+
+    Args:
+        phrase (str): The search phrase.
+        category (str): The comma-separated categories.
+        months (int): The number of months to search.
+        orchestrator (str): "async" to run `AsyncExtractArticle`.
+        engine (str): "http" to scrape without a browser.
+        replay (str): Identifier of an archived run to re-extract.
+        emit_chunk (Callable[[dict, list[str]], None]): Emitter of the output chunks, optional.
+        use_cache (bool): False to bypass the query cache and the article index coverage.
 
     Returns:
-        None: This function does not return anything; 
-        it triggers the execution of the news extraction process.
+        ArticleBatch: The articles extracted.
     """
+    if replay:
+        archive = PageArchiveRepository.open_run(replay)
+        phrase = archive.query.get("phrase")
+        category = archive.query.get("categories")
+        months = archive.query.get("months")
 
     if phrase is None:
         phrase = ""
@@ -58,13 +137,53 @@ def main(
 
     params = ParamsGateway(phrase, category, months)
 
-    article_scraping = ArticleScraper(params)
-    article_gateway = ArticleGateway(article_scraping)
     article_repository = ArticleRepository()
-    extract_news_use_case = ExtractArticle(
-        article_gateway, article_repository, params)
+    index_settings = utils.values_utils.get_article_index_value()
+    article_index = ArticleIndexRepository.from_settings(
+        index_settings, utils.values_utils.get_state_dir_value())
+    output_chunks = OutputChunkRepository.from_settings(
+        emit_chunk, phrase, category, months, utils.values_utils.get_output_chunks_value())
+
+    async_gateway = None
+    try:
+        # pylint: disable=import-outside-toplevel
+        if replay:
+            from frameworks_drivers.gateways.article_replay_gateway import ArticleReplayScraper
+            article_scraping = ArticleReplayScraper(archive)
+        elif engine == "http":
+            from frameworks_drivers.gateways.article_http_scraper_gateway import ArticleHttpScraper
+            article_scraping = ArticleHttpScraper(params)
+        elif orchestrator == "async":
+            import asyncio
+            from frameworks_drivers.gateways.async_article_gateway import AsyncArticleGateway
+            from use_cases.extract_news_async import AsyncExtractArticle
+
+            def extract_async(article_scraper) -> ArticleBatch:
+                return asyncio.run(
+                    AsyncExtractArticle(
+                        article_scraper, article_repository, params,
+                        article_index=article_index, output_chunks=output_chunks).execute())
+            async_gateway = AsyncArticleGateway(extract_async, ArticleScraper(params))
+        else:
+            article_scraping = ArticleScraper(params)
+
+        article_gateway = async_gateway or ArticleGateway(article_scraping)
+        if article_index and index_settings.get("fresh_coverage_age") and use_cache and not replay:
+            article_gateway = IndexedArticleGateway(
+                article_gateway, params, article_index, index_settings["fresh_coverage_age"])
+        query_cache = QueryCacheRepository.from_settings(
+            utils.values_utils.get_query_cache_value())
+        if query_cache and use_cache and not replay:
+            article_gateway = CachedArticleGateway(article_gateway, params, query_cache)
+        if async_gateway:
+            return async_gateway.deliver(article_gateway.return_articles())
+        extract_news_use_case = ExtractArticle(
+            article_gateway, article_repository, params, article_index, output_chunks)
 
-    extract_news_use_case.execute()
+        return extract_news_use_case.execute()
+    finally:
+        if article_index:
+            article_index.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,143 @@
+"""
+This module answers questions about the articles already extracted, from the local index.
+
+It reads the full-text index kept by `ArticleIndexRepository`, so questions such as "how many
+articles mentioned X in the last N months, and how many times" are answered locally in
+milliseconds instead of scraping the site again. Excel files written before the index existed
+can be added to it with `--import-xlsx`.
+
+Functions:
+- `query`: Counts or lists the indexed articles matching the filters.
+- `import_xlsx`: Adds the articles of Excel files written by `ArticleRepository` to the index.
+- `main`: Parses the command line and prints the answer as JSON.
+
+Usage:
+    python src/query_index.py "interest rates" --months 3
+    python src/query_index.py "interest rates" --since 2024-01-01 --money yes --list 20
+    python src/query_index.py --import-xlsx output/*.xlsx
+"""
+import argparse
+from datetime import datetime
+import json
+import time
+
+from entities.article_batch_entity import ArticleBatch
+from frameworks_drivers.repositories.article_index_repository import ArticleIndexRepository
+import utils.date_utils
+import utils.values_utils
+
+
+def query(
+        article_index: ArticleIndexRepository,
+        phrase: str,
+        months: int = None,
+        since: datetime = None,
+        until: datetime = None,
+        contains_money: bool = None,
+        limit: int = None) -> dict:
+    """
+    Counts, and optionally lists, the indexed articles matching the filters.
+
+    Args:
+        article_index (ArticleIndexRepository): The index.
+        phrase (str): The phrase to look for in the title and description.
+        months (int, optional): Number of months to look back, counting the current one, as in
+            a search. Ignored when `since` is given.
+        since (datetime, optional): Oldest publication date included.
+        until (datetime, optional): Newest publication date included.
+        contains_money (bool, optional): Only articles with (True) or without (False) money.
+        limit (int, optional): Number of matching articles to list, newest first.
+
+    Returns:
+        dict: The filters, `articles`, `occurrences`, the time taken and the listed articles.
+    """
+    started_at = time.perf_counter()
+    if since is None and months:
+        since = utils.date_utils.return_start_of_month(
+            utils.date_utils.return_current_month_plus_next_months(months - 1))
+    answer = {
+        "phrase": phrase,
+        "since": since.isoformat() if since else None,
+        "until": until.isoformat() if until else None,
+        "contains_money": contains_money}
+    answer.update(article_index.count_phrase(phrase, since, until, contains_money))
+    if limit:
+        answer["results"] = [
+            dict(row, date=row["date"].isoformat())
+            for row in article_index.search(phrase, since, until, contains_money, limit)]
+    answer["milliseconds"] = round((time.perf_counter() - started_at) * 1000, 2)
+    return answer
+
+
+def import_xlsx(article_index: ArticleIndexRepository, paths: list[str]) -> int:
+    """
+    Adds the articles of Excel files written by `ArticleRepository` to the index.
+
+    The files do not record the categories and months of their search, so the articles are
+    indexed without marking any search as covered.
+
+    Args:
+        article_index (ArticleIndexRepository): The index.
+        paths (list[str]): Paths of the Excel files.
+
+    Returns:
+        int: The number of articles not indexed before.
+    """
+    from openpyxl import load_workbook  # pylint: disable=import-outside-toplevel
+    added = 0
+    for path in paths:
+        workbook = load_workbook(path, read_only=True)
+        batch = ArticleBatch()
+        for row in workbook.active.iter_rows(min_row=2, values_only=True):
+            title, date, description, image_filename, search_count, money = row[:6]
+            if isinstance(date, datetime):
+                batch.append(title or "", date, description or "", image_filename,
+                             int(search_count or 0), bool(money))
+        workbook.close()
+        added += article_index.add_articles(batch)
+    return added
+
+
+def parse_date(value: str) -> datetime:
+    """Parses a YYYY-MM-DD command line date"""
+    return datetime.strptime(value, "%Y-%m-%d")
+
+
+def main() -> None:
+    """Parses the command line and prints the answer as JSON"""
+    parser = argparse.ArgumentParser(
+        description="Counts the indexed articles mentioning a phrase")
+    parser.add_argument("phrase", nargs="?", default="")
+    parser.add_argument("--months", type=int, default=None,
+                        help="months to look back, counting the current one")
+    parser.add_argument("--since", type=parse_date, default=None, help="YYYY-MM-DD")
+    parser.add_argument("--until", type=parse_date, default=None, help="YYYY-MM-DD")
+    parser.add_argument("--money", choices=("yes", "no"), default=None,
+                        help="only articles with or without money amounts")
+    parser.add_argument("--list", type=int, default=0, metavar="N",
+                        help="list the N newest matching articles")
+    parser.add_argument("--import-xlsx", nargs="+", default=None, metavar="FILE",
+                        help="add the articles of Excel files to the index")
+    args = parser.parse_args()
+
+    settings = dict(utils.values_utils.get_article_index_value(), enabled=True)
+    article_index = ArticleIndexRepository.from_settings(
+        settings, utils.values_utils.get_state_dir_value())
+    try:
+        if args.import_xlsx:
+            print(json.dumps({"imported": import_xlsx(article_index, args.import_xlsx)}))
+            return
+        print(json.dumps(query(
+            article_index,
+            args.phrase,
+            args.months,
+            args.since,
+            args.until,
+            None if args.money is None else args.money == "yes",
+            args.list), indent=2, ensure_ascii=False))
+    finally:
+        article_index.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,249 @@
+"""
+This module defines the scheduler that polls a list of searches with `main.main`.
+
+Instead of running every search on a fixed schedule, the scheduler keeps the history of each
+search (see `QueryHistoryRepository`) and adapts how often it is polled to how many new articles
+it produces:
+
+- A search that produced new articles is polled twice as often next time, down to
+  `min_interval`; a search that produced none backs off to twice its interval, up to
+  `max_interval`.
+- When more searches are due than the concurrency budget allows, the ones with the highest
+  moving average of new articles per hour run first.
+- At most `max_concurrency` searches run at the same time, each in its own process, so the
+  browsers of the host stay within the budget.
+
+Classes:
+- `SearchScheduler`: Decides which searches are due and runs them within the budget.
+
+Functions:
+- `run_search`: Runs one search with `main.main` and returns the keys of its articles.
+- `main`: Reads the `scheduler` settings of values.json and runs the scheduler.
+
+Usage:
+    python src/scheduler.py          # polls the searches until interrupted
+    python src/scheduler.py --once   # runs the searches due now and exits
+"""
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import logging
+import multiprocessing
+import time
+
+from frameworks_drivers.repositories.query_history_repository import QueryHistoryRepository
+from utils.logging_utils import setup_logging, stop_logging
+import utils.values_utils
+from utils.strings_utils import define_query_key
+
+logger = logging.getLogger(__name__)
+
+
+# Longest time (in seconds) the scheduler sleeps before checking the searches again.
+MAX_SLEEP = 60
+
+
+def run_search(query: dict, engine: str = None) -> list[str]:
+    """
+    Runs one search with `main.main` in a worker process.
+
+    The query cache is bypassed: a poll served from it would find no new article, however
+    short its interval, and its interval would only grow.
+
+    Args:
+        query (dict): The search, with the keys `phrase`, `categories` and `months`.
+        engine (str, optional): The engine given to `main.main`.
+
+    Returns:
+        list[str]: The keys of the articles extracted (see `ArticleBatch.keys`).
+    """
+    from main import main  # pylint: disable=import-outside-toplevel
+    articles = main(query.get("phrase"), query.get("categories"), query.get("months"),
+                    engine=engine, use_cache=False)
+    return list(articles.keys()) if articles is not None else []
+
+
+class SearchScheduler:
+    """
+    Polls a list of searches, adapting their interval to the new articles they produce.
+
+    Attributes:
+        queries (list[dict]): The searches, with the keys `phrase`, `categories` and `months`.
+        max_concurrency (int): Maximum number of searches running at the same time.
+        initial_interval (float): Seconds between polls of a search never run.
+        min_interval (float): Shortest number of seconds between two polls of a search.
+        max_interval (float): Longest number of seconds between two polls of a search.
+        smoothing (float): Weight of the newest run in the moving average of new articles.
+        engine (str): The engine given to `main.main`.
+        history_repository (QueryHistoryRepository): The history of the searches.
+    """
+    def __init__(
+            self,
+            queries: list[dict],
+            max_concurrency: int = 2,
+            initial_interval: float = 3600,
+            min_interval: float = 900,
+            max_interval: float = 86400,
+            smoothing: float = 0.3,
+            engine: str = None,
+            history_repository: QueryHistoryRepository = None):
+        self.queries = {
+            define_query_key(
+                query.get("phrase"), query.get("categories"), query.get("months")): query
+            for query in queries}
+        self.max_concurrency = max(1, max_concurrency)
+        self.initial_interval = initial_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.smoothing = smoothing
+        self.engine = engine
+        self.history_repository = history_repository or QueryHistoryRepository()
+
+    @classmethod
+    def from_settings(cls, settings: dict) -> "SearchScheduler":
+        """
+        Creates a scheduler from the `scheduler` settings of values.json.
+
+        Args:
+            settings (dict): The `scheduler` settings.
+
+        Returns:
+            SearchScheduler: The scheduler.
+        """
+        options = {key: value for key, value in settings.items() if key != "queries"}
+        return cls(settings.get("queries", []), **options)
+
+    def due_queries(self, history: dict, now: float, running: set) -> list[str]:
+        """
+        Returns the keys of the searches due, highest priority first.
+
+        Args:
+            history (dict): The history entries by query key.
+            now (float): The current time.
+            running (set): Keys of the searches running.
+
+        Returns:
+            list[str]: The keys of the searches due and not running.
+        """
+        due = []
+        for key in self.queries:
+            entry = history.get(key) or QueryHistoryRepository.new_entry(self.initial_interval)
+            if key not in running and now >= entry["last_run"] + entry["interval"]:
+                due.append((-entry["new_rate"], entry["last_run"] + entry["interval"], key))
+        return [key for _, _, key in sorted(due)]
+
+    def next_due_time(self, history: dict, running: set) -> float:
+        """Returns when the next search not running is due, None when every search runs"""
+        times = [
+            entry["last_run"] + entry["interval"]
+            for key in self.queries if key not in running
+            for entry in [history.get(key) or
+                          QueryHistoryRepository.new_entry(self.initial_interval)]]
+        return min(times, default=None)
+
+    def record_result(self, key: str, started_at: float, article_keys: list[str]) -> int:
+        """
+        Updates the history of a search after a run.
+
+        Args:
+            key (str): The query key of the search.
+            started_at (float): When the run started.
+            article_keys (list[str]): Keys of the articles extracted, None when the run failed.
+
+        Returns:
+            int: The number of new articles.
+        """
+        entry = self.history_repository.load().get(key) or \
+            QueryHistoryRepository.new_entry(self.initial_interval)
+        elapsed_hours = ((started_at - entry["last_run"]) if entry["runs"]
+                         else entry["interval"]) / 3600
+        entry["last_run"] = started_at
+        entry["runs"] += 1
+        entry["updated_at"] = time.time()
+        if article_keys is None:
+            entry["failures"] += 1
+            self.history_repository.update(key, entry)
+            return 0
+
+        seen = set(entry["seen"])
+        new_keys = [article_key for article_key in article_keys if article_key not in seen]
+        new_rate = len(new_keys) / max(elapsed_hours, 1 / 60)
+        entry["new_rate"] = (self.smoothing * new_rate +
+                             (1 - self.smoothing) * entry["new_rate"])
+        if new_keys:
+            entry["interval"] = max(self.min_interval, entry["interval"] / 2)
+        else:
+            entry["interval"] = min(self.max_interval, entry["interval"] * 2)
+        entry["seen"].extend(new_keys)
+        self.history_repository.update(key, entry)
+        return len(new_keys)
+
+    def run(self, once: bool = False) -> None:
+        """
+        Runs the due searches within the concurrency budget, until interrupted.
+
+        Args:
+            once (bool): Whether to stop once the searches due at the start have run.
+        """
+        running = {}
+        launched = set()
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(self.max_concurrency, mp_context=context) as executor:
+            while True:
+                history = self.history_repository.load()
+                now = time.time()
+                running_keys = {key for key, _ in running.values()}
+                for key in self.due_queries(history, now, running_keys):
+                    if len(running) >= self.max_concurrency:
+                        break
+                    if once and key in launched:
+                        continue
+                    logger.info("Running search %s", self.queries[key])
+                    running[executor.submit(run_search, self.queries[key], self.engine)] = \
+                        (key, now)
+                    running_keys.add(key)
+                    launched.add(key)
+
+                if once and not running:
+                    return
+                next_due = self.next_due_time(history, running_keys)
+                timeout = MAX_SLEEP if next_due is None else \
+                    min(MAX_SLEEP, max(1.0, next_due - time.time()))
+                if not running:
+                    time.sleep(timeout)
+                    continue
+                finished, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    self._finish(future, *running.pop(future))
+
+    def _finish(self, future, key: str, started_at: float) -> None:
+        """Records the outcome of a finished search"""
+        try:
+            article_keys = future.result()
+        except Exception as exception:  # pylint: disable=broad-except
+            logger.error("Search %s failed: %s", self.queries[key], exception)
+            article_keys = None
+        new_articles = self.record_result(key, started_at, article_keys)
+        logger.info(
+            "Search %s: %d new articles, next poll in %.0f minutes",
+            self.queries[key], new_articles,
+            self.history_repository.load()[key]["interval"] / 60)
+
+
+def main() -> None:
+    """Reads the `scheduler` settings of values.json and runs the scheduler"""
+    parser = argparse.ArgumentParser(description="Polls the searches of values.json")
+    parser.add_argument("--once", action="store_true",
+                        help="run the searches due now and exit")
+    args = parser.parse_args()
+
+    log_listener = setup_logging()
+    try:
+        SearchScheduler.from_settings(utils.values_utils.get_scheduler_value()).run(args.once)
+    except KeyboardInterrupt:
+        logger.info("Scheduler stopped")
+    finally:
+        stop_logging(log_listener)
+
+
+if __name__ == '__main__':
+    main()
@@ -19,9 +19,16 @@ Dependencies:
     - `ArticleRepository`: Provides methods to save articles and images.
     - `ParamsGateway`: Provides search parameters including the search phrase and time frame.
 """
-from frameworks_drivers.gateways.article_gateway import ArticleGateway
-from frameworks_drivers.repositories.article_repository import ArticleRepository
+from typing import TYPE_CHECKING
+
 from frameworks_drivers.gateways.article_params_gateway import ParamsGateway
+from entities.article_batch_entity import ArticleBatch
+
+if TYPE_CHECKING:
+    from frameworks_drivers.gateways.article_gateway import ArticleGateway
+    from frameworks_drivers.repositories.article_repository import ArticleRepository
+    from frameworks_drivers.repositories.article_index_repository import ArticleIndexRepository
+    from frameworks_drivers.repositories.output_chunk_repository import OutputChunkRepository
 
 class ExtractArticle:
     """
@@ -37,16 +44,24 @@ class ExtractArticle:
         article_repository (ArticleRepository): Repository to store articles and images.
         search_params (ParamsGateway): Parameters for the article search including phrase and 
         time frame.
+        article_index (ArticleIndexRepository): Full-text index the articles are added to,
+        optional.
+        output_chunks (OutputChunkRepository): Emits the articles in chunks once they are
+        extracted, optional.
     """
     def __init__(self,
-                 article_gateway: ArticleGateway,
-                 article_repository: ArticleRepository,
-                 search_params: ParamsGateway):
+                 article_gateway: "ArticleGateway",
+                 article_repository: "ArticleRepository",
+                 search_params: ParamsGateway,
+                 article_index: "ArticleIndexRepository" = None,
+                 output_chunks: "OutputChunkRepository" = None):
         self.article_gateway = article_gateway
         self.article_repository = article_repository
         self.search_params = search_params
+        self.article_index = article_index
+        self.output_chunks = output_chunks
 
-    def execute(self):
+    def execute(self) -> ArticleBatch:
         """
         Executes the process of extracting and saving news articles.
 
@@ -54,12 +69,21 @@ class ExtractArticle:
         1. Retrieves the search phrase and current month from the search parameters.
         2. Fetches articles from the article gateway.
         3. Saves the fetched articles and their images into the repository.
+        4. Adds the articles to the full-text index, when one is set.
+        5. Emits the articles in chunks, when an output chunk repository is set.
 
         Returns:
-            None: This method does not return any value.
+            ArticleBatch: The articles extracted.
         """
         search_phrase = self.search_params.phrase
         month = self.search_params.current_month_plus
         articles = self.article_gateway.return_articles()
         self.article_repository.save_articles(articles, search_phrase, month)
-        self.article_repository.save_articles_images()
+        self.article_repository.save_articles_images(articles.image_filenames)
+        if self.article_index:
+            self.article_index.add_articles(
+                articles, search_phrase, self.search_params.categories, month)
+        if self.output_chunks:
+            self.output_chunks.add(articles)
+            self.output_chunks.close()
+        return articles
@@ -0,0 +1,244 @@
+"""
+Module for Extracting and Storing News Articles with asyncio
+
+This module defines the `AsyncExtractArticle` class, an alternative to `ExtractArticle` that
+runs the extraction as a pipeline of concurrent stages instead of scraping, saving and zipping
+one after another:
+
+    page extraction -> picture writing -> thumbnailing
+                    -> Excel writing
+                    -> output chunks (optional)
+
+The Selenium driver is synchronous, so every browser call runs in a dedicated single-thread
+executor. The stages are connected by bounded `asyncio.Queue` objects, so a slow stage makes the
+ones before it wait instead of piling up pages in memory. When a stage fails or the run is
+cancelled, the other stages are cancelled and the browser is still quit.
+
+Classes:
+    AsyncExtractArticle: Manages the concurrent extraction and storage of news articles.
+
+Dependencies:
+    - `ArticleScraper`: Provides the article data one results page at a time.
+    - `ArticleRepository`: Provides the Excel writer and the zipping of the images.
+    - `ParamsGateway`: Provides search parameters including the search phrase and time frame.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+import queue
+from typing import TYPE_CHECKING
+
+from entities.article_batch_entity import ArticleBatch
+from frameworks_drivers.gateways.article_params_gateway import ParamsGateway
+import utils.image_utils
+import utils.values_utils
+
+if TYPE_CHECKING:
+    from frameworks_drivers.gateways.article_scraper_gateway import ArticleScraper
+    from frameworks_drivers.repositories.article_repository import ArticleRepository
+    from frameworks_drivers.repositories.article_index_repository import ArticleIndexRepository
+    from frameworks_drivers.repositories.output_chunk_repository import OutputChunkRepository
+
+logger = logging.getLogger(__name__)
+
+
+# Marks the end of the items put in a stage queue.
+END_OF_STAGE = None
+
+
+class AsyncExtractArticle:
+    """
+    A class to handle the concurrent extraction and storage of news articles.
+
+    Attributes:
+        article_scraper (ArticleScraper): Scraper providing the articles page by page.
+        article_repository (ArticleRepository): Repository to store articles and images.
+        search_params (ParamsGateway): Parameters for the article search including phrase and
+        time frame.
+        queue_size (int): Maximum number of items waiting between two stages.
+        article_index (ArticleIndexRepository): Full-text index the articles are added to,
+        optional.
+        output_chunks (OutputChunkRepository): Emits the articles in chunks while the pages
+        are scraped, optional.
+    """
+    def __init__(self,
+                 article_scraper: "ArticleScraper",
+                 article_repository: "ArticleRepository",
+                 search_params: ParamsGateway,
+                 queue_size: int = 4,
+                 article_index: "ArticleIndexRepository" = None,
+                 output_chunks: "OutputChunkRepository" = None):
+        self.article_scraper = article_scraper
+        self.article_repository = article_repository
+        self.search_params = search_params
+        self.queue_size = queue_size
+        self.article_index = article_index
+        self.output_chunks = output_chunks
+
+    async def execute(self) -> ArticleBatch:
+        """
+        Executes the extraction pipeline and waits for every stage to finish.
+
+        Returns:
+            ArticleBatch: The articles extracted.
+        """
+        loop = asyncio.get_running_loop()
+        driver_executor = ThreadPoolExecutor(1, thread_name_prefix="driver")
+        sink_executor = ThreadPoolExecutor(1, thread_name_prefix="sink")
+        rows_queue = asyncio.Queue(self.queue_size)
+        pictures_queue = asyncio.Queue(self.queue_size)
+        thumbnails_queue = asyncio.Queue(self.queue_size)
+        chunks_queue = asyncio.Queue(self.queue_size) if self.output_chunks else None
+        articles = ArticleBatch()
+        written_pictures = queue.Queue()
+        pages = self.article_scraper.iter_news_pages(written_pictures)
+
+        stages = [
+            asyncio.create_task(self._extract_pages(
+                loop, driver_executor, pages, rows_queue, pictures_queue, chunks_queue)),
+            asyncio.create_task(self._write_pictures(
+                loop, pictures_queue, thumbnails_queue, written_pictures)),
+            asyncio.create_task(self._create_thumbnails(loop, thumbnails_queue)),
+            asyncio.create_task(self._write_articles(
+                loop, sink_executor, rows_queue, articles))]
+        if chunks_queue:
+            stages.append(asyncio.create_task(self._emit_chunks(loop, chunks_queue)))
+        try:
+            await asyncio.gather(*stages)
+            await loop.run_in_executor(
+                sink_executor, self.article_repository.save_articles_images,
+                articles.image_filenames)
+        except BaseException:
+            logger.error("Stopping the extraction pipeline")
+            # Stops the scraper waiting for pictures the cancelled stages will not write.
+            written_pictures.put(None)
+            for stage in stages:
+                stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+            raise
+        finally:
+            # Closing the generator quits the browser; it runs after any pending browser call.
+            await asyncio.shield(loop.run_in_executor(driver_executor, pages.close))
+            driver_executor.shutdown()
+            sink_executor.shutdown()
+
+        if self.article_index:
+            self.article_index.add_articles(
+                articles,
+                self.search_params.phrase,
+                self.search_params.categories,
+                self.search_params.current_month_plus)
+        logger.info("Extraction pipeline finished with %d articles", len(articles))
+        return articles
+
+    @staticmethod
+    async def _extract_pages(
+            loop: asyncio.AbstractEventLoop,
+            driver_executor: ThreadPoolExecutor,
+            pages,
+            rows_queue: asyncio.Queue,
+            pictures_queue: asyncio.Queue,
+            chunks_queue: asyncio.Queue = None) -> None:
+        """Moves each scraped page to the Excel, picture and output chunk stages"""
+        while True:
+            page = await loop.run_in_executor(driver_executor, next, pages, END_OF_STAGE)
+            if page is END_OF_STAGE:
+                break
+            rows, pictures = page
+            await rows_queue.put(rows)
+            await pictures_queue.put(pictures)
+            if chunks_queue:
+                await chunks_queue.put(page)
+        await rows_queue.put(END_OF_STAGE)
+        await pictures_queue.put(END_OF_STAGE)
+        if chunks_queue:
+            await chunks_queue.put(END_OF_STAGE)
+
+    @staticmethod
+    async def _write_pictures(
+            loop: asyncio.AbstractEventLoop,
+            pictures_queue: asyncio.Queue,
+            thumbnails_queue: asyncio.Queue,
+            written_pictures: queue.Queue) -> None:
+        """
+        Writes the pictures read from each page to the images directory.
+
+        The file names written for each page are reported to the scraper through
+        `written_pictures`, so the pictures that failed are downloaded again.
+        """
+        images_dir = utils.values_utils.get_news_images_dir_value()
+        while (pictures := await pictures_queue.get()) is not END_OF_STAGE:
+            written = set()
+            for file_name, picture in pictures.items():
+                path = os.path.join(images_dir, file_name)
+                try:
+                    await loop.run_in_executor(None, write_file, path, picture)
+                except OSError as exception:
+                    logger.warning("Error saving picture %s: %s", file_name, exception)
+                    continue
+                written.add(file_name)
+                await thumbnails_queue.put(path)
+            written_pictures.put(written)
+        await thumbnails_queue.put(END_OF_STAGE)
+
+    @staticmethod
+    async def _create_thumbnails(
+            loop: asyncio.AbstractEventLoop,
+            thumbnails_queue: asyncio.Queue) -> None:
+        """Creates the thumbnail of each picture written"""
+        settings = utils.values_utils.get_thumbnails_value()
+        while (path := await thumbnails_queue.get()) is not END_OF_STAGE:
+            if settings.get("enabled", False):
+                await loop.run_in_executor(
+                    None,
+                    utils.image_utils.create_thumbnail,
+                    path,
+                    settings["dir"],
+                    tuple(settings["size"]))
+
+    async def _write_articles(
+            self,
+            loop: asyncio.AbstractEventLoop,
+            sink_executor: ThreadPoolExecutor,
+            rows_queue: asyncio.Queue,
+            articles: ArticleBatch) -> None:
+        """Appends the articles of each page to the Excel file and writes it at the end"""
+        writer = await loop.run_in_executor(
+            sink_executor,
+            self.article_repository.open_articles_writer,
+            self.search_params.phrase,
+            self.search_params.current_month_plus)
+        while (rows := await rows_queue.get()) is not END_OF_STAGE:
+            page_articles = ArticleBatch.from_rows(rows)
+            await loop.run_in_executor(sink_executor, writer.append, page_articles)
+            articles.extend(page_articles)
+        await loop.run_in_executor(sink_executor, writer.close)
+
+    async def _emit_chunks(
+            self,
+            loop: asyncio.AbstractEventLoop,
+            chunks_queue: asyncio.Queue) -> None:
+        """Emits the articles of each page in chunks, with the pictures read from the page"""
+        chunk_executor = ThreadPoolExecutor(1, thread_name_prefix="chunks")
+        try:
+            while (page := await chunks_queue.get()) is not END_OF_STAGE:
+                rows, pictures = page
+                await loop.run_in_executor(
+                    chunk_executor, self.output_chunks.add, ArticleBatch.from_rows(rows),
+                    pictures)
+            await loop.run_in_executor(chunk_executor, self.output_chunks.close)
+        finally:
+            chunk_executor.shutdown()
+
+
+def write_file(path: str, content: bytes) -> None:
+    """
+    Writes bytes to a file.
+
+    Args:
+        path (str): Path of the file.
+        content (bytes): Content of the file.
+    """
+    with open(path, "wb") as file:
+        file.write(content)
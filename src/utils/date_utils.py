@@ -7,21 +7,39 @@ dates based on the current month and a specified number of months to add or subt
 Functions:
 - return_current_month_plus_next_months: Calculates the date for the current month minus
   a specified number of months.
+- return_start_of_month: Returns the first instant of the month of a date.
 """
 from datetime import datetime
-from dateutil.relativedelta import relativedelta
 
-def return_current_month_plus_next_months(next_months):
+def return_current_month_plus_next_months(next_months, current_date=None):
     """
     Calculates the date for the current month minus a specified number of months.
 
     Args:
         next_months (int): The number of months to subtract from the current date.
+        current_date (datetime, optional): The date to count from. Defaults to now.
 
     Returns:
         datetime: 
             The resulting date after subtracting the specified number of months from the current
             date.
     """
-    current_date = datetime.now()
+    from dateutil.relativedelta import relativedelta  # pylint: disable=import-outside-toplevel
+    if current_date is None:
+        current_date = datetime.now()
     return current_date - relativedelta(months=next_months)
+
+
+def return_start_of_month(date):
+    """
+    Returns the first instant of the month of a date.
+
+    Searches include whole months, so date filters start at the first day of the oldest month.
+
+    Args:
+        date (datetime): The date.
+
+    Returns:
+        datetime: Midnight of the first day of the month of the date.
+    """
+    return date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
@@ -12,6 +12,7 @@ Functions:
   the source directory to the specified new directory and handles errors during the process.
 - zip_folder(source_folder: str, target_folder: str) -> None: Zips the contents of the source 
   folder into a zip file located in the target folder.
+- measure_dir(path: str) -> int: Returns the total size of the files under a directory.
 
 Exceptions:
 - The functions may raise exceptions related to file and directory operations, which should be 
@@ -25,6 +26,8 @@ import shutil
 import logging
 import zipfile
 
+logger = logging.getLogger(__name__)
+
 
 def create_new_dir_to_save_images(src_dir):
     """
@@ -39,7 +42,7 @@ def create_new_dir_to_save_images(src_dir):
     Raises:
         Exception: If there is an error creating the directory.
     """
-    logging.info("Creating new dir to save excel and images from search...")
+    logger.info("Creating new dir to save excel and images from search...")
     try:
         new_dir_name = "news_images"
 
@@ -48,10 +51,10 @@ def create_new_dir_to_save_images(src_dir):
         os.makedirs(new_dir_path, exist_ok=True)
 
     except ImportError as exception:
-        logging.error("Error creating new dir: %s ", exception)
+        logger.error("Error creating new dir: %s ", exception)
         raise
 
-    logging.info("New dir Created")
+    logger.info("New dir Created")
     return new_dir_path
 
 
@@ -67,24 +70,24 @@ def move_images_to_repository(new_dir, src_dir_images):
         shutil.Error: If there is an error moving files.
         Exception: If there is an unexpected error during the process.
     """
-    logging.info("Moving news pictures to new dir")
+    logger.info("Moving news pictures to new dir")
     try:
         for file_name in os.listdir(src_dir_images):
             full_file_name = os.path.join(src_dir_images, file_name)
             shutil.move(full_file_name, new_dir)
     except shutil.Error:
-        logging.error((
-            "Error moving file %s : you are trying to extract the same search", full_file_name))
-        logging.warning(("Excluding images from %s ", src_dir_images))
+        logger.error(
+            "Error moving file %s : you are trying to extract the same search", full_file_name)
+        logger.warning("Excluding images from %s ", src_dir_images)
         for filename in os.listdir(src_dir_images):
             file_path = os.path.join(src_dir_images, filename)
             if os.path.isfile(file_path):
                 try:
                     os.remove(file_path)
                 except ImportError as exception:
-                    logging.error(("Error removing news images %s ", exception))
+                    logger.error("Error removing news images %s ", exception)
     except ImportError as exception:
-        logging.error(("Unexpected error: %s ", exception))
+        logger.error("Unexpected error: %s ", exception)
 
 
 def zip_folder(source_folder, target_folder):
@@ -106,3 +109,26 @@ def zip_folder(source_folder, target_folder):
                 full_path = os.path.join(root, file)
                 relative_path = os.path.relpath(full_path, source_folder)
                 zipf.write(full_path, relative_path)
+
+
+def measure_dir(path):
+    """
+    Returns the total size of the files under a directory.
+
+    Links are counted by their own size and files removed while walking are skipped, so
+    directories in use, such as a browser profile, can be measured.
+
+    Args:
+        path (str): The directory.
+
+    Returns:
+        int: The size in bytes.
+    """
+    size = 0
+    for root, _, files in os.walk(path):
+        for file_name in files:
+            try:
+                size += os.lstat(os.path.join(root, file_name)).st_size
+            except OSError:
+                continue
+    return size
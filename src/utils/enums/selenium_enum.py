@@ -7,8 +7,15 @@ selectors, and options commonly used in web scraping or automation tasks.
 
 Classes:
 - Locator: Defines XPath and CSS selectors for locating elements on a webpage.
+- SelectorChain: Defines ordered fallback XPaths for each field read from the results page
+  and the article pages.
 - SortBy: Defines sorting options.
+- SortByUrlValue: Defines the values of the sorting options in the search URL.
+- SearchUrlParam: Defines the query parameters of the search URL.
 - HttpCode: Defines HTTP status codes.
+- BlockedResource: Defines URL patterns for resource types that can be blocked while scraping.
+- Script: Defines JavaScript snippets executed in the page.
+- ImageCaptureMode: Defines how the article pictures are saved.
 """
 
 from enum import Enum
@@ -52,6 +59,12 @@ class Locator(Enum):
         ARIA_LABEL: ARIA label attribute.
         SOURCE: Attribute name for image sources.
         CATEGORIES_XPATH: XPath for category checkboxes.
+        HREF: Attribute name for link targets.
+        STORY_BODY_CLASS: Class name for the body of an article page.
+        PAGE_AUTHORS_CLASS: Class name for the authors of an article page.
+        PAGE_DATE_MODIFIED_CLASS: Class name for the update time of an article page.
+        PUBLISHED_TIME_META: Meta property holding the publication time of an article page.
+        MODIFIED_TIME_META: Meta property holding the update time of an article page.
     """
     OVERLAY_XPATH = "//div[contains(@class, 'fancybox-overlay')]"
     CLOSE_BUTTON_XPATH = "//a[contains(@class, 'fancybox-close')]"
@@ -81,6 +94,90 @@ class Locator(Enum):
     ARIA_LABEL = "aria-label"
     SOURCE = "src"
     CATEGORIES_XPATH = "//input[@type='checkbox']"
+    HREF = "href"
+    STORY_BODY_CLASS = "RichTextStoryBody"
+    PAGE_AUTHORS_CLASS = "Page-authors"
+    PAGE_DATE_MODIFIED_CLASS = "Page-dateModified"
+    PUBLISHED_TIME_META = "article:published_time"
+    MODIFIED_TIME_META = "article:modified_time"
+
+
+def has_class(class_name: str) -> str:
+    """Returns an XPath predicate matching the class token, like `By.CLASS_NAME`"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+class SelectorChain(Enum):
+    """
+    Enum for the ordered fallback selectors of each field read from the results page and the
+    article pages.
+
+    Every value is a list of XPath expressions tried in order, the first one matching winning.
+    The first expression is the current layout (see `Locator`); the next ones are looser and
+    keep matching after the usual markup changes, such as renamed modifiers or wrappers added
+    around the cards. XPath is used for every entry, so the same chain runs in the page
+    (`Script.PROBE_SELECTORS`), with Selenium and with lxml.
+
+    Attributes:
+        RESULTS: Absolute XPaths of the search results container.
+        ARTICLE: Absolute XPaths of the article cards.
+        NEXT_PAGE: Absolute XPaths of the link to the next results page.
+        TITLE: XPaths of the title, relative to an article card.
+        DATE: XPaths of the element holding the timestamp attribute, relative to a card.
+        DESCRIPTION: XPaths of the description, relative to an article card.
+        MEDIA: XPaths of the picture container, relative to an article card.
+        LINK: XPaths of the link to the article page, relative to an article card.
+        BODY: Absolute XPaths of the story body of an article page.
+        AUTHOR: Absolute XPaths of the byline of an article page; a `meta` element holds the
+            value in its `content` attribute.
+        PUBLISHED: Absolute XPaths of the publication time of an article page, as a `meta`
+            element with an ISO 8601 `content` or an element with a timestamp attribute.
+        UPDATED: Absolute XPaths of the update time of an article page, in the same forms.
+    """
+    RESULTS = [
+        f"//*[{has_class(Locator.SEARCH_RESULTS_CLASS.value)}]",
+        "//*[contains(@class, 'SearchResults')]"]
+    ARTICLE = [
+        Locator.ARTICLE_XPATH.value,
+        "//*[contains(@class, 'SearchResults')]//*[contains(@class, 'PageList-items-item') "
+        "and .//*[contains(@class, 'PagePromo')] and not(.//*[contains(@class, 'Trending')])]"]
+    NEXT_PAGE = [
+        f"//*[{has_class(Locator.PAGINATION_NEXT_PAGE_CLASS.value)}]//a",
+        "//*[contains(@class, 'nextPage') or contains(@class, 'next-page')]//a",
+        "//a[@rel='next']"]
+    TITLE = [
+        f".//*[{has_class(Locator.PAGE_PROMO_TITLE_CLASS_NAME.value)}]",
+        ".//*[contains(@class, 'Promo-title')]",
+        ".//h3"]
+    DATE = [
+        f".//{Locator.TIMESTAMP_TAG_NAME.value}[@{Locator.DATA_TIMESTAMP.value}]",
+        f".//*[@{Locator.DATA_TIMESTAMP.value}]"]
+    DESCRIPTION = [
+        f".//*[{has_class(Locator.PAGE_PROMO_DESCRIPTION_CLASS_NAME.value)}]",
+        ".//*[contains(@class, 'Promo-description')]"]
+    MEDIA = [
+        f".//*[{has_class(Locator.PAGE_PROMO_MEDIA_CLASS_NAME.value)}]",
+        ".//*[contains(@class, 'Promo-media')]"]
+    LINK = [
+        f".//*[{has_class(Locator.PAGE_PROMO_TITLE_CLASS_NAME.value)}]//a[@href]",
+        ".//*[contains(@class, 'Promo-title')]//a[@href]",
+        ".//*[contains(@class, 'Promo-media')]//a[@href]"]
+    BODY = [
+        f"//*[{has_class(Locator.STORY_BODY_CLASS.value)}]",
+        "//*[contains(@class, 'RichTextBody') or contains(@class, 'StoryBody')]",
+        "//article"]
+    AUTHOR = [
+        f"//*[{has_class(Locator.PAGE_AUTHORS_CLASS.value)}]",
+        "//*[contains(@class, 'Page-byline') or contains(@class, 'Byline')]",
+        "//meta[@name='author'][@content]"]
+    PUBLISHED = [
+        f"//meta[@property='{Locator.PUBLISHED_TIME_META.value}'][@content]",
+        f"//*[contains(@class, 'datePublished')]//*[@{Locator.DATA_TIMESTAMP.value}]",
+        f"//{Locator.TIMESTAMP_TAG_NAME.value}[@{Locator.DATA_TIMESTAMP.value}]"]
+    UPDATED = [
+        f"//meta[@property='{Locator.MODIFIED_TIME_META.value}'][@content]",
+        f"//*[{has_class(Locator.PAGE_DATE_MODIFIED_CLASS.value)}]"
+        f"//*[@{Locator.DATA_TIMESTAMP.value}]"]
 
 
 class SortBy(Enum):
@@ -95,6 +192,34 @@ class SortBy(Enum):
     NEWEST = "Newest"
 
 
+class SortByUrlValue(Enum):
+    """
+    Enum for the values of the sorting options in the search URL.
+
+    Attributes:
+        RELEVANCE: Value of the "Relevance" sorting option.
+        NEWEST: Value of the "Newest" sorting option.
+    """
+    RELEVANCE = "0"
+    NEWEST = "3"
+
+
+class SearchUrlParam(Enum):
+    """
+    Enum for the query parameters of the search URL.
+
+    Attributes:
+        QUERY: Parameter holding the search phrase.
+        SORT: Parameter holding the sorting option (see `SortByUrlValue`).
+        CATEGORY: Parameter holding a selected category value, repeated per category.
+        PAGE: Parameter holding the number of the results page.
+    """
+    QUERY = "q"
+    SORT = "s"
+    CATEGORY = "f2"
+    PAGE = "p"
+
+
 class HttpCode(Enum):
     """
     Enum for HTTP status codes.
@@ -106,3 +231,175 @@ class HttpCode(Enum):
         HTTP_404: Value representing the HTTP 404 Not Found error.
     """
     HTTP_404 = "HTTP ERROR 404"
+
+
+class BlockedResource(Enum):
+    """
+    Enum for URL patterns of resource types that can be blocked while scraping.
+
+    The scraper only reads the search results markup (see `Locator`), so heavy resources that
+    never feed an extracted field can be refused by the browser before they are requested.
+    Each value is a list of wildcard patterns in the format accepted by the CDP command
+    `Network.setBlockedURLs`.
+
+    Attributes:
+        FONT: Patterns for web fonts.
+        MEDIA: Patterns for audio and video files and players.
+        STYLESHEET: Patterns for stylesheets.
+        IMAGE: Patterns for images.
+    """
+    FONT = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+    MEDIA = ["*.mp4", "*.webm", "*.m3u8", "*.mp3", "*.ts", "*jwplayer*", "*brightcove*"]
+    STYLESHEET = ["*.css"]
+    IMAGE = ["*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg"]
+
+
+class Script(Enum):
+    """
+    Enum for JavaScript snippets executed in the page.
+
+    Attributes:
+        CAPTURE_IMAGES: Asynchronous script that reads already loaded images from the browser
+            cache. Receives a list of `[url, filename]` pairs and returns a list of
+            `[filename, base64 data or null, url loaded by the page]` triples; the URL is the
+            one of the matching image of the page (`currentSrc`), so a picture the script
+            could not read can be read through the DevTools protocol instead.
+        VERIFY_SEARCH_STATE: Script that checks the state applied to the results page. Receives
+            the sort dropdown XPath, the expected sort option text and the category values, and
+            returns `[is sorted, are all categories checked]`.
+        OVERLAY_SUPPRESSOR: Script installed at document start that removes the cookie
+            consent dialog and the overlay modal as soon as they are added to the page and
+            counts the removals in `window.__overlaySuppressor.count`. Expects the variable
+            `overlayXPath` to be defined before it.
+        OVERLAY_SUPPRESSED_COUNT: Script that returns the number of removals on the page since
+            the last call.
+        PROBE_SELECTORS: Script that counts the matches of every selector of the
+            `SelectorChain` values in one call. Receives the article chain, the page chains and
+            the article field chains by name, and the number of cards to sample. Returns the
+            match count of each article and page selector and, for each field selector, the
+            number of sampled cards it matches (-1 for an invalid expression).
+        OPEN_TAB: Script that opens the URL given in a new tab, in its own renderer process,
+            without waiting for it to load.
+        PAGE_LOAD_STATE: Script that returns the `document.readyState` and the URL of the tab.
+    """
+    OPEN_TAB = "window.open(arguments[0], '_blank', 'noopener');"
+    PAGE_LOAD_STATE = "return [document.readyState, window.location.href];"
+    PROBE_SELECTORS = """
+    var articleChain = arguments[0], pageChains = arguments[1], fieldChains = arguments[2];
+    var sample = arguments[3];
+    function evaluate(xpath, context, type) {
+        return document.evaluate(xpath, context, null, type, null);
+    }
+    function count(xpath, context) {
+        try {
+            return evaluate(xpath, context, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE).snapshotLength;
+        } catch (error) { return -1; }
+    }
+    var result = {articles: [], page: {}, fields: {}, cards: 0};
+    var cards = [];
+    articleChain.forEach(function (xpath) {
+        result.articles.push(count(xpath, document));
+        if (!cards.length && result.articles[result.articles.length - 1] > 0) {
+            var nodes = evaluate(xpath, document, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE);
+            for (var index = 0; index < Math.min(nodes.snapshotLength, sample); index++) {
+                cards.push(nodes.snapshotItem(index));
+            }
+        }
+    });
+    result.cards = cards.length;
+    Object.keys(pageChains).forEach(function (name) {
+        result.page[name] = pageChains[name].map(function (xpath) {
+            return count(xpath, document);
+        });
+    });
+    Object.keys(fieldChains).forEach(function (name) {
+        result.fields[name] = fieldChains[name].map(function (xpath) {
+            var matched = 0;
+            for (var index = 0; index < cards.length; index++) {
+                var found = count(xpath, cards[index]);
+                if (found < 0) { return -1; }
+                if (found > 0) { matched += 1; }
+            }
+            return matched;
+        });
+    });
+    return result;
+    """
+    OVERLAY_SUPPRESSOR = """
+    (function () {
+        if (window.__overlaySuppressor) { return; }
+        var state = window.__overlaySuppressor = {count: 0};
+        function suppress() {
+            var consent = document.getElementById('onetrust-consent-sdk');
+            if (consent) {
+                consent.remove();
+                state.count += 1;
+            }
+            var overlays = document.evaluate(
+                overlayXPath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (var index = 0; index < overlays.snapshotLength; index++) {
+                overlays.snapshotItem(index).remove();
+                state.count += 1;
+            }
+        }
+        new MutationObserver(suppress).observe(document, {childList: true, subtree: true});
+    })();
+    """
+    OVERLAY_SUPPRESSED_COUNT = """
+    var state = window.__overlaySuppressor;
+    if (!state) { return 0; }
+    var count = state.count;
+    state.count = 0;
+    return count;
+    """
+    VERIFY_SEARCH_STATE = """
+    var select = document.evaluate(
+        arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    var sorted = !!select && select.selectedIndex >= 0 &&
+        select.options[select.selectedIndex].text.trim() === arguments[1];
+    var checked = arguments[2].every(function (value) {
+        var checkbox = document.querySelector(
+            "input[type='checkbox'][value='" + value + "']");
+        return !!checkbox && checkbox.checked;
+    });
+    return [sorted, checked];
+    """
+    CAPTURE_IMAGES = """
+    var items = arguments[0];
+    var done = arguments[arguments.length - 1];
+    function loadedUrl(url) {
+        var image = Array.prototype.find.call(
+            document.images, function (img) { return img.currentSrc === url || img.src === url; });
+        return image && image.currentSrc ? image.currentSrc : url;
+    }
+    function toBase64(blob) {
+        return new Promise(function (resolve, reject) {
+            var reader = new FileReader();
+            reader.onloadend = function () { resolve(reader.result.split(',')[1]); };
+            reader.onerror = reject;
+            reader.readAsDataURL(blob);
+        });
+    }
+    Promise.all(items.map(function (item) {
+        return fetch(item[0], {cache: 'force-cache', credentials: 'omit'})
+            .then(function (response) {
+                if (!response.ok) { throw new Error(response.status); }
+                return response.blob();
+            })
+            .then(toBase64)
+            .catch(function () { return null; })
+            .then(function (data) { return [item[1], data, loadedUrl(item[0])]; });
+    })).then(done);
+    """
+
+
+class ImageCaptureMode(Enum):
+    """
+    Enum for the ways the article pictures can be saved.
+
+    Attributes:
+        NAVIGATE: Opens every picture URL and downloads it through the browser.
+        IN_PAGE: Reads the pictures already loaded by the results page in one script call.
+    """
+    NAVIGATE = "navigate"
+    IN_PAGE = "in_page"
@@ -0,0 +1,44 @@
+"""
+Utility module for processing the downloaded news pictures.
+
+Thumbnails are created with Pillow, which comes with the rpaframework environment. When Pillow
+is not available, no thumbnail is created.
+
+Functions:
+- create_thumbnail: Creates a reduced JPEG copy of a picture.
+"""
+import logging
+import os
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+
+def create_thumbnail(src_path: str, target_dir: str, size: tuple[int, int]) -> str:
+    """
+    Creates a reduced JPEG copy of a picture, keeping its aspect ratio.
+
+    Args:
+        src_path (str): Path of the picture.
+        target_dir (str): Directory where the thumbnail is saved, with the picture file name.
+        size (tuple[int, int]): Maximum width and height of the thumbnail.
+
+    Returns:
+        str: Path of the thumbnail, or None when it could not be created.
+    """
+    if Image is None:
+        return None
+    os.makedirs(target_dir, exist_ok=True)
+    target_path = os.path.join(target_dir, os.path.basename(src_path))
+    try:
+        with Image.open(src_path) as image:
+            image.thumbnail(size)
+            image.convert("RGB").save(target_path, "JPEG")
+    except OSError as exception:
+        logger.warning("Error creating thumbnail of %s: %s", src_path, exception)
+        return None
+    return target_path
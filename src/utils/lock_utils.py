@@ -0,0 +1,93 @@
+"""
+Utility module for inter-process file locks.
+
+The robot may run several workers on the same host, so state shared between them (such as the
+navigation rate limiter) is kept in small files guarded by an exclusive lock on a companion
+`.lock` file. `fcntl` is used on POSIX systems and `msvcrt` on Windows.
+
+Functions:
+- file_lock: Context manager that holds an exclusive lock on a file while the block runs.
+- try_lock_file: Takes an exclusive lock on a file without waiting, for locks held longer
+  than a block, such as a browser profile held for a whole run.
+- unlock_file: Releases a lock taken by `try_lock_file`.
+"""
+from contextlib import contextmanager
+import os
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(path: str):
+    """
+    Holds an exclusive lock on the given path while the block runs.
+
+    The call blocks until the lock is free. The lock file is created if it does not exist
+    and is left in place afterwards.
+
+    Args:
+        path (str): Path of the lock file.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "a+b") as file:
+        if fcntl:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        else:
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+            else:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def try_lock_file(path: str):
+    """
+    Takes an exclusive lock on the given path if no other process holds it.
+
+    The lock is held until `unlock_file` is called or the process exits, so a crashed worker
+    never leaves it taken.
+
+    Args:
+        path (str): Path of the lock file.
+
+    Returns:
+        The open lock file, to be given to `unlock_file`, or None when the lock is taken.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    file = open(path, "a+b")  # pylint: disable=consider-using-with
+    try:
+        if fcntl:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        file.close()
+        return None
+    return file
+
+
+def unlock_file(file) -> None:
+    """
+    Releases a lock taken by `try_lock_file` and closes its file.
+
+    Args:
+        file: The open lock file returned by `try_lock_file`.
+    """
+    try:
+        if fcntl:
+            fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+        else:
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+    finally:
+        file.close()
@@ -0,0 +1,153 @@
+"""
+Utility module for the logging setup of a run.
+
+The scraping thread only puts log records on an in-memory queue; a `QueueListener` thread
+formats them and writes them to the console and, optionally, to a JSON lines file. Records are
+formatted by the listener, not when they are queued, so `%s` arguments are only rendered once
+and off the scraping thread.
+
+Levels are set per stage (logger name) from the `logging` settings of values.json, and the
+per-article messages of the extraction are sampled, so large searches do not spend their time
+writing the same warning for every article.
+
+Functions:
+- setup_logging: Installs the queued handlers and returns the listener to stop at the end.
+- stop_logging: Flushes the queued records and stops the listener.
+"""
+from datetime import datetime
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+
+import utils.values_utils
+
+CONSOLE_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+# Loggers of the per-article messages, see `SamplingFilter`.
+ARTICLE_LOGGERS = (
+    "frameworks_drivers.drivers.selenium_driver.articles",
+    "frameworks_drivers.drivers.html_page_parser.articles",
+)
+
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves the formatting to the listener.
+
+    The standard handler renders the message while enqueuing it; this one only snapshots the
+    exception text, so records keep their arguments until the listener formats them.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats each record as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Lets through the first `first` records of each message and then one every `rate`.
+
+    Warnings and errors of the same message repeat once per article, so after the first ones
+    a sample is enough to tell how often they happen; the number of records dropped is added
+    to the next one let through.
+
+    Attributes:
+        rate (int): One record of every `rate` is kept after the first ones.
+        first (int): Number of records of each message always kept.
+    """
+
+    def __init__(self, rate: int, first: int = 5):
+        super().__init__()
+        self.rate = max(1, rate)
+        self.first = first
+        self.counts = {}
+        self.lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        with self.lock:
+            count = self.counts.get(record.msg, 0) + 1
+            self.counts[record.msg] = count
+        if count <= self.first:
+            return True
+        if (count - self.first) % self.rate:
+            return False
+        record.msg = f"{record.msg} (sampled, {count} so far)"
+        return True
+
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """
+    Installs the queued handlers on the root logger and starts the listener thread.
+
+    Settings are read from the `logging` entry of values.json:
+    `level` (root level), `levels` (level per logger name), `json_file` (path of a JSON lines
+    log, optional) and `article_sample_rate` (one per-article message kept of every N).
+
+    Returns:
+        logging.handlers.QueueListener: The listener, to pass to `stop_logging` at the end.
+    """
+    settings = utils.values_utils.get_logging_value()
+
+    handlers = []
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+    handlers.append(console_handler)
+    if settings.get("json_file"):
+        os.makedirs(os.path.dirname(settings["json_file"]) or ".", exist_ok=True)
+        file_handler = logging.FileHandler(settings["json_file"], encoding="utf-8")
+        file_handler.setFormatter(JsonFormatter())
+        handlers.append(file_handler)
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(LazyQueueHandler(log_queue))
+    root.setLevel(settings.get("level", "INFO"))
+
+    for name, level in settings.get("levels", {}).items():
+        logging.getLogger(name).setLevel(level)
+
+    sample_rate = settings.get("article_sample_rate", 1)
+    if sample_rate > 1:
+        for name in ARTICLE_LOGGERS:
+            logging.getLogger(name).addFilter(SamplingFilter(sample_rate))
+
+    listener.start()
+    return listener
+
+
+def stop_logging(listener: logging.handlers.QueueListener) -> None:
+    """
+    Writes the records still queued and stops the listener thread.
+
+    Args:
+        listener (logging.handlers.QueueListener): The listener returned by `setup_logging`.
+    """
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
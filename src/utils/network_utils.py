@@ -0,0 +1,178 @@
+"""
+Utility module for reading the network activity recorded by Chrome.
+
+Chrome writes the DevTools `Network` domain events into the `performance` log when the
+`goog:loggingPrefs` capability is enabled. This module turns those raw log entries into
+small summaries that can be logged or stored per page of a search, with the requests and bytes
+of each domain and resource type, and adds the summaries of the pages up into the totals of a
+run.
+
+Functions:
+- build_blocked_url_patterns: Builds the `Network.setBlockedURLs` pattern list from
+  resource type names and domain patterns.
+- parse_performance_log: Extracts the DevTools events from raw `performance` log entries.
+- summarize_network_events: Aggregates request, blocking and byte counts from DevTools events.
+- aggregate_network_stats: Adds up the network summaries of several pages.
+"""
+import json
+import logging
+from urllib.parse import urlsplit
+
+from utils.enums.selenium_enum import BlockedResource
+
+logger = logging.getLogger(__name__)
+
+
+def build_blocked_url_patterns(resource_types: list, domain_patterns: list) -> list[str]:
+    """
+    Builds the list of URL patterns to block from resource type names and domain patterns.
+
+    Args:
+        resource_types (list): Names of `BlockedResource` members, e.g. ["FONT", "MEDIA"].
+        domain_patterns (list): Wildcard patterns of domains to block, e.g. ["*taboola.com*"].
+
+    Returns:
+        list[str]: The de-duplicated list of URL patterns.
+    """
+    patterns = []
+    for resource_type in resource_types or []:
+        try:
+            patterns.extend(BlockedResource[str.upper(resource_type)].value)
+        except KeyError:
+            logger.warning("Unknown resource type to block: %s", resource_type)
+    patterns.extend(domain_patterns or [])
+    return list(dict.fromkeys(patterns))
+
+
+def parse_performance_log(entries: list[dict]) -> list[dict]:
+    """
+    Extracts the DevTools events from raw `performance` log entries.
+
+    Args:
+        entries (list[dict]): Entries returned by `driver.get_log("performance")`.
+
+    Returns:
+        list[dict]: DevTools events, each with a `method` and a `params` key.
+    """
+    events = []
+    for entry in entries:
+        try:
+            events.append(json.loads(entry["message"])["message"])
+        except (KeyError, TypeError, ValueError):
+            logger.debug("Ignoring malformed performance log entry")
+    return events
+
+
+def summarize_network_events(events: list[dict], open_requests: dict = None) -> dict:
+    """
+    Aggregates request, blocking and byte counts from DevTools `Network` events.
+
+    Blocked requests never reach the network, so their size is unknown; the number of
+    requests saved is reported per resource type instead. Requests answered from the memory
+    or disk cache of the browser are counted in `cached_requests`. The requests and bytes are
+    also broken down by domain and by resource type in `by_domain` and `by_type`.
+
+    A request may start before the log is read and finish after it, so its domain and type
+    are kept in `open_requests` until it finishes; passing the same dictionary to every call
+    attributes its bytes to the right domain and type in the next summary.
+
+    Args:
+        events (list[dict]): Events returned by `parse_performance_log`.
+        open_requests (dict, optional): Domain and resource type of the requests not
+            finished yet, by request identifier. Updated in place.
+
+    Returns:
+        dict: A summary with the keys `requests`, `bytes_transferred`, `cached_requests`,
+        `blocked_requests`, `blocked_by_type`, `by_domain` and `by_type`.
+    """
+    if open_requests is None:
+        open_requests = {}
+    cached_requests = set()
+    summary = {
+        "requests": 0,
+        "bytes_transferred": 0,
+        "cached_requests": 0,
+        "blocked_requests": 0,
+        "blocked_by_type": {},
+        "by_domain": {},
+        "by_type": {}}
+
+    for event in events:
+        method = event.get("method")
+        params = event.get("params", {})
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            domain = define_domain(params.get("request", {}).get("url", ""))
+            resource_type = params.get("type", "Other")
+            open_requests[request_id] = (domain, resource_type)
+            summary["requests"] += 1
+            add_usage(summary["by_domain"], domain, requests=1)
+            add_usage(summary["by_type"], resource_type, requests=1)
+        elif method == "Network.requestServedFromCache" or (
+                method == "Network.responseReceived"
+                and params.get("response", {}).get("fromDiskCache")):
+            cached_requests.add(request_id)
+        elif method == "Network.loadingFinished":
+            transferred = int(params.get("encodedDataLength", 0))
+            domain, resource_type = open_requests.pop(request_id, ("unknown", "Other"))
+            summary["bytes_transferred"] += transferred
+            add_usage(summary["by_domain"], domain, transferred=transferred)
+            add_usage(summary["by_type"], resource_type, transferred=transferred)
+        elif method == "Network.loadingFailed":
+            _, request_type = open_requests.pop(request_id, (None, "Other"))
+            if params.get("blockedReason"):
+                summary["blocked_requests"] += 1
+                resource_type = params.get("type", request_type)
+                summary["blocked_by_type"][resource_type] = \
+                    summary["blocked_by_type"].get(resource_type, 0) + 1
+
+    summary["cached_requests"] = len(cached_requests)
+    return summary
+
+
+def aggregate_network_stats(page_network_stats: list[dict]) -> dict:
+    """
+    Adds up the network summaries of several pages into the totals of a run.
+
+    Args:
+        page_network_stats (list[dict]): Summaries returned by `summarize_network_events`.
+
+    Returns:
+        dict: A summary with the same keys, plus `pages`, the number of summaries added up.
+        The domains are sorted by bytes transferred, largest first.
+    """
+    totals = {
+        "pages": len(page_network_stats),
+        "requests": 0,
+        "bytes_transferred": 0,
+        "cached_requests": 0,
+        "blocked_requests": 0,
+        "blocked_by_type": {},
+        "by_domain": {},
+        "by_type": {}}
+    for page_stats in page_network_stats:
+        for key in ("requests", "bytes_transferred", "cached_requests", "blocked_requests"):
+            totals[key] += page_stats.get(key, 0)
+        for resource_type, blocked in page_stats.get("blocked_by_type", {}).items():
+            totals["blocked_by_type"][resource_type] = \
+                totals["blocked_by_type"].get(resource_type, 0) + blocked
+        for key in ("by_domain", "by_type"):
+            for name, usage in page_stats.get(key, {}).items():
+                add_usage(totals[key], name, usage["requests"], usage["bytes"])
+    for key in ("by_domain", "by_type"):
+        totals[key] = dict(sorted(
+            totals[key].items(), key=lambda item: item[1]["bytes"], reverse=True))
+    return totals
+
+
+def define_domain(url: str) -> str:
+    """Returns the host name of a URL, or its scheme for URLs without host such as `data:`"""
+    parts = urlsplit(url)
+    return parts.hostname or parts.scheme or "unknown"
+
+
+def add_usage(usage_by_name: dict, name: str, requests: int = 0, transferred: int = 0) -> None:
+    """Adds requests and bytes to the usage of a domain or resource type"""
+    usage = usage_by_name.setdefault(name, {"requests": 0, "bytes": 0})
+    usage["requests"] += requests
+    usage["bytes"] += transferred
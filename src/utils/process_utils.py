@@ -0,0 +1,75 @@
+"""
+Utility module for reading the memory of running processes.
+
+The browser runs as a tree of processes under chromedriver (browser, renderers, GPU and
+utility processes), so its memory is the sum of the resident memory of the whole tree. The
+figures are read from /proc and are only available on Linux; elsewhere the functions return 0.
+
+Functions:
+- read_rss: Returns the resident memory of a process.
+- list_descendants: Returns the pids of every descendant of a process.
+- read_process_tree_rss: Returns the resident memory of a process and all its descendants.
+"""
+import os
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def read_rss(pid: int) -> int:
+    """
+    Returns the resident memory of a process.
+
+    Args:
+        pid (int): The process id.
+
+    Returns:
+        int: The resident memory in bytes, 0 when the process is gone or cannot be read.
+    """
+    try:
+        with open(f"/proc/{pid}/statm", "r", encoding="utf-8") as file:
+            return int(file.read().split()[1]) * PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+def list_descendants(pid: int) -> list[int]:
+    """
+    Returns the pids of every descendant of a process.
+
+    Args:
+        pid (int): The process id.
+
+    Returns:
+        list[int]: The pids of the children, grandchildren and so on.
+    """
+    descendants = []
+    pending = [pid]
+    while pending:
+        parent = pending.pop()
+        try:
+            threads = os.listdir(f"/proc/{parent}/task")
+        except OSError:
+            continue
+        for thread in threads:
+            try:
+                with open(f"/proc/{parent}/task/{thread}/children", "r",
+                          encoding="utf-8") as file:
+                    children = [int(child) for child in file.read().split()]
+            except (OSError, ValueError):
+                continue
+            descendants.extend(children)
+            pending.extend(children)
+    return descendants
+
+
+def read_process_tree_rss(pid: int) -> int:
+    """
+    Returns the resident memory of a process and all its descendants.
+
+    Args:
+        pid (int): The process id of the root of the tree.
+
+    Returns:
+        int: The resident memory in bytes, 0 when it cannot be read.
+    """
+    return read_rss(pid) + sum(read_rss(child) for child in list_descendants(pid))
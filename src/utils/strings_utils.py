@@ -7,8 +7,17 @@ characters with underscores and ensuring the filename does not contain spaces.
 Functions:
 - format_to_allowed_filename: Formats a string to replace disallowed characters and spaces
   with underscores for use as a valid filename.
+- normalize_query: Normalizes the search parameters of a work item, so equivalent searches
+  compare equal.
+- define_query_key: Defines the key of a search from its normalized parameters.
+- define_page_url: Defines the URL of a results page from the URL of another page of the search.
 """
+import hashlib
+import json
 import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from utils.enums.selenium_enum import SearchUrlParam
 
 def format_to_allowed_filename(string: str) -> str:
     """
@@ -25,3 +34,66 @@ def format_to_allowed_filename(string: str) -> str:
         str: The formatted string with disallowed characters replaced by underscores.
     """
     return re.sub(r'[^a-zA-Z0-9\s]', '_', string).replace(' ', '_')
+
+
+def normalize_query(phrase: str, categories: str, months: int) -> list:
+    """
+    Normalizes the search parameters of a work item, so equivalent searches compare equal.
+
+    The phrase is trimmed and lower-cased (the site search ignores case), the categories are
+    upper-cased and sorted and a missing number of months counts as one, as in `main.main`.
+
+    Args:
+        phrase (str): The search phrase.
+        categories (str): The comma-separated categories.
+        months (int): The number of months searched.
+
+    Returns:
+        list: The normalized phrase, categories and months.
+    """
+    return [
+        " ".join((phrase or "").lower().split()),
+        ",".join(sorted(category.strip().upper()
+                        for category in (categories or "").split(",") if category.strip())),
+        months if months and months > 1 else 1]
+
+
+def define_query_key(phrase: str, categories: str, months: int) -> str:
+    """
+    Defines the key of a search from its normalized parameters.
+
+    The same key identifies a search in the query cache, the query history of the scheduler
+    and the coverage of the article index.
+
+    Args:
+        phrase (str): The search phrase.
+        categories (str): The comma-separated categories.
+        months (int): The number of months searched.
+
+    Returns:
+        str: The key of the search.
+    """
+    params = json.dumps(normalize_query(phrase, categories, months))
+    return hashlib.sha1(params.encode("utf-8")).hexdigest()
+
+
+def define_page_url(url: str, page: int) -> str:
+    """
+    Defines the URL of a results page from the URL of another page of the same search.
+
+    The page is encoded in the `p` parameter of the search URL (see `SearchUrlParam`); the other
+    parameters, the phrase, the sort order and the categories, are kept as they are.
+
+    Args:
+        url (str): URL of a results page of the search.
+        page (int): Number of the wanted results page.
+
+    Returns:
+        str: The URL of the results page.
+    """
+    parts = urlsplit(url)
+    query = [(name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+             if name != SearchUrlParam.PAGE.value]
+    if page > 1:
+        query.append((SearchUrlParam.PAGE.value, page))
+    return urlunsplit(parts._replace(query=urlencode(query)))
@@ -0,0 +1,49 @@
+"""
+Utility module for analysing the text of news articles.
+
+This module provides the text checks shared by every way of extracting articles, so the
+Selenium driver and the HTML parser produce the same values.
+
+Functions:
+- count_search_phrase: Counts occurrences of a search phrase in a text, ignoring case.
+- contains_money: Checks if a text contains any amount of money.
+"""
+import re
+
+MONEY_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r'\$\d+(?:\.\d+)?',
+        r'\$\d{1,3}(?:,\d{3})+(?:\.\d{2})',
+        r'\b\d+\s+dollars\b',
+        r'\b\d+\s+USD\b'
+    ]]
+
+
+def count_search_phrase(text: str, search_phrase: str) -> int:
+    """
+    Counts occurrences of a search phrase in a text, ignoring case.
+
+    Args:
+        text (str): The text of the article.
+        search_phrase (str): The phrase to count.
+
+    Returns:
+        int: The count of occurrences of the search phrase.
+    """
+    return text.lower().count(search_phrase.lower())
+
+
+def contains_money(text: str) -> bool:
+    """
+    Checks if a text contains any amount of money.
+
+    Possible formats: $11.1 | $111,111.11 | 11 dollars | 11 USD
+
+    Args:
+        text (str): The text of the article.
+
+    Returns:
+        bool: True if the text contains monetary values, False otherwise.
+    """
+    return any(pattern.search(text) for pattern in MONEY_PATTERNS)
@@ -2,6 +2,10 @@
 import json
 import logging
 import os
+import tempfile
+
+logger = logging.getLogger(__name__)
+
 
 def get_url_value() -> str:
     """ Should return url value from json.values """
@@ -10,7 +14,7 @@ def get_url_value() -> str:
     try:
         return data['url_site']
     except ImportError as exception:
-        logging.error(exception)
+        logger.error(exception)
 
 def get_chrome_driver_value() -> str:
     """ Should return chrome_driver value from json.values """
@@ -19,7 +23,7 @@ def get_chrome_driver_value() -> str:
     try:
         return data['chrome_drive']
     except ImportError as exception:
-        logging.error(exception)
+        logger.error(exception)
 
 def get_output_dir_value() -> str:
     """ Should return csv_dir value from json.values """
@@ -28,7 +32,16 @@ def get_output_dir_value() -> str:
     try:
         return  os.path.abspath(data['output_dir'])
     except ImportError as exception:
-        logging.error(exception)
+        logger.error(exception)
+
+def get_state_dir_value() -> str:
+    """ Should return state_dir from json.values, a directory outside the output by default """
+    with open('values.json', 'r', encoding="utf-8") as file:
+        data = json.load(file)
+    state_dir = os.path.abspath(
+        data.get('state_dir') or os.path.join(tempfile.gettempdir(), "data-extractor-news"))
+    os.makedirs(state_dir, exist_ok=True)
+    return state_dir
 
 def get_news_images_dir_value() -> str:
     """ Should return news_images_dir from json.values """
@@ -37,4 +50,130 @@ def get_news_images_dir_value() -> str:
     try:
         return data['news_images_dir']
     except ImportError as exception:
-        logging.error(exception)
+        logger.error(exception)
+
+
+def get_resource_blocking_value() -> dict:
+    """ Should return resource_blocking settings from json.values """
+    with open('values.json', 'r', encoding="utf-8") as file:
+        data = json.load(file)
+    return data.get('resource_blocking', {})
+
+
+def get_image_capture_mode_value() -> str:
+    """ Should return image_capture_mode from json.values """
+    with open('values.json', 'r', encoding="utf-8") as file:
+        data = json.load(file)
+    return data.get('image_capture_mode', 'navigate')
+
+
+def get_rate_limiter_value() -> dict:
+    """ Should return rate_limiter settings from json.values """
+    with open('values.json', 'r', encoding="utf-8") as file:
+        data = json.load(file)
+    return data.get('rate_limiter', {})
+
+
+def get_category_cache_ttl_value() -> int:
+    """ Should return category_cache_ttl (in seconds) from json.values """
+    with open('values.json', 'r', encoding="utf-8") as file:
+        data = json.load(file)
+    return data.get('category_cache_ttl', 0)
+
+
+def get_thumbnails_value() -> dict:
+    """ Should return thumbnails settings from json.values """
+    with open('values.json', 'r', encoding="utf-8") as file:
+        data = json.load(file)
+    return data.get('thumbnails', {})
+
+
+def get_suppress_overlays_value() -> bool:
+    """ Should return suppress_overlays from json.values """
+    with open('values.json', 'r', encoding="utf-8") as file:
+        data = json.load(file)
+    return data.get('suppress_overlays', False)
+
+
+def get_archive_pages_value() -> bool:
+    """ Should return archive_pages from json.values """
+    with open('values.json', 'r', encoding="utf-8") as file:
+        data = json.load(file)
+    return data.get('archive_pages', False)
+
+
+def get_logging_value() -> dict:
+    """ Should return logging settings from json.values """
+    with open('values.json', 'r', encoding="utf-8") as file:
+        data = json.load(file)
+    return data.get('logging', {})
+
+
+def get_memory_watchdog_value() -> dict:
+    """ Should return memory_watchdog settings from json.values """
+    with open('values.json', 'r', encoding="utf-8") as file:
+        data = json.load(file)
+    return data.get('memory_watchdog', {})
+
+
+def get_scheduler_value() -> dict:
+    """ Should return scheduler settings from json.values """
+    with open('values.json', 'r', encoding="utf-8") as file:
+        data = json.load(file)
+    return data.get('scheduler', {})
+
+
+def get_query_cache_value() -> dict:
+    """ Should return query_cache settings from json.values """
+    with open('values.json', 'r', encoding="utf-8") as file:
+        data = json.load(file)
+    return data.get('query_cache', {})
+
+
+def get_article_index_value() -> dict:
+    """ Should return article_index settings from json.values """
+    with open('values.json', 'r', encoding="utf-8") as file:
+        data = json.load(file)
+    return data.get('article_index', {})
+
+
+def get_browser_profile_value() -> dict:
+    """ Should return browser_profile settings from json.values """
+    with open('values.json', 'r', encoding="utf-8") as file:
+        data = json.load(file)
+    return data.get('browser_profile', {})
+
+
+def get_selector_health_value() -> dict:
+    """ Should return selector_health settings from json.values """
+    with open('values.json', 'r', encoding="utf-8") as file:
+        data = json.load(file)
+    return data.get('selector_health', {})
+
+
+def get_output_chunks_value() -> dict:
+    """ Should return output_chunks settings from json.values """
+    with open('values.json', 'r', encoding="utf-8") as file:
+        data = json.load(file)
+    return data.get('output_chunks', {})
+
+
+def get_article_details_value() -> dict:
+    """ Should return article_details settings from json.values """
+    with open('values.json', 'r', encoding="utf-8") as file:
+        data = json.load(file)
+    return data.get('article_details', {})
+
+
+def get_parser_pool_value() -> dict:
+    """ Should return parser_pool settings from json.values """
+    with open('values.json', 'r', encoding="utf-8") as file:
+        data = json.load(file)
+    return data.get('parser_pool', {})
+
+
+def get_image_store_value() -> dict:
+    """ Should return image_store settings from json.values """
+    with open('values.json', 'r', encoding="utf-8") as file:
+        data = json.load(file)
+    return data.get('image_store', {})
@@ -9,6 +9,7 @@ work item payload.
 The task function:
 - Retrieves the search phrase, categories, and time frame from the work item payload.
 - Calls the `main` function with these parameters to execute the news extraction process.
+- Optionally creates output work items with the articles in chunks, for downstream robots.
 
 Dependencies:
 - `robocorp.tasks`: For defining the task and interacting with Robocorp's task framework.
@@ -40,6 +41,12 @@ def extract_news_from_website():
     - `phrase` (str): The search phrase to filter the news articles.
     - `categories` (str): The category to filter the news articles.
     - `month` (int): The time frame in months to consider for the news articles.
+    - `orchestrator` (str, optional): "async" to run the extraction stages concurrently.
+    - `engine` (str, optional): "http" to scrape without a browser when the pages allow it.
+    - `replay_run` (str, optional): Identifier of an archived run to re-extract without a browser.
+    - `output_mode` (str, optional): "chunks" to also create one output work item per chunk of
+      articles, with their picture files (see `OutputChunkRepository`). The orchestrator then
+      defaults to "async", so the chunks are created while the pages are scraped.
 
     Returns:
         None: This function does not return any value. It triggers the news extraction process 
@@ -49,5 +56,21 @@ def extract_news_from_website():
     phrase = item.payload.get("phrase")
     categorys = item.payload.get("categories")
     month = item.payload.get("month")
-    main(phrase, categorys, month)
+    chunks = item.payload.get("output_mode") == "chunks"
+    orchestrator = item.payload.get("orchestrator", "async" if chunks else None)
+    engine = item.payload.get("engine")
+    replay_run = item.payload.get("replay_run")
+    emit_chunk = create_output_item if chunks else None
+    main(phrase, categorys, month, orchestrator, engine, replay_run, emit_chunk)
+
+
+def create_output_item(payload: dict, files: list[str]) -> None:
+    """
+    Creates an output work item with a chunk of articles and their picture files.
+
+    Args:
+        payload (dict): The chunk payload.
+        files (list[str]): Paths of the picture files attached to the work item.
+    """
+    workitems.outputs.create(payload, files=files)
     
\ No newline at end of file
@@ -0,0 +1,5 @@
+""" Makes the modules of `src/` importable as the robot does, which runs from that directory """
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
@@ -0,0 +1,64 @@
+""" Tests of the columnar batch of articles """
+from datetime import datetime
+
+from entities.article_batch_entity import ArticleBatch
+from entities.article_entity import Article
+
+ROWS = [
+    {"title": "Rates rise", "date": datetime(2024, 5, 10, 12, 30, 15, 250000),
+     "description": "Up by $5", "image_filename": "rates.jpg", "search_count": 2,
+     "contains_money": True},
+    {"title": "Markets calm", "date": datetime(2024, 5, 9, 8), "description": "Quiet day",
+     "image_filename": None, "search_count": 0, "contains_money": False,
+     "url": "https://example.com/markets", "body": "Text", "author": "A. Writer",
+     "published_at": datetime(2024, 5, 9, 7), "updated_at": None},
+]
+
+
+def test_rows_and_details_round_trip():
+    batch = ArticleBatch.from_rows(ROWS)
+
+    assert len(batch) == 2
+    assert list(batch.rows()) == [
+        ("Rates rise", datetime(2024, 5, 10, 12, 30, 15, 250000), "Up by $5", "rates.jpg", 2,
+         True),
+        ("Markets calm", datetime(2024, 5, 9, 8), "Quiet day", None, 0, False)]
+    assert list(batch.details()) == [
+        (None, None, None, None, None),
+        ("https://example.com/markets", "Text", "A. Writer", datetime(2024, 5, 9, 7), None)]
+    assert batch.has_details()
+
+
+def test_articles_round_trip():
+    batch = ArticleBatch.from_rows(ROWS)
+
+    articles = list(batch)
+
+    assert articles[1] == Article(
+        "Markets calm", datetime(2024, 5, 9, 8), "Quiet day", None, 0, False,
+        "https://example.com/markets", "Text", "A. Writer", datetime(2024, 5, 9, 7), None)
+    assert batch[0] == articles[0]
+    assert list(ArticleBatch.from_articles(articles)) == articles
+
+
+def test_dates_keep_milliseconds_only():
+    batch = ArticleBatch.from_rows([dict(ROWS[0], date=datetime(2024, 5, 10, 12, 0, 0, 123456))])
+
+    assert batch[0].date == datetime(2024, 5, 10, 12, 0, 0, 123000)
+
+
+def test_extend_and_keys():
+    batch = ArticleBatch.from_rows(ROWS[:1])
+    batch.extend(ArticleBatch.from_rows(ROWS[1:]))
+
+    assert [article.title for article in batch] == ["Rates rise", "Markets calm"]
+    assert list(batch.keys()) == [
+        f"{int(ROWS[0]['date'].timestamp() * 1000)}:Rates rise",
+        f"{int(ROWS[1]['date'].timestamp() * 1000)}:Markets calm"]
+
+
+def test_batch_without_details():
+    batch = ArticleBatch.from_rows(ROWS[:1])
+
+    assert not batch.has_details()
+    assert batch[0].url is None and batch[0].published_at is None
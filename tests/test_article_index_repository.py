@@ -0,0 +1,89 @@
+""" Tests of the local full-text index of the articles """
+from datetime import datetime, timedelta
+
+import pytest
+
+from entities.article_batch_entity import ArticleBatch
+from frameworks_drivers.repositories.article_index_repository import (
+    ArticleIndexRepository,
+    to_fts_phrase,
+)
+
+
+@pytest.fixture(name="article_index")
+def fixture_article_index(tmp_path):
+    article_index = ArticleIndexRepository(str(tmp_path / "index" / "articles.sqlite"))
+    yield article_index
+    article_index.close()
+
+
+def make_batch(*articles) -> ArticleBatch:
+    batch = ArticleBatch()
+    for title, date in articles:
+        batch.append(title, date, f"About {title}", f"{title}.jpg", 1, False)
+    return batch
+
+
+def test_to_fts_phrase_quotes_the_words_as_one_phrase():
+    assert to_fts_phrase("  interest   rates ") == '"interest rates"'
+
+
+def test_to_fts_phrase_escapes_double_quotes():
+    assert to_fts_phrase('the "fed"') == '"the ""fed"""'
+
+
+def test_search_matches_the_phrase_words_consecutively(article_index):
+    now = datetime(2024, 5, 10, 12)
+    article_index.add_articles(make_batch(
+        ("Interest rates rise", now), ("Rates of interest", now - timedelta(days=1))))
+
+    titles = [row["title"] for row in article_index.search("interest rates")]
+
+    assert titles == ["Interest rates rise"]
+
+
+def test_search_applies_since_and_until(article_index):
+    now = datetime(2024, 5, 10, 12)
+    article_index.add_articles(make_batch(
+        ("Economy today", now),
+        ("Economy last week", now - timedelta(days=7)),
+        ("Economy last month", now - timedelta(days=31))))
+
+    rows = article_index.search(
+        "economy", since=now - timedelta(days=8), until=now - timedelta(days=1))
+
+    assert [row["title"] for row in rows] == ["Economy last week"]
+
+
+def test_add_articles_counts_only_new_articles(article_index):
+    now = datetime(2024, 5, 10, 12)
+    assert article_index.add_articles(make_batch(("One", now), ("Two", now))) == 2
+    assert article_index.add_articles(make_batch(("Two", now), ("Three", now))) == 1
+
+
+def test_coverage_is_replaced_by_the_latest_run(article_index):
+    now = datetime.now().replace(microsecond=0)
+    article_index.add_articles(
+        make_batch(("Old result", now), ("Kept result", now)), "economy", "", 1)
+    article_index.add_articles(
+        make_batch(("Kept result", now), ("New result", now)), " Economy ", "", 1)
+
+    covered = article_index.get_covered_articles(
+        "economy", "", 1, max_age=60, since=now - timedelta(days=1))
+
+    assert sorted(covered.titles) == ["Kept result", "New result"]
+
+
+def test_covered_articles_exclude_stale_coverage_and_older_articles(article_index):
+    now = datetime.now().replace(microsecond=0)
+    article_index.add_articles(
+        make_batch(("Recent", now), ("Older", now - timedelta(days=40))), "economy", "", 2)
+
+    covered = article_index.get_covered_articles(
+        "economy", "", 2, max_age=60, since=now - timedelta(days=30))
+
+    assert list(covered.titles) == ["Recent"]
+    assert article_index.get_covered_articles(
+        "economy", "", 2, max_age=-1, since=now - timedelta(days=30)) is None
+    assert article_index.get_covered_articles(
+        "economy", "", 1, max_age=60, since=now - timedelta(days=30)) is None
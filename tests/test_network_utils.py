@@ -0,0 +1,81 @@
+""" Tests of the summaries of the DevTools network events """
+from utils.network_utils import aggregate_network_stats, summarize_network_events
+
+
+def request_sent(request_id: str, url: str, resource_type: str) -> dict:
+    return {"method": "Network.requestWillBeSent",
+            "params": {"requestId": request_id, "request": {"url": url}, "type": resource_type}}
+
+
+def loading_finished(request_id: str, transferred: int) -> dict:
+    return {"method": "Network.loadingFinished",
+            "params": {"requestId": request_id, "encodedDataLength": transferred}}
+
+
+def test_counts_requests_bytes_cache_and_blocked_requests():
+    events = [
+        request_sent("1", "https://apnews.com/search?q=x", "Document"),
+        loading_finished("1", 1000),
+        request_sent("2", "https://images.apnews.com/a.jpg", "Image"),
+        {"method": "Network.requestServedFromCache", "params": {"requestId": "2"}},
+        loading_finished("2", 0),
+        request_sent("3", "https://images.apnews.com/b.jpg", "Image"),
+        {"method": "Network.responseReceived",
+         "params": {"requestId": "3", "response": {"fromDiskCache": True}}},
+        loading_finished("3", 50),
+        request_sent("4", "https://ads.example.com/font.woff", "Font"),
+        {"method": "Network.loadingFailed",
+         "params": {"requestId": "4", "blockedReason": "inspector"}},
+    ]
+
+    summary = summarize_network_events(events)
+
+    assert summary["requests"] == 4
+    assert summary["bytes_transferred"] == 1050
+    assert summary["cached_requests"] == 2
+    assert summary["blocked_requests"] == 1
+    assert summary["blocked_by_type"] == {"Font": 1}
+    assert summary["by_domain"] == {
+        "apnews.com": {"requests": 1, "bytes": 1000},
+        "images.apnews.com": {"requests": 2, "bytes": 50},
+        "ads.example.com": {"requests": 1, "bytes": 0}}
+    assert summary["by_type"]["Image"] == {"requests": 2, "bytes": 50}
+
+
+def test_requests_finishing_in_a_later_summary_keep_their_domain():
+    open_requests = {}
+
+    first = summarize_network_events(
+        [request_sent("1", "data:image/png;base64,AAAA", "Image")], open_requests)
+    second = summarize_network_events([loading_finished("1", 300)], open_requests)
+
+    assert first["by_domain"] == {"data": {"requests": 1, "bytes": 0}}
+    assert second["requests"] == 0
+    assert second["by_domain"] == {"data": {"requests": 0, "bytes": 300}}
+    assert not open_requests
+
+
+def test_unknown_requests_are_attributed_to_an_unknown_domain():
+    summary = summarize_network_events([loading_finished("9", 10)])
+
+    assert summary["by_domain"] == {"unknown": {"requests": 0, "bytes": 10}}
+    assert summary["by_type"] == {"Other": {"requests": 0, "bytes": 10}}
+
+
+def test_aggregate_adds_up_pages_sorted_by_bytes():
+    pages = [
+        summarize_network_events([request_sent("1", "https://a.com/", "Document"),
+                                  loading_finished("1", 10)]),
+        summarize_network_events([request_sent("2", "https://b.com/", "Script"),
+                                  loading_finished("2", 90),
+                                  request_sent("3", "https://a.com/x", "Script"),
+                                  loading_finished("3", 5)]),
+    ]
+
+    totals = aggregate_network_stats(pages)
+
+    assert totals["pages"] == 2
+    assert totals["requests"] == 3
+    assert totals["bytes_transferred"] == 105
+    assert list(totals["by_domain"]) == ["b.com", "a.com"]
+    assert totals["by_domain"]["a.com"] == {"requests": 2, "bytes": 15}
@@ -0,0 +1,60 @@
+""" Tests of the questions answered from the local index """
+from datetime import datetime, timedelta
+
+import pytest
+
+from entities.article_batch_entity import ArticleBatch
+from frameworks_drivers.repositories.article_index_repository import ArticleIndexRepository
+from query_index import query
+import utils.date_utils
+
+
+@pytest.fixture(name="article_index")
+def fixture_article_index(tmp_path):
+    start_of_month = utils.date_utils.return_start_of_month(datetime.now())
+    batch = ArticleBatch()
+    batch.append("Economy this month", start_of_month, "The economy grows", None, 1, True)
+    batch.append("Economy last month", start_of_month - timedelta(seconds=1),
+                 "The economy slows", None, 1, False)
+    article_index = ArticleIndexRepository(str(tmp_path / "articles.sqlite"))
+    article_index.add_articles(batch)
+    yield article_index
+    article_index.close()
+
+
+def test_start_of_month_counting_back_from_the_end_of_a_month():
+    date = utils.date_utils.return_current_month_plus_next_months(
+        1, datetime(2024, 3, 31, 18, 30))
+
+    assert date == datetime(2024, 2, 29, 18, 30)
+    assert utils.date_utils.return_start_of_month(date) == datetime(2024, 2, 1)
+
+
+def test_one_month_starts_at_the_first_day_of_the_current_month(article_index):
+    answer = query(article_index, "economy", months=1)
+
+    assert answer["since"] == utils.date_utils.return_start_of_month(
+        datetime.now()).isoformat()
+    assert answer["articles"] == 1
+    assert answer["occurrences"] == 2
+
+
+def test_two_months_include_the_previous_month(article_index):
+    answer = query(article_index, "economy", months=2, limit=5)
+
+    assert answer["articles"] == 2
+    assert [row["title"] for row in answer["results"]] == [
+        "Economy this month", "Economy last month"]
+
+
+def test_since_overrides_months(article_index):
+    since = utils.date_utils.return_start_of_month(datetime.now()) - timedelta(days=1)
+
+    answer = query(article_index, "economy", months=1, since=since)
+
+    assert answer["since"] == since.isoformat()
+    assert answer["articles"] == 2
+
+
+def test_money_filter(article_index):
+    assert query(article_index, "economy", months=2, contains_money=False)["articles"] == 1
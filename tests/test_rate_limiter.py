@@ -0,0 +1,71 @@
+""" Tests of the host-wide navigation rate limiter """
+import json
+
+import pytest
+
+from frameworks_drivers.drivers.rate_limiter import SharedRateLimiter
+
+
+@pytest.fixture(name="rate_limiter")
+def fixture_rate_limiter(tmp_path):
+    return SharedRateLimiter(
+        str(tmp_path / "rate_limiter.json"), initial_rate=1.0, min_rate=0.2, max_rate=1.25,
+        burst=2.0, target_latency=5.0, increase=0.1, decrease=0.5)
+
+
+def read_state(rate_limiter: SharedRateLimiter) -> dict:
+    with open(rate_limiter.state_file, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def test_fast_responses_increase_the_rate_up_to_the_maximum(rate_limiter):
+    rate_limiter.record(0.5)
+    assert read_state(rate_limiter)["rate"] == pytest.approx(1.1)
+
+    for _ in range(5):
+        rate_limiter.record(0.5)
+    assert read_state(rate_limiter)["rate"] == pytest.approx(1.25)
+
+
+def test_failures_cut_the_rate_once_per_target_latency(rate_limiter):
+    rate_limiter.record(0.5, failed=True)
+    assert read_state(rate_limiter)["rate"] == pytest.approx(0.5)
+
+    rate_limiter.record(0.5, failed=True)
+    assert read_state(rate_limiter)["rate"] == pytest.approx(0.5)
+
+
+def test_rate_is_never_cut_below_the_minimum(rate_limiter):
+    for _ in range(4):
+        rate_limiter.record(0.5, failed=True)
+        state = read_state(rate_limiter)
+        state["decreased_at"] = 0.0
+        with open(rate_limiter.state_file, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+
+    assert read_state(rate_limiter)["rate"] == pytest.approx(0.2)
+
+
+def test_slow_average_latency_cuts_the_rate(rate_limiter):
+    rate_limiter.record(20.0)
+
+    state = read_state(rate_limiter)
+    assert state["latency"] == pytest.approx(6.0)
+    assert state["rate"] == pytest.approx(0.5)
+
+
+def test_acquire_takes_tokens_from_the_bucket(rate_limiter):
+    rate_limiter.acquire()
+    rate_limiter.acquire()
+
+    assert read_state(rate_limiter)["tokens"] < 0.1
+
+
+def test_from_settings(tmp_path):
+    assert SharedRateLimiter.from_settings({"enabled": False}, str(tmp_path)) is None
+
+    rate_limiter = SharedRateLimiter.from_settings(
+        {"enabled": True, "max_rate": 3.0}, str(tmp_path))
+
+    assert rate_limiter.state_file == str(tmp_path / ".rate_limiter.json")
+    assert rate_limiter.max_rate == 3.0